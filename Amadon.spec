@@ -11,7 +11,7 @@ a = Analysis(
     hooksconfig={},
     runtime_hooks=[],
     # Exclui diretório de scripts auxiliares de desenvolvimento
-    excludes=['tools', 'unit_tests'],
+    excludes=['tools', 'unit_tests', 'benchmarks'],
     noarchive=False,
     optimize=0,
 )
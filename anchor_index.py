@@ -0,0 +1,207 @@
+"""Índice global de âncoras dos documentos (`pAAA_BBB_CCC` → arquivo).
+
+Para cada id de âncora guarda o arquivo dono, o offset em bytes da tag no HTML
+final (o mesmo texto que `document_resolver.load_document_html` devolve: o
+próprio .html ou o Markdown convertido) e o nível de título (1..6 para
+`<h1>`..`<h6>`, 0 para demais tags).
+
+O índice é persistido em `.anchor_index.json` dentro da pasta de documentos,
+em forma compacta (uma lista plana `[id, offset, nível, ...]` por arquivo,
+junto de mtime, tamanho e SHA-1). `update()` reprocessa apenas arquivos cujo
+conteúdo mudou e remove os que sumiram; com muitos arquivos pendentes a
+varredura usa um pool de processos.
+
+Uso:
+    from anchor_index import AnchorIndex
+    index = AnchorIndex.load(Path('assets/docs'))
+    index.update()
+    index.save()
+    index.lookup('p003_001_002')   # -> ('Doc003.html', 1234, 0) ou None
+    index.duplicates               # ids presentes em mais de um lugar
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:  # optional dependency
+    import markdown2  # type: ignore
+except Exception:  # pragma: no cover
+    markdown2 = None  # type: ignore
+
+INDEX_NAME = '.anchor_index.json'
+INDEX_VERSION = 1
+
+# Mesmas extras usadas na conversão de Markdown do leitor
+MARKDOWN_EXTRAS = ["fenced-code-blocks", "tables", "strike", "footnotes"]
+
+# Abaixo disso o custo de subir processos supera o ganho
+PARALLEL_MIN_FILES = 16
+
+# Atributo id dentro de uma tag real (texto escapado, ex.: <pre><code>, não conta)
+ANCHOR_TAG_RE = re.compile(
+    rb'<(?P<tag>[A-Za-z][A-Za-z0-9]*)\b[^<>]*?\bid=["\'](?P<id>p\d{3}_\d{3}_\d{3}(?:_[0-9A-Za-z]+)?)["\']'
+)
+HEADING_TAGS = {f'h{n}'.encode(): n for n in range(1, 7)}
+
+AnchorEntry = tuple[str, int, int]  # (arquivo, offset, nível)
+
+
+def render_bytes(path: Path) -> bytes:
+    """HTML final de um documento em UTF-8 (Markdown convertido com markdown2)."""
+    raw = path.read_bytes()
+    if path.suffix.lower() == '.md' and markdown2:
+        return markdown2.markdown(raw.decode('utf-8', errors='ignore'), extras=MARKDOWN_EXTRAS).encode('utf-8')  # type: ignore
+    return raw
+
+
+def scan_document(path: str) -> tuple[str, str, list]:
+    """Lê um documento e retorna (caminho, sha1, lista plana [id, offset, nível, ...]).
+
+    Função de módulo (serializável) para rodar nos processos do pool.
+    """
+    p = Path(path)
+    digest = hashlib.sha1(p.read_bytes()).hexdigest()
+    flat: list = []
+    for m in ANCHOR_TAG_RE.finditer(render_bytes(p)):
+        flat += [m.group('id').decode('ascii'), m.start(), HEADING_TAGS.get(m.group('tag').lower(), 0)]
+    return path, digest, flat
+
+
+def document_files(docs_dir: Path) -> list[Path]:
+    """Documentos da pasta; se houver .html e .md do mesmo nome vale o .html (como no leitor)."""
+    by_stem: dict[str, Path] = {}
+    for path in sorted(docs_dir.glob('Doc*.md')) + sorted(docs_dir.glob('Doc*.html')):
+        by_stem[path.stem] = path
+    return [by_stem[k] for k in sorted(by_stem)]
+
+
+class AnchorIndex:
+    """Tabela âncora → (arquivo, offset, nível) de uma pasta de documentos."""
+
+    def __init__(self, docs_dir: Path):
+        self.docs_dir = Path(docs_dir)
+        self.path = self.docs_dir / INDEX_NAME
+        self._files: dict[str, dict] = {}
+        self.anchors: dict[str, AnchorEntry] = {}
+        self.duplicates: dict[str, list[AnchorEntry]] = {}
+        self._file_sets: dict[str, frozenset[str]] = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, docs_dir: Path) -> 'AnchorIndex':
+        """Carrega o índice persistido (vazio se ausente, corrompido ou de outra versão)."""
+        index = cls(docs_dir)
+        try:
+            data = json.loads(index.path.read_text(encoding='utf-8'))
+            if data.get('version') == INDEX_VERSION:
+                index._files = data.get('files', {})
+        except Exception:
+            index._files = {}
+        index._rebuild()
+        return index
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        tmp = self.path.with_suffix('.tmp')
+        try:
+            tmp.write_text(json.dumps({'version': INDEX_VERSION, 'files': self._files},
+                                      separators=(',', ':')), encoding='utf-8')
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except Exception:  # índice é opcional: pasta somente leitura, etc.
+            pass
+
+    def _unchanged(self, path: Path, st: os.stat_result) -> bool:
+        """mtime e tamanho iguais bastam; com mesmo tamanho e mtime diferente
+        (checkout, cópia) confere o SHA-1 antes de invalidar."""
+        entry = self._files.get(path.name)
+        if not entry or entry.get('size') != st.st_size:
+            return False
+        if entry.get('mtime_ns') == st.st_mtime_ns:
+            return True
+        try:
+            digest = hashlib.sha1(path.read_bytes()).hexdigest()
+        except OSError:
+            return False
+        if digest != entry.get('sha1'):
+            return False
+        entry['mtime_ns'] = st.st_mtime_ns
+        self.dirty = True
+        return True
+
+    def update(self, files: list[Path] | None = None, jobs: int | None = None) -> dict[str, int]:
+        """Atualiza o índice reprocessando apenas arquivos alterados.
+
+        `files` default: todos os documentos da pasta (arquivos que deixaram de
+        existir saem do índice). Retorna {'files', 'cached', 'scanned', 'removed'}.
+        """
+        full = files is None
+        if files is None:
+            files = document_files(self.docs_dir)
+        stats_by_path: dict[str, os.stat_result] = {}
+        pending: list[str] = []
+        for path in files:
+            st = path.stat()
+            if not self._unchanged(path, st):
+                stats_by_path[str(path)] = st
+                pending.append(str(path))
+        removed = 0
+        if full:
+            names = {p.name for p in files}
+            for name in [n for n in self._files if n not in names]:
+                del self._files[name]
+                removed += 1
+        if jobs is None:
+            jobs = os.cpu_count() or 1
+        if jobs > 1 and len(pending) >= PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                scanned = list(pool.map(scan_document, pending, chunksize=max(1, len(pending) // (jobs * 4))))
+        else:
+            scanned = [scan_document(p) for p in pending]
+        for name, digest, flat in scanned:
+            st = stats_by_path[name]
+            self._files[Path(name).name] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'sha1': digest, 'anchors': flat}
+        if pending or removed:
+            self.dirty = True
+            self._rebuild()
+        return {'files': len(files), 'cached': len(files) - len(pending), 'scanned': len(pending), 'removed': removed}
+
+    def _rebuild(self) -> None:
+        """Recria os mapas em memória; a primeira ocorrência (ordem de arquivo/offset) é a dona."""
+        anchors: dict[str, AnchorEntry] = {}
+        duplicates: dict[str, list[AnchorEntry]] = {}
+        for name in sorted(self._files):
+            flat = self._files[name].get('anchors', [])
+            for i in range(0, len(flat) - 2, 3):
+                anchor, entry = flat[i], (name, flat[i + 1], flat[i + 2])
+                first = anchors.get(anchor)
+                if first is None:
+                    anchors[anchor] = entry
+                else:
+                    duplicates.setdefault(anchor, [first]).append(entry)
+        self.anchors = anchors
+        self.duplicates = duplicates
+        self._file_sets = {}
+
+    def lookup(self, anchor: str) -> AnchorEntry | None:
+        return self.anchors.get(anchor)
+
+    def file_anchors(self, name: str) -> frozenset[str]:
+        """Ids presentes no arquivo indicado (ex.: 'Doc003.html'), montados uma vez por versão do índice."""
+        anchors = self._file_sets.get(name)
+        if anchors is None:
+            flat = self._files.get(name, {}).get('anchors', [])
+            anchors = self._file_sets[name] = frozenset(flat[0::3])
+        return anchors
+
+    def __contains__(self, anchor: str) -> bool:
+        return anchor in self.anchors
+
+    def __len__(self) -> int:
+        return len(self.anchors)
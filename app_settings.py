@@ -23,9 +23,11 @@ class AppSettings:
     splitter_sizes: list | None = None
     font_family: str = "Segoe UI"  # nova configuração de fonte preferida para leitura
     web_zoom_factor: float = 1.0  # fator de zoom (tamanho de fonte) para visores WebEngine
-    translation_slot1: int = -1  # índice da primeira tradução selecionada
-    translation_slot2: int = -1  # índice da segunda tradução selecionada
-    translation_slot3: int = -1  # índice da terceira tradução selecionada
+    doc_windowed_rendering: bool = True  # renderiza só a seção da âncora e carrega as demais ao rolar
+    translation_slot1: int = -1  # LanguageID da primeira tradução selecionada
+    translation_slot2: int = -1  # LanguageID da segunda tradução selecionada
+    translation_slot3: int = -1  # LanguageID da terceira tradução selecionada
+    translation_slots_by_id: bool = False  # slots já migrados de posição na lista para LanguageID
     # Configurações de buscas
     search_max_items: int = 200  # máximo de itens retornados/exibidos (10-300)
     search_semantic_enabled: bool = False  # busca semântica experimental
@@ -33,6 +35,10 @@ class AppSettings:
     translation_edit_enabled: bool = False  # habilita painel de edição
     translation_edit_target: int = -1       # índice/ID da tradução alvo para edição (-1 = nenhuma)
     translation_edit_repo_base: str = ""   # URL base do repositório de edição
+    translation_keep_versions: bool = False  # guarda cada versão baixada em doc_sources/.store (deduplicado)
+    # Diagnóstico
+    perf_events_enabled: bool = True  # grava eventos de desempenho em logs/amadon_perf.jsonl
+    perf_metrics_enabled: bool = False  # histogramas em memória (aba Diagnóstico)
 
     def toggle_dark_mode(self):  # pragma: no cover (UI toggle futuro)
         self.dark_mode = not self.dark_mode
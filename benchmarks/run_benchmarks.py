@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+"""Suíte de benchmarks (standalone) para resolução, renderização e extração.
+
+Mede, sobre o corpus sintético do livro completo (197 documentos, ver
+`synthetic.py`):
+- parse_logical_link, load_document_html (HTML e Markdown), build_final_body,
+  resolve_doc_link
+- ShowTranslation.extract_text / extract_archive (gzip simples e tar.gz)
+- montagem de árvore a partir de documentos_tree.json e content/TocTable.html
+
+Roda sem janela (Qt offscreen). Os resultados são comparados com
+`benchmarks/baseline.json`; a saída é != 0 se algum benchmark ficar mais lento
+que baseline * (1 + tolerância).
+
+Uso:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --only doc. --repeat 9
+    python benchmarks/run_benchmarks.py --save-baseline
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+BENCH_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(BENCH_DIR))
+
+import synthetic  # noqa: E402
+
+BASELINE_FILE = BENCH_DIR / 'baseline.json'
+
+
+def measure(fn: Callable[[], object], repeat: int, min_time: float) -> dict[str, float]:
+    """Calibra o número de chamadas por amostra (>= min_time) e mede `repeat` amostras.
+
+    Retorna tempos por chamada em ms (mediana e mínimo).
+    """
+    fn()  # aquecimento
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) * 1000.0 / number)
+    return {'median_ms': statistics.median(samples), 'min_ms': min(samples), 'number': number}
+
+
+class Fixtures:
+    """Gera no diretório temporário o corpus sintético completo (`synthetic.write_corpus`)."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.summary = synthetic.write_corpus(root, doc_format='mixed',
+                                              translations=[(1, 'pt', 'gzip'), (2, 'en', 'tar')])
+        self.docs = root / 'docs'
+        self.sources = root / 'doc_sources'
+        self.tree_json = root / 'data' / 'documentos_tree.json'
+        self.toc_html = root / 'content' / 'TocTable.html'
+
+
+def build_benchmarks(fx: Fixtures) -> dict[str, Callable[[], object]]:
+    import document_resolver as dr
+    from busca.concordance import iter_concordance
+    from busca.engine import SearchEngine
+    from busca.parallel import ParallelSearch, Translation, align
+    from busca.paragraphs import load_paragraphs
+    from busca.positional_index import PositionalIndex
+    from busca.semantic import SemanticIndex
+    from busca.similar import SimilarIndex
+    from show_translations import ShowTranslation
+    from toc_table import parse_toc_table
+
+    dr.CONTENT_ROOT = fx.docs
+    html_100 = dr.load_document_html('Doc100.html') or ''
+    st = ShowTranslation(base_dir=fx.root)
+    toc_html = fx.toc_html.read_text(encoding='utf-8-sig')
+    toc_nodes = parse_toc_table(toc_html)
+    tree_json = fx.tree_json
+    paragraphs = load_paragraphs(fx.docs)
+    search_index = PositionalIndex.build(paragraphs)
+    semantic_index = SemanticIndex.build(paragraphs)  # construção única (segundos); só consultas são medidas
+    semantic_queries = [text[:80] for _, text in paragraphs[::1000]]
+    search_engine = SearchEngine(fx.docs)
+    search_engine.ensure_index()
+    parallel = ParallelSearch(search_engine, [Translation(f'TR{n:03d}', SearchEngine(st.extract_archive(n)))
+                                              for n in (1, 2)])
+    parallel.ensure_indexes()
+    parallel_pids = [pid for pid, _ in search_index.search('ajustador', limit=200)]
+    keystrokes = [word[:n] for word in ('ajustador', 'paraíso', 'universo', 'trindade') for n in range(2, len(word) + 1)]
+    similar_dir = fx.root / 'similar'
+    similar_dir.mkdir(exist_ok=True)
+    SimilarIndex.build(paragraphs).save(similar_dir)
+    similar_index = SimilarIndex.load(similar_dir)  # assinaturas em memmap, como no aplicativo
+    similar_pids = [pid for pid, _ in paragraphs[::500]]
+    highlight = search_engine.hit_spans('ajustador OR "ajustador do pensamento" OR paraíso')
+
+    from PySide6.QtWidgets import QApplication, QTreeWidget
+    from tbar_functions.tbar_documentos import populate_tree
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+
+    def tree_from_json():
+        tree = QTreeWidget()
+        populate_tree(tree, json.loads(tree_json.read_text(encoding='utf-8')).get('nodes', []))
+        tree.deleteLater()
+
+    def tree_from_toc():
+        tree = QTreeWidget()
+        populate_tree(tree, toc_nodes)
+        tree.deleteLater()
+
+    return {
+        'doc.parse_logical_link': lambda: dr.parse_logical_link('doc://Doc100.html#p100_002_002'),
+        'doc.load_html': lambda: dr.load_document_html('Doc100.html'),
+        'doc.load_markdown': lambda: dr.load_document_html('Doc104.html'),
+        'doc.build_final_body': lambda: dr.build_final_body(html_100, 'p100_002_002'),
+        'doc.resolve': lambda: dr.resolve_doc_link('doc://Doc101.html#p101_003_001'),
+        'doc.resolve.windowed': lambda: dr.resolve_doc_link('doc://Doc000.html#p000_006_002', windowed=True),
+        'doc.resolve.highlight': lambda: dr.resolve_doc_link('doc://Doc101.html#p101_003_001', highlight=highlight),
+        'translation.extract_text': lambda: st.extract_text(1),
+        'translation.extract_archive.gzip': lambda: st.extract_archive(1, overwrite=True),
+        'translation.extract_archive.tar': lambda: st.extract_archive(2, overwrite=True),
+        'translation.extract_archive.unchanged': lambda: st.extract_archive(2),
+        'search.index.build': lambda: PositionalIndex.build(paragraphs),
+        'search.term': lambda: search_index.search('ajustador', limit=200),
+        'search.phrase': lambda: search_index.search('"ajustador pensamento"', limit=200),
+        'search.near': lambda: search_index.search('trindade NEAR/3 paraíso', limit=200),
+        'search.boolean': lambda: search_index.search('(luz OR vida) AND NOT morte', limit=200),
+        'search.concordance': lambda: list(iter_concordance(search_engine, 'deus', jobs=1)),
+        'search.parallel.align': lambda: align(parallel.others, parallel_pids),
+        'search.suggest': lambda: [search_engine.suggest(prefix) for prefix in keystrokes],
+        'search.semantic.query': lambda: semantic_index.search('ajustador pensamento mente', limit=200),
+        'search.semantic.batch': lambda: semantic_index.search_many(semantic_queries, limit=200),
+        'search.similar.build': lambda: SimilarIndex.build(paragraphs),
+        'search.similar.query': lambda: [similar_index.similar(pid) for pid in similar_pids],
+        'tree.documentos_json': tree_from_json,
+        'tree.toc_table.parse': lambda: parse_toc_table(toc_html),
+        'tree.toc_table.populate': tree_from_toc,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks de documentos, renderização e extração (headless).')
+    parser.add_argument('--only', default=None, help='Roda apenas benchmarks cujo nome começa com este prefixo.')
+    parser.add_argument('--repeat', type=int, default=5, help='Amostras por benchmark (default 5).')
+    parser.add_argument('--min-time', type=float, default=0.05, help='Duração mínima de cada amostra em segundos.')
+    parser.add_argument('--tolerance', type=float, default=0.5, help='Regressão se mediana > baseline * (1 + tolerância).')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_FILE, help='Arquivo de baseline JSON.')
+    parser.add_argument('--save-baseline', action='store_true', help='Grava os resultados como nova baseline.')
+    parser.add_argument('--output', type=Path, default=None, help='Grava os resultados desta execução em JSON.')
+    args = parser.parse_args()
+
+    # Eventos/métricas de desempenho da aplicação não interessam aqui
+    from perf_events import PerfEvents
+    PerfEvents._enabled = False
+
+    with tempfile.TemporaryDirectory(prefix='amadon_bench_') as tmp:
+        fx = Fixtures(Path(tmp))
+        benches = build_benchmarks(fx)
+        results: dict[str, dict[str, float]] = {}
+        for name, fn in benches.items():
+            if args.only and not name.startswith(args.only):
+                continue
+            results[name] = measure(fn, args.repeat, args.min_time)
+
+    baseline: dict[str, dict[str, float]] = {}
+    if args.baseline.exists() and not args.save_baseline:
+        try:
+            baseline = json.loads(args.baseline.read_text(encoding='utf-8')).get('results', {})
+        except Exception:
+            baseline = {}
+
+    regressions = []
+    print(f"{'benchmark':<36} {'mediana ms':>12} {'mín ms':>12} {'baseline':>12} {'razão':>8}")
+    for name, row in results.items():
+        base = baseline.get(name, {}).get('median_ms')
+        ratio = row['median_ms'] / base if base else None
+        flag = ''
+        if ratio is not None and ratio > 1 + args.tolerance:
+            regressions.append(name)
+            flag = '  REGRESSÃO'
+        base_txt = f"{base:>12.4f}" if base else f"{'-':>12}"
+        ratio_txt = f"{ratio:>8.2f}" if ratio is not None else f"{'-':>8}"
+        print(f"{name:<36} {row['median_ms']:>12.4f} {row['min_ms']:>12.4f} {base_txt} {ratio_txt}{flag}")
+
+    payload = {
+        'meta': {
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+        },
+        'results': results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(payload, indent=2), encoding='utf-8')
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(payload, indent=2) + '\n', encoding='utf-8')
+        print(f"\nBaseline gravada em {args.baseline}")
+        return 0
+    if regressions:
+        print(f"\nFAIL: {len(regressions)} regressão(ões): {', '.join(regressions)}")
+        return 1
+    print("\nPASS")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
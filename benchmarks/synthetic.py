@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+"""Gerador de corpus sintético em escala de produção (livro completo).
+
+Produz, de forma determinística (semente fixa), um acervo com a mesma forma
+do conteúdo real:
+
+- 197 documentos (000..196) com quantidade realista de seções/parágrafos
+  (~14 mil parágrafos no total) e ids `pAAA_BBB_CCC`;
+- documentos em HTML e/ou Markdown (`docs/DocNNN.html|.md`);
+- `data/documentos_tree.json` compatível com a árvore de Documentos;
+- `content/TocTable.html` no mesmo formato do índice real;
+- `doc_sources/TR###.gz` nos dois layouts suportados por `ShowTranslation`
+  (tar.gz com um arquivo por documento, ou gzip simples de arquivo único).
+
+Todas as traduções compartilham a mesma estrutura (mesmos ids), mudando apenas
+o vocabulário; assim parágrafos ficam alinhados entre traduções.
+
+Uso:
+    python benchmarks/synthetic.py --out /tmp/amadon_corpus
+    python benchmarks/synthetic.py --out /tmp/c --format md --translations 0:en,34:pt:gzip
+
+Somente stdlib.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import io
+import json
+import random
+import tarfile
+from html import escape
+from pathlib import Path
+
+PAPERS = 197
+
+# Partes do livro: (título, primeiro documento, último documento)
+PARTS = (
+    ("Introdução", 0, 0),
+    ("Parte I", 1, 31),
+    ("Parte II", 32, 56),
+    ("Parte III", 57, 119),
+    ("Parte IV", 120, 196),
+)
+
+VOCABULARIES: dict[str, tuple[str, ...]] = {
+    'pt': tuple((
+        "deus pai universo paraíso filho espírito ajustador pensamento criador "
+        "trindade absoluto supremo último eterno infinito amor verdade beleza "
+        "bondade mundo sistema constelação nébadon salvington ser pessoal "
+        "personalidade mente energia matéria luz vida morte ascensão mortal alma "
+        "sobrevivência fé religião revelação sabedoria misericórdia justiça "
+        "retidão progresso evolução tempo espaço realidade experiência divindade "
+        "deidade potencial factual presença ministério graça serviço criação "
+        "havona órvonton jesus michael urântia anjos serafins não é são está"
+    ).split()),
+    'en': tuple((
+        "god father universe paradise son spirit adjuster thought creator "
+        "trinity absolute supreme ultimate eternal infinite love truth beauty "
+        "goodness world system constellation nebadon salvington being personal "
+        "personality mind energy matter light life death ascension mortal soul "
+        "survival faith religion revelation wisdom mercy justice righteousness "
+        "progress evolution time space reality experience divinity deity "
+        "potential actual presence ministry grace service creation havona "
+        "orvonton jesus michael urantia angels seraphim the of and is are"
+    ).split()),
+    'es': tuple((
+        "dios padre universo paraíso hijo espíritu ajustador pensamiento creador "
+        "trinidad absoluto supremo último eterno infinito amor verdad belleza "
+        "bondad mundo sistema constelación nebadon salvington ser personal "
+        "personalidad mente energía materia luz vida muerte ascensión mortal alma "
+        "supervivencia fe religión revelación sabiduría misericordia justicia "
+        "rectitud progreso evolución tiempo espacio realidad experiencia "
+        "divinidad deidad potencial fáctico presencia ministerio gracia servicio"
+    ).split()),
+}
+
+
+def book_structure(papers: int = PAPERS, seed: int = 0) -> list[list[int]]:
+    """Estrutura do livro: para cada documento, a quantidade de parágrafos por seção."""
+    rng = random.Random(seed)
+    structure: list[list[int]] = []
+    for paper in range(papers):
+        sections = 12 if paper == 0 else rng.randint(3, 12)
+        structure.append([max(2, min(30, int(rng.gauss(10, 4)))) for _ in range(sections)])
+    return structure
+
+
+def paragraph_text(rng: random.Random, vocab: tuple[str, ...], words: int | None = None) -> str:
+    if words is None:
+        words = max(8, min(300, int(rng.lognormvariate(4.1, 0.5))))
+    out = [rng.choice(vocab) for _ in range(words)]
+    out[0] = out[0].capitalize()
+    return ' '.join(out) + '.'
+
+
+def _paper_blocks(paper: int, sections: list[int], lang: str, seed: int):
+    """Gera (tipo, id, texto) do documento: 'h1', 'h2' ou 'p'."""
+    vocab = VOCABULARIES[lang]
+    rng = random.Random(f"{seed}:{lang}:{paper}")
+    yield 'h1', f"p{paper:03d}_000_000", f"Documento {paper}"
+    for s, count in enumerate(sections, start=1):
+        yield 'h2', f"p{paper:03d}_{s:03d}_000", f"{s}. Seção {s}"
+        for p in range(1, count + 1):
+            yield 'p', f"p{paper:03d}_{s:03d}_{p:03d}", paragraph_text(rng, vocab)
+
+
+def paper_html(paper: int, sections: list[int], lang: str = 'pt', seed: int = 0) -> str:
+    """HTML de um documento: título (h1), seções (h2) e parágrafos com id."""
+    return '\n'.join(
+        f'<{kind} id="{pid}">{escape(text)}</{kind}>'
+        for kind, pid, text in _paper_blocks(paper, sections, lang, seed)
+    )
+
+
+def paper_markdown(paper: int, sections: list[int], lang: str = 'pt', seed: int = 0) -> str:
+    """Mesmo documento em Markdown (ids via HTML inline, como em assets/docs)."""
+    parts = []
+    for kind, pid, text in _paper_blocks(paper, sections, lang, seed):
+        if kind == 'p':
+            parts.append(f'<a id="{pid}"></a>{text}')
+        else:
+            parts.append(f'<{kind} id="{pid}">{escape(text)}</{kind}>')
+    return '\n\n'.join(parts) + '\n'
+
+
+def book_files(structure: list[list[int]], lang: str = 'pt', seed: int = 0) -> dict[str, bytes]:
+    """Arquivos do livro {"DocNNN.html": bytes} para empacotar em TR###.gz."""
+    return {
+        f"Doc{n:03d}.html": paper_html(n, sections, lang, seed).encode('utf-8')
+        for n, sections in enumerate(structure)
+    }
+
+
+def tree_nodes(structure: list[list[int]]) -> list[dict]:
+    """Nós no formato de documentos_tree.json: parte > documento > seção."""
+    nodes = []
+    for title, first, last in PARTS:
+        papers = [n for n in range(first, last + 1) if n < len(structure)]
+        if not papers:
+            continue
+        children = []
+        for n in papers:
+            children.append({
+                "titulo": f"{n} - Documento {n}",
+                "link": f"doc://Doc{n:03d}.html#p{n:03d}_000_000",
+                "filhos": [
+                    {"titulo": f"{s}. Seção {s}", "link": f"doc://Doc{n:03d}.html#p{n:03d}_{s:03d}_000"}
+                    for s in range(1, len(structure[n]) + 1)
+                ],
+            })
+        nodes.append({"titulo": title, "link": f"doc://Doc{papers[0]:03d}.html#p{papers[0]:03d}_000_000", "filhos": children})
+    return nodes
+
+
+def toc_table_html(structure: list[list[int]]) -> str:
+    """Índice no formato de content/TocTable.html (inclusive <li> folha sem fechamento)."""
+    def leaf(n: int, s: int, indent: str) -> str:
+        return (f"{indent}<li id=\"toc_{n:03d}_{s:03d}_div\"><a class=\"liIndex\" "
+                f"href=\"javascript:loadDoc('content/Doc{n:03d}.html','p{n:03d}_{s:03d}_000')\">{s}. Seção {s}</a></span>")
+
+    def paper(n: int, indent: str) -> list[str]:
+        lines = [
+            f"{indent}<li id=\"toc_{n:03d}_000_div\"><span class=\"caret\"><a class=\"liIndex\" "
+            f"href=\"javascript:loadDoc('content/Doc{n:03d}.html','p{n:03d}_000_000')\">{n} - Documento {n}</a></span>",
+            f"{indent}   <ul class=\"nested\">",
+        ]
+        lines += [leaf(n, s, indent + '      ') for s in range(1, len(structure[n]) + 1)]
+        lines += [f"{indent}   </ul>", f"{indent}</li>"]
+        return lines
+
+    lines = ['<div class="treeview">', '   <ul>']
+    for p_idx, (title, first, last) in enumerate(PARTS):
+        papers = [n for n in range(first, last + 1) if n < len(structure)]
+        if not papers:
+            continue
+        if first == last:
+            lines += paper(first, '      ')
+            continue
+        lines.append(f"      <li id=\"part{p_idx}_div\"><span class=\"caret\">{title}</span>")
+        lines.append("         <ul class=\"nested\">")
+        for n in papers:
+            lines += paper(n, '         ')
+        lines += ["         </ul>", "      </li>"]
+    lines += ['   </ul>', '</div>', '']
+    return '\n'.join(lines)
+
+
+def write_archive(path: Path, files: dict[str, bytes], layout: str = 'tar') -> Path:
+    """Grava TR###.gz no layout 'tar' (tar.gz multi-arquivo) ou 'gzip' (arquivo único)."""
+    if layout == 'tar':
+        with tarfile.open(path, mode='w:gz') as tf:
+            for name, data in files.items():
+                info = tarfile.TarInfo(name=name)
+                info.size = len(data)
+                tf.addfile(info, io.BytesIO(data))
+    elif layout == 'gzip':
+        with gzip.open(path, 'wb') as gz:
+            for data in files.values():
+                gz.write(data)
+                gz.write(b'\n')
+    else:
+        raise ValueError(f"Layout inválido: {layout}")
+    return path
+
+
+def parse_translations(spec: str) -> list[tuple[int, str, str]]:
+    """Converte '0:en,34:pt:gzip' em [(0, 'en', 'tar'), (34, 'pt', 'gzip')]."""
+    out = []
+    for item in filter(None, (x.strip() for x in spec.split(','))):
+        parts = item.split(':')
+        number = int(parts[0])
+        lang = next((p for p in parts[1:] if p in VOCABULARIES), 'pt')
+        layout = 'gzip' if 'gzip' in parts[1:] else 'tar'
+        out.append((number, lang, layout))
+    return out
+
+
+def write_corpus(out: Path, papers: int = PAPERS, doc_format: str = 'mixed',
+                 translations: list[tuple[int, str, str]] | None = None,
+                 lang: str = 'pt', seed: int = 0) -> dict:
+    """Gera o corpus completo em `out` e retorna um resumo (contagens e caminhos).
+
+    doc_format: 'html', 'md' ou 'mixed' (1 a cada 5 documentos em Markdown).
+    """
+    if translations is None:
+        translations = [(0, 'en', 'tar'), (34, 'pt', 'gzip')]
+    structure = book_structure(papers, seed)
+    docs_dir = out / 'docs'
+    data_dir = out / 'data'
+    content_dir = out / 'content'
+    sources_dir = out / 'doc_sources'
+    for d in (docs_dir, data_dir, content_dir, sources_dir):
+        d.mkdir(parents=True, exist_ok=True)
+    for n, sections in enumerate(structure):
+        as_md = doc_format == 'md' or (doc_format == 'mixed' and n % 5 == 4)
+        if as_md:
+            (docs_dir / f"Doc{n:03d}.md").write_text(paper_markdown(n, sections, lang, seed), encoding='utf-8')
+        else:
+            (docs_dir / f"Doc{n:03d}.html").write_text(paper_html(n, sections, lang, seed), encoding='utf-8')
+    tree_path = data_dir / 'documentos_tree.json'
+    tree_path.write_text(json.dumps({"nodes": tree_nodes(structure)}, ensure_ascii=False, indent=1), encoding='utf-8')
+    toc_path = content_dir / 'TocTable.html'
+    toc_path.write_text(toc_table_html(structure), encoding='utf-8')
+    archives = {}
+    for number, t_lang, layout in translations:
+        path = write_archive(sources_dir / f"TR{number:03d}.gz", book_files(structure, t_lang, seed), layout)
+        archives[number] = str(path)
+    return {
+        'papers': len(structure),
+        'sections': sum(len(s) for s in structure),
+        'paragraphs': sum(sum(s) for s in structure),
+        'docs_dir': str(docs_dir),
+        'tree': str(tree_path),
+        'toc': str(toc_path),
+        'archives': archives,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Gera corpus sintético do livro completo para testes de carga (offline).')
+    parser.add_argument('--out', type=Path, required=True, help='Diretório de saída.')
+    parser.add_argument('--papers', type=int, default=PAPERS, help='Quantidade de documentos (default 197).')
+    parser.add_argument('--format', choices=('html', 'md', 'mixed'), default='mixed', help='Formato dos documentos em docs/.')
+    parser.add_argument('--lang', choices=sorted(VOCABULARIES), default='pt', help='Idioma do texto em docs/.')
+    parser.add_argument('--translations', default='0:en,34:pt:gzip',
+                        help="Arquivos TR###.gz: lista 'numero[:idioma][:gzip]' (default tar.gz).")
+    parser.add_argument('--seed', type=int, default=0, help='Semente (mesma semente = mesmo corpus).')
+    args = parser.parse_args()
+    summary = write_corpus(args.out, args.papers, args.format, parse_translations(args.translations), args.lang, args.seed)
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Leitura do índice completo do livro (`content/TocTable.html`).
+
+O arquivo é uma árvore de listas aninhadas (`<ul>/<li>`) herdada do leitor
+web, com links no formato:
+
+    javascript:loadDoc('content/Doc001.html','p001_000_000')
+
+`parse_toc_table` converte essa árvore para a mesma estrutura de nós usada em
+`assets/data/documentos_tree.json` ({"titulo", "link", "filhos"}), com links
+lógicos `doc://Doc001.html#p001_000_000`. Os `<li>` folha do arquivo não são
+fechados; por isso a estrutura é reconstruída pelos `<ul>`, e não pelos `</li>`.
+
+Só os benchmarks (`tree.toc_table.*`) usam este módulo, para medir a árvore
+completa; o aplicativo monta a árvore de `documentos_tree.json`.
+"""
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+
+TOC_FILE = Path('content') / 'TocTable.html'
+
+LOADDOC_RE = re.compile(r"loadDoc\('(?:[^']*/)?(?P<file>Doc\d+\.html)'\s*,\s*'(?P<anchor>p\d{3}_\d{3}_\d{3})'\)")
+
+
+class _TocParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.roots: list[dict] = []
+        self._stack: list[list[dict]] = []
+        self._current: dict | None = None
+        self._title_parts: list[str] = []
+
+    def _close_title(self) -> None:
+        if self._current is not None and self._title_parts:
+            self._current['titulo'] = ' '.join(''.join(self._title_parts).split())
+        self._title_parts = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'ul':
+            self._close_title()
+            if not self._stack:
+                self._stack.append(self.roots)
+            else:
+                siblings = self._stack[-1]
+                if siblings:
+                    self._stack.append(siblings[-1].setdefault('filhos', []))
+                else:  # <ul> sem <li> pai: mantém no mesmo nível
+                    self._stack.append(siblings)
+            self._current = None
+        elif tag == 'li' and self._stack:
+            self._close_title()
+            node: dict = {'titulo': '', 'link': None}
+            self._stack[-1].append(node)
+            self._current = node
+        elif tag == 'a' and self._current is not None:
+            href = dict(attrs).get('href') or ''
+            m = LOADDOC_RE.search(href)
+            if m:
+                self._current['link'] = f"doc://{m.group('file')}#{m.group('anchor')}"
+
+    def handle_endtag(self, tag):
+        if tag == 'ul' and self._stack:
+            self._close_title()
+            self._stack.pop()
+            self._current = None
+
+    def handle_data(self, data):
+        if self._current is not None:
+            self._title_parts.append(data)
+
+
+def parse_toc_table(html: str) -> list[dict]:
+    """Converte o HTML do índice em lista de nós {"titulo", "link", "filhos"}."""
+    parser = _TocParser()
+    parser.feed(html)
+    parser.close()
+    parser._close_title()
+    return parser.roots
+
+
+def load_toc_table(path: Path = TOC_FILE) -> dict:
+    """Lê o arquivo de índice e retorna {"nodes": [...]} (vazio se ausente)."""
+    try:
+        html = path.read_text(encoding='utf-8-sig')
+    except Exception:
+        return {"nodes": []}
+    return {"nodes": parse_toc_table(html)}
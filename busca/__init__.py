@@ -0,0 +1,24 @@
+"""Busca nos documentos: índice posicional, consultas booleanas e ranking BM25.
+
+`SearchEngine` (via `get_engine`) indexa uma pasta de documentos e responde a
+consultas com termos, "frases", NEAR/k e AND/OR/NOT (ver `busca.query`).
+`fold`/`get_analyzer` (ver `busca.analyzer`) normalizam texto do mesmo jeito
+para índice, filtros e destaque. `SemanticIndex` (ver `busca.semantic`) ordena
+consultas em linguagem natural por similaridade LSA, sem rede nem GPU.
+`iter_concordance` (ver `busca.concordance`) lista as ocorrências de um termo
+em contexto (KWIC), por documento, exportáveis para CSV/HTML. `ParallelSearch`
+(ver `busca.parallel`) une os resultados aos mesmos parágrafos de outras traduções.
+`SimilarIndex` (ver `busca.similar`) encontra parágrafos semelhantes por MinHash/LSH.
+`PrefixIndex` (ver `busca.prefix_index`) sugere termos do vocabulário para autocompletar.
+"""
+
+from .analyzer import Analyzer, fold, get_analyzer  # noqa: F401
+from .concordance import iter_concordance, write_csv, write_html  # noqa: F401
+from .engine import SearchEngine, get_engine  # noqa: F401
+from .parallel import ParallelSearch, Translation, slot_translations  # noqa: F401
+from .positional_index import PositionalIndex  # noqa: F401
+from .prefix_index import PrefixIndex  # noqa: F401
+from .query_cache import QueryCache, query_cache  # noqa: F401
+from .query import QuerySyntaxError, is_plain_query, parse_query  # noqa: F401
+from .semantic import SemanticIndex  # noqa: F401
+from .similar import SimilarIndex  # noqa: F401
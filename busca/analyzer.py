@@ -0,0 +1,204 @@
+"""Análise de texto compartilhada por índice, consulta, filtro e destaque.
+
+Pipeline por token: regex `\\w+` sobre o texto original → dobra Unicode
+(NFKD sem marcas combinantes, recomposto em NFC, casefold) → stemmer mínimo
+do idioma (plurais). Como os tokens saem do texto original, cada posição do
+índice tem o offset de caracteres de onde veio (`token_spans`,
+`span_offsets`), e o destaque de resultados casa exatamente com o que o
+índice casou.
+
+O idioma vem do `CultureID` da tradução (LCID do Windows, ex.: 1046 pt-BR,
+3082 es-ES); idiomas sem regras próprias usam só a dobra. Stopwords não
+saem do índice posicional (frases como "Trindade do Paraíso" continuam
+exatas): são descartadas nos termos soltos da consulta e nos vetores da
+busca semântica.
+
+`analyze_batch` processa listas de textos na indexação: cada token distinto
+é dobrado e reduzido uma única vez (cache por analisador), o que torna a
+indexação proporcional ao vocabulário e não ao número de ocorrências.
+"""
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Iterable
+
+ANALYZER_VERSION = 1
+
+TOKEN_RE = re.compile(r'\w+')
+
+# Idioma primário do LCID (lcid & 0x3FF) -> código ISO
+LCID_LANGUAGES = {
+    0x02: 'bg', 0x05: 'cs', 0x06: 'da', 0x07: 'de', 0x08: 'el', 0x09: 'en', 0x0A: 'es',
+    0x0B: 'fi', 0x0C: 'fr', 0x0E: 'hu', 0x10: 'it', 0x12: 'ko', 0x13: 'nl', 0x14: 'no',
+    0x15: 'pl', 0x16: 'pt', 0x18: 'ro', 0x19: 'ru', 0x1D: 'sv', 0x1F: 'tr', 0x25: 'et',
+    0x27: 'lt', 0x36: 'af',
+}
+
+STOPWORDS: dict[str, frozenset[str]] = {
+    'pt': frozenset(
+        "a ao aos as com como da das de do dos e em entre ela ele eles essa esse esta este "
+        "foi ha isso mais mas na nas no nos o os ou para pela pelas pelo pelos por que se "
+        "sem seu sua seus suas sao ser tambem um uma umas uns".split()),
+    'es': frozenset(
+        "a al como con de del el ella ellos en entre es esta este fue la las lo los mas "
+        "para pero por que se sin su sus un una unas unos y o".split()),
+    'en': frozenset(
+        "a an and are as at be but by for from has have in is it its of on or that the "
+        "their this to was were which with".split()),
+    'fr': frozenset(
+        "a au aux avec ce ces dans de des du elle en est et il ils la le les leur mais "
+        "ne ou par pas pour qui que se son sa ses sur un une".split()),
+}
+
+
+def fold(text: str) -> str:
+    """Remove acentos/diacríticos e caixa: 'Paraíso' -> 'paraiso', 'Ñandú' -> 'nandu'."""
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return unicodedata.normalize('NFC', stripped).casefold()
+
+
+# --- Stemmers mínimos (plural -> singular), sobre texto já dobrado ---
+def _stem_pt(word: str) -> str:
+    if len(word) < 4 or not word.endswith('s') or word.endswith(('ss', 'us')):
+        return word
+    if word.endswith('oes') or word.endswith('aes'):   # corações, pães
+        return word[:-3] + 'ao'
+    if word.endswith('ns'):                             # homens
+        return word[:-2] + 'm'
+    if word.endswith('ais') and len(word) > 4:          # animais
+        return word[:-3] + 'al'
+    if word.endswith('eis') and len(word) > 5:          # papéis
+        return word[:-3] + 'el'
+    if word.endswith('ois'):                            # lençóis
+        return word[:-3] + 'ol'
+    if word.endswith(('res', 'zes', 'ses')):            # mulheres, vozes, meses
+        return word[:-2]
+    return word[:-1]
+
+
+def _stem_es(word: str) -> str:
+    if len(word) < 4 or not word.endswith('s') or word.endswith('ss'):
+        return word
+    if word.endswith('ces'):                            # luces
+        return word[:-3] + 'z'
+    if word.endswith('es') and word[-3] not in 'aeiou':  # ciudades
+        return word[:-2]
+    return word[:-1]
+
+
+def _stem_en(word: str) -> str:
+    if len(word) < 4 or not word.endswith('s') or word.endswith(('ss', 'us', 'is')):
+        return word
+    if word.endswith('ies') and len(word) > 4:          # bodies
+        return word[:-3] + 'y'
+    if word.endswith(('ches', 'shes', 'xes', 'zes', 'sses')):
+        return word[:-2]
+    return word[:-1]
+
+
+def _stem_fr(word: str) -> str:
+    if len(word) < 4:
+        return word
+    if word.endswith('aux'):                            # chevaux
+        return word[:-3] + 'al'
+    if word.endswith(('s', 'x')) and not word.endswith(('ss', 'us')):
+        return word[:-1]
+    return word
+
+
+STEMMERS = {'pt': _stem_pt, 'es': _stem_es, 'en': _stem_en, 'fr': _stem_fr}
+
+
+def language_for_culture(culture_id: int | str | None) -> str:
+    """Código do idioma para um CultureID (LCID numérico, 'pt-BR' ou 'pt'); '' se desconhecido."""
+    if culture_id is None or culture_id == '':
+        return ''
+    if isinstance(culture_id, str) and not culture_id.isdigit():
+        return culture_id.split('-')[0].split('_')[0].lower()
+    return LCID_LANGUAGES.get(int(culture_id) & 0x3FF, '')
+
+
+class _TermCache(dict):
+    """token original -> termo; `__missing__` analisa e guarda (até MAX_CACHED)."""
+
+    MAX_CACHED = 500_000
+
+    def __init__(self, analyze) -> None:
+        super().__init__()
+        self._analyze = analyze
+
+    def __missing__(self, token: str) -> str:
+        term = self._analyze(token)
+        if len(self) < self.MAX_CACHED:
+            self[token] = term
+        return term
+
+
+class Analyzer:
+    """Tokenização + dobra + stemmer de um idioma, com cache de termos."""
+
+    def __init__(self, language: str = '') -> None:
+        self.language = language
+        self.stopwords = STOPWORDS.get(language, frozenset())
+        self._stem = STEMMERS.get(language)
+        self._cache = _TermCache(self._analyze_token)
+
+    @property
+    def signature(self) -> str:
+        """Identifica idioma e versão das regras (índices gravados com outra assinatura são refeitos)."""
+        return f"{self.language or '-'}:{ANALYZER_VERSION}"
+
+    def _analyze_token(self, token: str) -> str:
+        folded = fold(token)
+        return self._stem(folded) if self._stem is not None else folded
+
+    def term(self, token: str) -> str:
+        return self._cache[token]
+
+    def terms(self, text: str) -> list[str]:
+        """Termos na ordem do texto (stopwords incluídas: as posições valem para frases)."""
+        return list(map(self._cache.__getitem__, TOKEN_RE.findall(text)))
+
+    __call__ = terms
+
+    def analyze_batch(self, texts: Iterable[str]) -> list[list[str]]:
+        """`terms` para uma lista de textos, reaproveitando o cache entre eles."""
+        findall = TOKEN_RE.findall
+        lookup = self._cache.__getitem__
+        return [list(map(lookup, findall(text))) for text in texts]
+
+    def content_terms(self, text: str) -> list[str]:
+        """Termos sem stopwords (bag-of-words)."""
+        return [t for t in self.terms(text) if t not in self.stopwords]
+
+    def is_stopword(self, term: str) -> bool:
+        return term in self.stopwords
+
+    def token_spans(self, text: str) -> list[tuple[int, int, str]]:
+        """(início, fim, termo) de cada token, com offsets no texto original."""
+        return [(m.start(), m.end(), self.term(m.group())) for m in TOKEN_RE.finditer(text)]
+
+    def term_positions(self, text: str, terms: Iterable[str]) -> list[tuple[int, int]]:
+        """Trechos (posição, posição) dos tokens de `text` cujo termo está em `terms`."""
+        wanted = terms if isinstance(terms, (set, frozenset)) else set(terms)
+        return [(i, i) for i, term in enumerate(self.terms(text)) if term in wanted]
+
+    @staticmethod
+    def span_offsets(text: str, spans: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+        """Offsets de caracteres (início, fim) de trechos dados em posições de token (inclusivas)."""
+        tokens = [m.span() for m in TOKEN_RE.finditer(text)]
+        return [(tokens[start][0], tokens[end][1]) for start, end in spans if end < len(tokens)]
+
+
+_analyzers: dict[str, Analyzer] = {}
+
+
+def get_analyzer(culture_id: int | str | None = None) -> Analyzer:
+    """Analisador compartilhado do idioma de um CultureID (ver `language_for_culture`)."""
+    language = language_for_culture(culture_id)
+    analyzer = _analyzers.get(language)
+    if analyzer is None:
+        analyzer = _analyzers[language] = Analyzer(language)
+    return analyzer
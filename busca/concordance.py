@@ -0,0 +1,168 @@
+"""Concordância KWIC (keyword in context) sobre o índice da Busca.
+
+Cada ocorrência de um termo, "frase" ou NEAR vira uma linha
+(pid, contexto à esquerda, trecho, contexto à direita) com `context` palavras
+de cada lado, agrupadas por documento (papel AAA de pAAA_BBB_CCC).
+
+As posições vêm do índice posicional (`PositionalIndex.match_spans`), então
+só os parágrafos que contêm o termo são lidos. As posições de token coincidem
+com `TOKEN_RE` sobre o texto guardado, e cada documento é recortado
+independentemente. Com `jobs > 1` e documentos suficientes, os recortes rodam
+num `ProcessPoolExecutor` (um item por documento, em ordem), e o gerador
+entrega cada documento assim que fica pronto. O pool usa o contexto 'spawn'
+(fork a partir de um processo com threads pode travar o filho) e, se o
+gerador for fechado antes do fim, descarta os documentos ainda não iniciados
+sem esperar por eles.
+
+Exportação: `write_csv` e `write_html` consomem o mesmo fluxo;
+`html_table` monta a tabela de um documento para exibição.
+"""
+from __future__ import annotations
+
+import csv
+import html
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import IO, Iterable, Iterator
+
+from perf_events import PerfEvents
+
+from .analyzer import TOKEN_RE
+from .paragraphs import pid_reference
+from .positional_index import Span
+
+DEFAULT_CONTEXT = 5
+# O recorte é barato: o pool só compensa o custo de iniciar processos e
+# serializar os textos com muitos documentos e muitas ocorrências
+PARALLEL_MIN_PAPERS = 8
+PARALLEL_MIN_SPANS = 20_000
+
+KwicLine = tuple[str, str, str, str]          # (pid, esquerda, trecho, direita)
+PaperLines = tuple[int, list[KwicLine]]        # (documento, linhas)
+_PaperJob = tuple[int, list[tuple[str, str, list[Span]]], int]
+
+_span = re.Match.span
+
+CSV_HEADER = ('documento', 'referencia', 'esquerda', 'termo', 'direita')
+
+
+def paper_of(pid: str) -> int:
+    """Número do documento de um id pAAA_BBB_CCC."""
+    return int(pid[1:4])
+
+
+def kwic_lines(pid: str, text: str, spans: list[Span], context: int) -> list[KwicLine]:
+    """Linhas KWIC de um parágrafo para os trechos (posição inicial, final) do índice.
+
+    Só tokeniza até a última palavra de contexto necessária.
+    """
+    if not spans:
+        return []
+    needed = max(end for _, end in spans) + context + 1
+    tokens = list(islice(map(_span, TOKEN_RE.finditer(text)), needed))
+    last = len(tokens) - 1
+    lines: list[KwicLine] = []
+    for start, end in spans:
+        if end > last:
+            continue  # texto mudou desde a indexação
+        left_start = tokens[max(0, start - context)][0]
+        right_end = tokens[min(last, end + context)][1]
+        kw_start, kw_end = tokens[start][0], tokens[end][1]
+        lines.append((pid, ' '.join(text[left_start:kw_start].split()), text[kw_start:kw_end],
+                      ' '.join(text[kw_end:right_end].split())))
+    return lines
+
+
+def _paper_lines(job: _PaperJob) -> PaperLines:
+    paper, paragraphs, context = job
+    lines: list[KwicLine] = []
+    for pid, text, spans in paragraphs:
+        lines += kwic_lines(pid, text, spans, context)
+    return paper, lines
+
+
+def iter_concordance(engine, query: str, context: int = DEFAULT_CONTEXT, jobs: int | None = 1) -> Iterator[PaperLines]:
+    """(documento, linhas) em ordem de documento. `jobs=None` usa todas as CPUs.
+
+    A interface chama com `jobs=1`: o executável empacotado não inicia
+    processos filhos a partir da interface.
+
+    Levanta `QuerySyntaxError` se a consulta não for termo, frase ou NEAR.
+    """
+    start = time.perf_counter()
+    index = engine.ensure_index()
+    matched = index.match_spans(query)
+    by_paper: dict[int, list[tuple[str, str, list[Span]]]] = {}
+    total = 0
+    for doc in sorted(matched):
+        pid = index.ids[doc]
+        spans = sorted(set(matched[doc]))
+        total += len(spans)
+        by_paper.setdefault(paper_of(pid), []).append((pid, engine.text(pid), spans))
+    job_list: list[_PaperJob] = [(paper, paragraphs, context) for paper, paragraphs in sorted(by_paper.items())]
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    parallel = jobs > 1 and len(job_list) >= PARALLEL_MIN_PAPERS and total >= PARALLEL_MIN_SPANS
+    count = 0
+    if parallel:
+        pool = ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context('spawn'))
+        try:
+            for paper, lines in pool.map(_paper_lines, job_list, chunksize=max(1, len(job_list) // (jobs * 4))):
+                count += len(lines)
+                yield paper, lines
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+    else:
+        for job in job_list:
+            paper, lines = _paper_lines(job)
+            count += len(lines)
+            yield paper, lines
+    PerfEvents.emit('search.concordance', ms=(time.perf_counter() - start) * 1000.0,
+                    papers=len(job_list), lines=count, jobs=jobs if parallel else 1)
+
+
+def write_csv(papers: Iterable[PaperLines], out: IO[str]) -> int:
+    """Grava a concordância em CSV (uma ocorrência por linha). Retorna o número de linhas."""
+    writer = csv.writer(out)
+    writer.writerow(CSV_HEADER)
+    count = 0
+    for paper, lines in papers:
+        for pid, left, keyword, right in lines:
+            writer.writerow((paper, pid_reference(pid), left, keyword, right))
+            count += 1
+    return count
+
+
+CSS = ("table.kwic{border-collapse:collapse;width:100%;} table.kwic td{padding:2px 6px;vertical-align:top;white-space:nowrap;}"
+       "td.l{text-align:right;width:45%;} td.k{font-weight:bold;color:#a33;} td.r{width:45%;}"
+       "td.ref{color:#789;} table.kwic tr:nth-child(even){background:#f4f7fb;}")
+
+
+def html_table(paper: int, lines: list[KwicLine]) -> str:
+    """Título e tabela KWIC (referência | esquerda | termo | direita) de um documento."""
+    rows = "".join(
+        f"<tr><td class='ref'>{pid_reference(pid)}</td><td class='l'>{html.escape(left)}</td>"
+        f"<td class='k'>{html.escape(keyword)}</td><td class='r'>{html.escape(right)}</td></tr>"
+        for pid, left, keyword, right in lines
+    )
+    return f"<h2>{paper}</h2><table class='kwic'>{rows}</table>"
+
+
+def write_html(papers: Iterable[PaperLines], out: IO[str], title: str = '') -> int:
+    """Grava a concordância como página HTML (tabela por documento). Retorna o número de linhas."""
+    out.write("<!DOCTYPE html><html><head><meta charset='utf-8'>"
+              f"<title>{html.escape(title)}</title><style>"
+              "body{font-family:'Segoe UI',sans-serif;color:#133;} h2{color:#0a3d7a;margin:18px 0 6px;}"
+              f"{CSS}</style></head><body>")
+    if title:
+        out.write(f"<h1>{html.escape(title)}</h1>")
+    count = 0
+    for paper, lines in papers:
+        out.write(html_table(paper, lines))
+        count += len(lines)
+    out.write("</body></html>")
+    return count
@@ -0,0 +1,312 @@
+"""Motor de busca de uma pasta de documentos (índice posicional em cache).
+
+O índice fica em `.search_index.bin` na própria pasta, junto com o texto dos
+parágrafos (para trechos de resultado) e a impressão digital dos arquivos
+(nome → tamanho, mtime_ns). Se algum documento mudar, o índice é refeito na
+próxima abertura. O idioma (CultureID) escolhe o analisador; os documentos
+do aplicativo estão em português (`DOCS_CULTURE_ID`).
+
+Com `settings.search_semantic_enabled`, `ensure_semantic` também carrega (ou
+calcula) os vetores LSA de `busca.semantic`, gravados ao lado do índice e
+invalidados pela mesma impressão digital. `ensure_similar` faz o mesmo com as
+assinaturas MinHash/LSH de `busca.similar` (parágrafos semelhantes a um id).
+O índice de prefixos do vocabulário (`busca.prefix_index`, sugestões de
+termos) é construído junto com o índice e carregado com ele.
+
+Resultados passam pelo cache LRU de `busca.query_cache` e podem ser
+consumidos em lotes ranqueados (`search_batches`): os `FIRST_BATCH` melhores
+saem antes de ordenar os demais, e quem consome pode parar a qualquer
+momento (o gerador fechado não grava no cache).
+
+Uso:
+    from busca import get_engine
+    engine = get_engine(Path('assets/docs'))
+    engine.ensure_index()                       # lento só na primeira vez
+    engine.search('"Trindade do Paraíso"', limit=settings.search_max_items)
+    for batch in engine.search_batches('luz vida', limit=300): ...
+    engine.text('p001_001_001')
+    engine.ensure_similar(); engine.similar('p001_001_001')
+    engine.suggest('ajus')                      # [('ajustador', df), ...]
+"""
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Hashable, Iterator
+
+from perf_events import PerfEvents
+
+from .analyzer import Analyzer, get_analyzer
+from .paragraphs import load_paragraphs, source_files
+from .positional_index import PositionalIndex, SearchResult, Span
+from .prefix_index import DEFAULT_LIMIT as SUGGEST_LIMIT, PREFIX_NAME, PrefixIndex, Suggestion
+from .query import parse_query
+from .query_cache import query_cache
+from .semantic import SemanticIndex, SemanticResult
+from .similar import DEFAULT_LIMIT as SIMILAR_LIMIT, SimilarIndex, SimilarResult
+
+INDEX_NAME = '.search_index.bin'
+DOCS_CULTURE_ID = 1046  # pt-BR
+FIRST_BATCH = 20   # primeiros resultados entregues antes de ordenar o restante
+BATCH_SIZE = 100
+
+
+def folder_fingerprint(folder: Path) -> dict[str, list[int]]:
+    fingerprint = {}
+    for path in source_files(folder):
+        st = path.stat()
+        fingerprint[path.name] = [st.st_size, st.st_mtime_ns]
+    return fingerprint
+
+
+class SearchEngine:
+    """Índice + textos dos parágrafos de uma pasta; carga preguiçosa e thread-safe."""
+
+    def __init__(self, folder: Path, culture_id: int | str | None = DOCS_CULTURE_ID) -> None:
+        self.folder = Path(folder)
+        self.analyzer: Analyzer = get_analyzer(culture_id)
+        self.path = self.folder / INDEX_NAME
+        self._index: PositionalIndex | None = None
+        self._semantic: SemanticIndex | None = None
+        self._similar: SimilarIndex | None = None
+        self._prefix: PrefixIndex | None = None
+        self._texts: dict[str, str] = {}
+        self._generation = 0  # muda a cada índice carregado/reconstruído (chave do cache)
+        self._lock = threading.Lock()
+        self._semantic_lock = threading.Lock()
+        self._similar_lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._index is not None
+
+    @property
+    def semantic_ready(self) -> bool:
+        return self._semantic is not None and self._index is not None \
+            and self._semantic.meta.get('fingerprint') == self._index.meta.get('fingerprint')
+
+    @property
+    def similar_ready(self) -> bool:
+        return self._similar is not None and self._index is not None \
+            and self._similar.meta.get('fingerprint') == self._index.meta.get('fingerprint')
+
+    @property
+    def index(self) -> PositionalIndex:
+        return self.ensure_index()
+
+    def ensure_index(self) -> PositionalIndex:
+        """Carrega o índice persistido ou o reconstrói se os documentos mudaram."""
+        with self._lock:
+            fingerprint = folder_fingerprint(self.folder)
+            if self._index is not None and self._index.meta.get('fingerprint') == fingerprint:
+                return self._index
+            start = time.perf_counter()
+            index = None
+            cached = False
+            try:
+                index = PositionalIndex.load(self.path)
+                if index.meta.get('fingerprint') != fingerprint or index.analyzer is not self.analyzer:
+                    index = None
+                cached = index is not None
+            except Exception:  # ausente, corrompido ou de outra versão
+                index = None
+            if index is None:
+                paragraphs = load_paragraphs(self.folder)
+                index = PositionalIndex.build(paragraphs, meta={'fingerprint': fingerprint, 'texts': [t for _, t in paragraphs]},
+                                              analyzer=self.analyzer)
+                try:
+                    index.save(self.path)
+                except Exception:  # pasta somente leitura: índice só em memória
+                    pass
+            self._texts = dict(zip(index.ids, index.meta.get('texts', [])))
+            self._prefix = self._load_prefix(index, fingerprint, cached)
+            self._index = index
+            self._generation += 1
+            PerfEvents.emit('search.index.load', ms=(time.perf_counter() - start) * 1000.0,
+                            paragraphs=len(index), terms=len(index.terms), cached=cached,
+                            prefix_kb=self._prefix.nbytes // 1024)
+            return index
+
+    def _load_prefix(self, index: PositionalIndex, fingerprint: dict, cached: bool) -> PrefixIndex:
+        """Prefixos gravados junto com o índice; refeitos com ele (ou se o arquivo faltar)."""
+        path = self.folder / PREFIX_NAME
+        if cached:
+            try:
+                prefix = PrefixIndex.load(path)
+                if prefix.meta.get('fingerprint') == fingerprint and prefix.analyzer is self.analyzer:
+                    return prefix
+            except Exception:  # ausente, corrompido ou de outra versão
+                pass
+        prefix = PrefixIndex.build(((t, entry[2]) for t, entry in index.terms.items()), index.meta.get('texts', []),
+                                   meta={'fingerprint': fingerprint}, analyzer=self.analyzer)
+        try:
+            prefix.save(path)
+        except Exception:  # pasta somente leitura: prefixos só em memória
+            pass
+        return prefix
+
+    def search(self, query: str, limit: int = 200) -> list[SearchResult]:
+        return [hit for batch in self.search_batches(query, limit) for hit in batch]
+
+    def ensure_semantic(self) -> SemanticIndex:
+        """Vetores LSA dos mesmos parágrafos do índice (carregados do disco ou calculados)."""
+        index = self.ensure_index()
+        with self._semantic_lock:
+            fingerprint = index.meta.get('fingerprint')
+            if self._semantic is not None and self._semantic.meta.get('fingerprint') == fingerprint:
+                return self._semantic
+            start = time.perf_counter()
+            semantic = None
+            try:
+                semantic = SemanticIndex.load(self.folder)
+                if semantic.meta.get('fingerprint') != fingerprint or semantic.analyzer is not self.analyzer:
+                    semantic = None
+            except Exception:  # ausente, corrompido ou de outra versão
+                semantic = None
+            cached = semantic is not None
+            if semantic is None:
+                paragraphs = list(zip(index.ids, index.meta.get('texts', [])))
+                semantic = SemanticIndex.build(paragraphs, meta={'fingerprint': fingerprint}, analyzer=self.analyzer)
+                try:
+                    semantic.save(self.folder)
+                except Exception:  # pasta somente leitura: vetores só em memória
+                    pass
+            self._semantic = semantic
+            PerfEvents.emit('search.semantic.load', ms=(time.perf_counter() - start) * 1000.0,
+                            paragraphs=len(semantic), dim=semantic.dim, cached=cached)
+            return semantic
+
+    def ensure_similar(self) -> SimilarIndex:
+        """Assinaturas MinHash/LSH dos mesmos parágrafos do índice (carregadas do disco ou calculadas)."""
+        index = self.ensure_index()
+        with self._similar_lock:
+            fingerprint = index.meta.get('fingerprint')
+            if self._similar is not None and self._similar.meta.get('fingerprint') == fingerprint:
+                return self._similar
+            start = time.perf_counter()
+            similar = None
+            try:
+                similar = SimilarIndex.load(self.folder)
+                if similar.meta.get('fingerprint') != fingerprint or similar.analyzer is not self.analyzer:
+                    similar = None
+            except Exception:  # ausente, corrompido ou de outra versão
+                similar = None
+            cached = similar is not None
+            if similar is None:
+                paragraphs = list(zip(index.ids, index.meta.get('texts', [])))
+                similar = SimilarIndex.build(paragraphs, meta={'fingerprint': fingerprint}, analyzer=self.analyzer)
+                try:
+                    similar.save(self.folder)
+                except Exception:  # pasta somente leitura: assinaturas só em memória
+                    pass
+            self._similar = similar
+            PerfEvents.emit('search.similar.load', ms=(time.perf_counter() - start) * 1000.0,
+                            paragraphs=len(similar), cached=cached)
+            return similar
+
+    def similar(self, pid: str, limit: int = SIMILAR_LIMIT) -> list[SimilarResult]:
+        """Parágrafos mais parecidos com `pid` (Jaccard estimado pelas assinaturas MinHash)."""
+        similar = self.ensure_similar()
+        start = time.perf_counter()
+        results = similar.similar(pid, limit)
+        PerfEvents.emit('search.similar.query', ms=(time.perf_counter() - start) * 1000.0, hits=len(results), limit=limit)
+        return results
+
+    def semantic_search(self, query: str, limit: int = 200) -> list[SemanticResult]:
+        return [hit for batch in self.search_batches(query, limit, semantic=True) for hit in batch]
+
+    def cache_key(self, query: str, semantic: bool = False) -> Hashable:
+        """Chave do cache: tradução, regras, geração do índice e consulta normalizada.
+
+        Levanta `QuerySyntaxError` para consultas exatas malformadas.
+        """
+        if semantic:
+            normalized = ' '.join(sorted(self.analyzer.content_terms(query)))
+        else:
+            normalized = repr(parse_query(query, self.analyzer, self.analyzer.stopwords))
+        return (str(self.folder), self.analyzer.signature, self._generation, semantic, normalized)
+
+    def search_batches(self, query: str, limit: int = 200, semantic: bool = False,
+                       first: int = FIRST_BATCH, batch: int = BATCH_SIZE) -> Iterator[list[SearchResult]]:
+        """Resultados ranqueados em lotes: `first` melhores, depois lotes de `batch` até `limit`."""
+        index = self.ensure_index()  # antes da chave: fixa a geração
+        key = self.cache_key(query, semantic)
+        event = 'search.semantic.query' if semantic else 'search.query'
+        results = query_cache.get(key, limit)
+        if results is not None:
+            PerfEvents.emit(event, ms=0.0, hits=len(results), limit=limit, cached=True)
+            yield from _batches(results, first, batch)
+            return
+        start = time.perf_counter()
+        if semantic:
+            semantic_index = self.ensure_semantic()
+            row = semantic_index.scores([query])[0]
+            rank = lambda k: semantic_index.rank(row, k)  # noqa: E731
+        else:
+            scores = index.match_scores(query)
+            rank = lambda k: index.rank(scores, k)  # noqa: E731
+        results = rank(min(first, limit))
+        elapsed = time.perf_counter() - start
+        yield results
+        if len(results) == first and limit > first:
+            start = time.perf_counter()
+            results = rank(limit)
+            elapsed += time.perf_counter() - start
+            for i in range(first, len(results), batch):
+                yield results[i:i + batch]
+        query_cache.put(key, limit, results)
+        PerfEvents.emit(event, ms=elapsed * 1000.0, hits=len(results), limit=limit, cached=False)
+
+    def suggest(self, prefix: str, limit: int = SUGGEST_LIMIT) -> list[Suggestion]:
+        """Termos do vocabulário que começam com `prefix`, mais frequentes primeiro ([] até o índice carregar)."""
+        prefix_index = self._prefix
+        return prefix_index.suggest(prefix, limit) if prefix_index is not None else []
+
+    def hit_spans(self, query: str, semantic: bool = False) -> dict[str, list[Span]]:
+        """Parágrafo → trechos (posições de token) a destacar: frases e NEAR inteiros, sem stopwords soltas.
+
+        Na busca semântica os resultados não precisam satisfazer a consulta:
+        valem os acertos de cada termo em qualquer parágrafo.
+        """
+        index = self.ensure_index()
+        return {index.ids[doc]: spans for doc, spans in index.hit_spans(query, matched_only=not semantic).items()}
+
+    def term_spans(self, pids: list[str], terms: list[str]) -> dict[str, list[Span]]:
+        """Posições dos tokens de `terms` em cada parágrafo (destaque dos semelhantes, sem consulta)."""
+        wanted = frozenset(terms)
+        found = {pid: self.analyzer.term_positions(self.text(pid), wanted) for pid in pids}
+        return {pid: spans for pid, spans in found.items() if spans}
+
+    def hit_offsets(self, pid: str, spans: list[Span]) -> list[tuple[int, int]]:
+        """Offsets de caracteres (início, fim) dos trechos `spans` no texto indexado do parágrafo."""
+        return self.analyzer.span_offsets(self.text(pid), spans) if spans else []
+
+    def text(self, pid: str) -> str:
+        return self._texts.get(pid, '')
+
+    def texts(self, pids: list[str]) -> list[str]:
+        """Textos de vários parágrafos ('' se ausente), com o índice em dia: uma verificação por lote."""
+        self.ensure_index()
+        get = self._texts.get
+        return [get(pid, '') for pid in pids]
+
+
+def _batches(results: list[SearchResult], first: int, batch: int) -> Iterator[list[SearchResult]]:
+    yield results[:first]
+    for i in range(first, len(results), batch):
+        yield results[i:i + batch]
+
+
+_engines: dict[Path, SearchEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(folder: Path, culture_id: int | str | None = DOCS_CULTURE_ID) -> SearchEngine:
+    """Instância compartilhada do motor de uma pasta."""
+    key = Path(folder).resolve()
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None or engine.analyzer is not get_analyzer(culture_id):
+            engine = _engines[key] = SearchEngine(Path(folder), culture_id)
+        return engine
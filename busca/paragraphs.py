@@ -0,0 +1,75 @@
+"""Extração de parágrafos (`pAAA_BBB_CCC` → texto) dos documentos.
+
+Um parágrafo é o trecho entre a tag com id de âncora e a próxima âncora, com
+as tags removidas. Funciona para HTML (`<p id="...">texto</p>`) e para o
+Markdown convertido (`<p><a id="..."></a>texto</p>`); títulos com id
+(`<h2 id="p001_001_000">`) também viram parágrafos pesquisáveis.
+"""
+from __future__ import annotations
+
+import html
+import re
+from pathlib import Path
+from typing import Iterator
+
+from anchor_index import ANCHOR_TAG_RE, document_files, render_bytes
+
+TAG_RE = re.compile(r'<[^>]*>')
+SPACE_RE = re.compile(r'\s+')
+
+Paragraph = tuple[str, str]  # (id da âncora, texto)
+
+
+def html_to_text(fragment: str) -> str:
+    """Remove tags, decodifica entidades e normaliza espaços."""
+    return SPACE_RE.sub(' ', html.unescape(TAG_RE.sub(' ', fragment))).strip()
+
+
+def iter_paragraphs(raw: bytes) -> Iterator[Paragraph]:
+    """Parágrafos de um HTML (bytes UTF-8) na ordem do documento."""
+    matches = list(ANCHOR_TAG_RE.finditer(raw))
+    for i, m in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(raw)
+        text = html_to_text(raw[m.start():end].decode('utf-8', errors='ignore'))
+        if text:
+            yield m.group('id').decode('ascii'), text
+
+
+def source_files(folder: Path) -> list[Path]:
+    """Documentos de uma pasta (assets/docs ou doc_sources/TR###)."""
+    files = document_files(folder)
+    if not files:  # TR###.gz de arquivo único extraído com outro nome (ou como TR###.txt)
+        files = sorted(p for p in folder.glob('*.htm*') if p.is_file()) \
+            or sorted(p for p in folder.glob('TR[0-9][0-9][0-9].txt') if p.is_file())
+    return files
+
+
+def load_paragraphs(folder: Path) -> list[Paragraph]:
+    paragraphs: list[Paragraph] = []
+    for path in source_files(Path(folder)):
+        paragraphs.extend(iter_paragraphs(render_bytes(path)))
+    return paragraphs
+
+
+PID_RE = re.compile(r'p\d{3}_\d{3}_\d{3}')
+REFERENCE_RE = re.compile(r'(\d{1,3}):(\d{1,3})\.(\d{1,3})')
+
+
+def paragraph_id(text: str) -> str | None:
+    """Id de parágrafo escrito como 'p001_002_003' ou como referência '1:2.3'; None se não for."""
+    text = text.strip()
+    if PID_RE.fullmatch(text):
+        return text
+    m = REFERENCE_RE.fullmatch(text)
+    if m:
+        return 'p{:03d}_{:03d}_{:03d}'.format(*(int(x) for x in m.groups()))
+    return None
+
+
+def pid_reference(pid: str) -> str:
+    """Referência legível de um id de parágrafo: 'p001_002_003' -> '1:2.3'."""
+    try:
+        paper, section, paragraph = (int(x) for x in pid[1:].split('_')[:3])
+    except ValueError:
+        return pid
+    return f"{paper}:{section}.{paragraph}"
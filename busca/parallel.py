@@ -0,0 +1,108 @@
+"""Busca paralela entre traduções (mesmo id `pAAA_BBB_CCC` em cada uma).
+
+A consulta roda no índice de uma tradução (a de consulta); os resultados são
+unidos por id aos parágrafos das demais traduções escolhidas, cada uma com o
+seu próprio motor (`SearchEngine` da pasta `doc_sources/TR###`, com o
+analisador do seu CultureID). A junção é feita por lote de resultados: uma
+única passada pelo armazenamento de parágrafos de cada tradução
+(`SearchEngine.texts`), em vez de uma consulta por parágrafo.
+
+Uso:
+    from busca.parallel import ParallelSearch, slot_translations
+    translations = slot_translations([34, 0], Path('doc_sources'), catalog)
+    search = ParallelSearch(get_engine(CONTENT_ROOT), translations)
+    for batch in search.search_batches('"Ajustador do Pensamento"', limit=200):
+        for pid, score, aligned in batch: ...   # aligned: [(rótulo, texto)]
+"""
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from perf_events import PerfEvents
+
+from .engine import SearchEngine, get_engine
+from .paragraphs import source_files
+from .similar import DEFAULT_LIMIT as SIMILAR_LIMIT
+
+AlignedText = tuple[str, str]                      # (rótulo da tradução, texto do parágrafo)
+AlignedHit = tuple[str, float, list[AlignedText]]  # (id do parágrafo, score, paralelos)
+
+
+class Translation:
+    """Uma tradução participante: rótulo curto e motor da pasta extraída."""
+
+    __slots__ = ('label', 'engine')
+
+    def __init__(self, label: str, engine: SearchEngine) -> None:
+        self.label = label
+        self.engine = engine
+
+    def __repr__(self) -> str:
+        return f"Translation({self.label!r}, {str(self.engine.folder)!r})"
+
+
+def translation_folder(sources_dir: Path, language_id: int) -> Path:
+    """Pasta extraída de TR###.gz (ver `ShowTranslation.extract_archive`)."""
+    return Path(sources_dir) / f"TR{language_id:03d}"
+
+
+def slot_translations(language_ids: Iterable[int], sources_dir: Path, catalog: Any = None) -> list[Translation]:
+    """Traduções escolhidas (LanguageIDs dos slots) que já têm documentos extraídos.
+
+    Slots vazios (-1), repetidos ou ainda não extraídos são ignorados. Com o
+    catálogo, o rótulo vem de TextButton/Description e o analisador do CultureID.
+    """
+    translations: list[Translation] = []
+    seen: set[int] = set()
+    for language_id in language_ids:
+        if not isinstance(language_id, int) or language_id < 0 or language_id in seen:
+            continue
+        seen.add(language_id)
+        folder = translation_folder(sources_dir, language_id)
+        if not folder.is_dir() or not source_files(folder):
+            continue
+        info = catalog.get(language_id) if catalog is not None else None
+        label = (info.text_button or info.description) if info is not None else f"TR{language_id:03d}"
+        culture_id = info.culture_id if info is not None else None
+        translations.append(Translation(label, get_engine(folder, culture_id)))
+    return translations
+
+
+def align(translations: list[Translation], pids: list[str]) -> list[list[AlignedText]]:
+    """Parágrafos com os mesmos ids em cada tradução (uma passada por tradução)."""
+    columns = [(t.label, t.engine.texts(pids)) for t in translations]
+    return [[(label, texts[i]) for label, texts in columns if texts[i]] for i in range(len(pids))]
+
+
+class ParallelSearch:
+    """Consulta em uma tradução + paralelos nas demais, unidos por id de parágrafo."""
+
+    def __init__(self, engine: SearchEngine, others: list[Translation]) -> None:
+        self.engine = engine
+        self.others = [t for t in others if t.engine is not engine]
+
+    def ensure_indexes(self) -> None:
+        """Carrega (ou constrói) os índices de todas as traduções."""
+        self.engine.ensure_index()
+        for translation in self.others:
+            translation.engine.ensure_index()
+
+    def search(self, query: str, limit: int = 200) -> list[AlignedHit]:
+        return [hit for batch in self.search_batches(query, limit) for hit in batch]
+
+    def similar(self, pid: str, limit: int = SIMILAR_LIMIT) -> list[AlignedHit]:
+        """Parágrafos semelhantes a `pid` na tradução da consulta, com os paralelos."""
+        hits = self.engine.similar(pid, limit)
+        aligned = align(self.others, [hit_pid for hit_pid, _ in hits])
+        return [(hit_pid, score, texts) for (hit_pid, score), texts in zip(hits, aligned)]
+
+    def search_batches(self, query: str, limit: int = 200, semantic: bool = False, **kwargs) -> Iterator[list[AlignedHit]]:
+        """Lotes de `SearchEngine.search_batches`, cada um unido às demais traduções."""
+        for batch in self.engine.search_batches(query, limit, semantic=semantic, **kwargs):
+            start = time.perf_counter()
+            aligned = align(self.others, [pid for pid, _ in batch])
+            PerfEvents.emit('search.parallel.align', ms=(time.perf_counter() - start) * 1000.0,
+                            hits=len(batch), translations=len(self.others))
+            yield [(pid, score, texts) for (pid, score), texts in zip(batch, aligned)]
@@ -0,0 +1,350 @@
+"""Índice posicional de parágrafos com ranking BM25.
+
+Formato das listas de ocorrências (postings): para cada termo, uma sequência
+de inteiros em varint (7 bits por byte) gravada num único `bytes`:
+
+    delta_doc, tf, delta_pos_1, ..., delta_pos_tf, delta_doc, tf, ...
+
+`delta_doc` é a diferença para o parágrafo anterior da lista e as posições
+são relativas à anterior no mesmo parágrafo. O dicionário guarda, por termo,
+(offset, tamanho, df) dentro do blob; os comprimentos dos parágrafos ficam
+num `array('I')`.
+
+Arquivo persistido: MAGIC, tamanho do cabeçalho (uint32), cabeçalho JSON
+(ids, termos, metadados), comprimentos e o blob de postings.
+
+Textos e consultas passam pelo mesmo `Analyzer` (dobra de acentos/caixa e
+stemmer do idioma); o idioma e a assinatura do analisador vão no cabeçalho,
+e um índice gravado com outras regras é recusado em `load`.
+"""
+from __future__ import annotations
+
+import heapq
+import json
+import math
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Any, Iterable
+
+from .analyzer import Analyzer, get_analyzer
+from .query import And, Near, Node, Not, Or, Phrase, QuerySyntaxError, Term, highlight_nodes, parse_query, query_terms
+
+MAGIC = b'AMIX'
+FORMAT_VERSION = 2
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+BUILD_BATCH = 512  # parágrafos por lote de análise
+
+Span = tuple[int, int]  # (posição inicial, posição final) de um termo/frase
+SearchResult = tuple[str, float]  # (id do parágrafo, score BM25)
+
+
+def encode_varint(value: int, out: bytearray) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varints(buf: bytes, start: int = 0, end: int | None = None) -> list[int]:
+    values: list[int] = []
+    append = values.append
+    value = shift = 0
+    for byte in buf[start:end]:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            append(value)
+            value = shift = 0
+    return values
+
+
+class PositionalIndex:
+    """Índice invertido posicional sobre uma lista de parágrafos (id, texto)."""
+
+    def __init__(self, ids: list[str], lengths: array, terms: dict[str, tuple[int, int, int]],
+                 blob: bytes, meta: dict[str, Any] | None = None, analyzer: Analyzer | None = None) -> None:
+        self.analyzer = analyzer or get_analyzer()
+        self.ids = ids
+        self.lengths = lengths
+        self.terms = terms
+        self.blob = blob
+        self.meta = meta or {}
+        self.avgdl = (sum(lengths) / len(lengths)) if len(lengths) else 0.0
+
+    # --- Construção ---
+    @classmethod
+    def build(cls, paragraphs: Iterable[tuple[str, str]], meta: dict[str, Any] | None = None,
+              analyzer: Analyzer | None = None) -> 'PositionalIndex':
+        analyzer = analyzer or get_analyzer()
+        paragraphs = list(paragraphs)
+        ids: list[str] = []
+        lengths = array('I')
+        occurrences: dict[str, list] = {}  # termo -> [doc, [posições], doc, [posições], ...]
+        analyzed: list[list[str]] = []
+        for start in range(0, len(paragraphs), BUILD_BATCH):
+            analyzed += analyzer.analyze_batch(text for _, text in paragraphs[start:start + BUILD_BATCH])
+        for doc, ((pid, _text), tokens) in enumerate(zip(paragraphs, analyzed)):
+            ids.append(pid)
+            lengths.append(len(tokens))
+            local: dict[str, list[int]] = {}
+            for pos, token in enumerate(tokens):
+                positions = local.get(token)
+                if positions is None:
+                    local[token] = [pos]
+                else:
+                    positions.append(pos)
+            for token, positions in local.items():
+                entry = occurrences.get(token)
+                if entry is None:
+                    occurrences[token] = [doc, positions]
+                else:
+                    entry += (doc, positions)
+        blob = bytearray()
+        terms: dict[str, tuple[int, int, int]] = {}
+        for token in sorted(occurrences):
+            entry = occurrences[token]
+            offset = len(blob)
+            last_doc = 0
+            for i in range(0, len(entry), 2):
+                doc, positions = entry[i], entry[i + 1]
+                encode_varint(doc - last_doc, blob)
+                last_doc = doc
+                encode_varint(len(positions), blob)
+                last_pos = 0
+                for pos in positions:
+                    encode_varint(pos - last_pos, blob)
+                    last_pos = pos
+            terms[token] = (offset, len(blob) - offset, len(entry) // 2)
+        return cls(ids, lengths, terms, bytes(blob), meta, analyzer)
+
+    # --- Persistência ---
+    def save(self, path: Path) -> None:
+        header = json.dumps({'version': FORMAT_VERSION, 'language': self.analyzer.language,
+                             'analyzer': self.analyzer.signature, 'ids': self.ids, 'terms': self.terms,
+                             'meta': self.meta},
+                            ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        tmp = Path(path).with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<I', len(header)))
+            f.write(header)
+            f.write(self.lengths.tobytes())
+            f.write(self.blob)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> 'PositionalIndex':
+        data = Path(path).read_bytes()
+        if data[:4] != MAGIC:
+            raise ValueError(f"Arquivo de índice inválido: {path}")
+        (header_size,) = struct.unpack_from('<I', data, 4)
+        header = json.loads(data[8:8 + header_size].decode('utf-8'))
+        if header.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Versão de índice incompatível: {path}")
+        analyzer = get_analyzer(header.get('language', ''))
+        if header.get('analyzer') != analyzer.signature:
+            raise ValueError(f"Índice gravado com outro analisador: {path}")
+        ids = header['ids']
+        start = 8 + header_size
+        lengths = array('I')
+        lengths.frombytes(data[start:start + 4 * len(ids)])
+        terms = {t: tuple(v) for t, v in header['terms'].items()}
+        return cls(ids, lengths, terms, data[start + 4 * len(ids):], header.get('meta'), analyzer)  # type: ignore[arg-type]
+
+    # --- Postings ---
+    def doc_freq(self, term: str) -> int:
+        entry = self.terms.get(term)
+        return entry[2] if entry else 0
+
+    def postings(self, term: str) -> dict[int, list[int]]:
+        """Parágrafo → posições (absolutas) do termo."""
+        entry = self.terms.get(term)
+        if entry is None:
+            return {}
+        offset, size, _df = entry
+        values = decode_varints(self.blob, offset, offset + size)
+        result: dict[int, list[int]] = {}
+        doc = 0
+        i = 0
+        n = len(values)
+        while i < n:
+            doc += values[i]
+            tf = values[i + 1]
+            positions = values[i + 2:i + 2 + tf]
+            for j in range(1, tf):
+                positions[j] += positions[j - 1]
+            result[doc] = positions
+            i += 2 + tf
+        return result
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # --- Consulta ---
+    def search(self, query: str | Node, limit: int = 200) -> list[SearchResult]:
+        """Parágrafos que satisfazem a consulta, do maior para o menor score BM25."""
+        return self.rank(self.match_scores(query), limit)
+
+    def match_scores(self, query: str | Node) -> dict[int, float]:
+        """Parágrafo → score BM25 de todos os que satisfazem a consulta."""
+        node = parse_query(query, self.analyzer, self.analyzer.stopwords) if isinstance(query, str) else query
+        if node is None:
+            return {}
+        evaluator = _Evaluator(self)
+        docs = evaluator.match(node)
+        scores = self.bm25(docs, query_terms(node), evaluator)
+        return {d: scores.get(d, 0.0) for d in docs}
+
+    def match_spans(self, query: str | Node) -> dict[int, list[Span]]:
+        """Parágrafo → trechos (posição inicial, final) casados por um termo, frase ou NEAR."""
+        node = parse_query(query, self.analyzer, self.analyzer.stopwords) if isinstance(query, str) else query
+        if node is None:
+            return {}
+        if not isinstance(node, (Term, Phrase, Near)):
+            raise QuerySyntaxError("Use um termo, uma \"frase\" ou NEAR (sem AND/OR/NOT)")
+        return _Evaluator(self).spans(node)
+
+    def hit_spans(self, query: str | Node, matched_only: bool = True) -> dict[int, list[Span]]:
+        """Parágrafo → trechos a destacar: acertos de cada termo, frase ou NEAR não negado.
+
+        Frases e NEAR entram só inteiros e stopwords soltas nunca entram (um
+        "do" fora da frase "Trindade do Paraíso" não é acerto). Com
+        `matched_only`, só parágrafos que satisfazem a consulta toda.
+        """
+        node = parse_query(query, self.analyzer, self.analyzer.stopwords) if isinstance(query, str) else query
+        if node is None:
+            return {}
+        evaluator = _Evaluator(self)
+        docs = evaluator.match(node) if matched_only else None
+        found: dict[int, list[Span]] = {}
+        for leaf in highlight_nodes(node):
+            if isinstance(leaf, Term) and self.analyzer.is_stopword(leaf.text):
+                continue
+            for doc, spans in evaluator.spans(leaf).items():
+                if docs is None or doc in docs:
+                    found.setdefault(doc, []).extend(spans)
+        return {doc: _merge_spans(spans) for doc, spans in found.items()}
+
+    def rank(self, scores: dict[int, float], limit: int) -> list[SearchResult]:
+        """Os `limit` melhores de `match_scores` (empate: ordem do documento)."""
+        best = heapq.nlargest(limit, scores, key=lambda d: (scores[d], -d))
+        return [(self.ids[d], scores[d]) for d in best]
+
+    def bm25(self, docs: set[int], terms: Iterable[str], evaluator: '_Evaluator | None' = None) -> dict[int, float]:
+        n = len(self.ids)
+        avgdl = self.avgdl or 1.0
+        scores: dict[int, float] = {}
+        for term in dict.fromkeys(terms):
+            df = self.doc_freq(term)
+            if not df:
+                continue
+            idf = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+            postings = evaluator.postings(term) if evaluator else self.postings(term)
+            for doc in docs:
+                positions = postings.get(doc)
+                if positions:
+                    tf = len(positions)
+                    norm = BM25_K1 * (1.0 - BM25_B + BM25_B * self.lengths[doc] / avgdl)
+                    scores[doc] = scores.get(doc, 0.0) + idf * tf * (BM25_K1 + 1.0) / (tf + norm)
+        return scores
+
+
+def _merge_spans(spans: list[Span]) -> list[Span]:
+    """Trechos ordenados, com os sobrepostos (ex.: NEAR e um de seus termos) unidos."""
+    merged: list[Span] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class _Evaluator:
+    """Avalia a árvore da consulta com cache de postings decodificados."""
+
+    def __init__(self, index: PositionalIndex) -> None:
+        self.index = index
+        self._cache: dict[str, dict[int, list[int]]] = {}
+
+    def postings(self, term: str) -> dict[int, list[int]]:
+        cached = self._cache.get(term)
+        if cached is None:
+            cached = self._cache[term] = self.index.postings(term)
+        return cached
+
+    def spans(self, node: Node) -> dict[int, list[Span]]:
+        """Trechos casados por termo, frase ou NEAR, por parágrafo."""
+        if isinstance(node, Term):
+            return {doc: [(p, p) for p in positions] for doc, positions in self.postings(node.text).items()}
+        if isinstance(node, Phrase):
+            lists = [self.postings(t) for t in node.terms]
+            if not all(lists):
+                return {}
+            first = min(range(len(lists)), key=lambda i: len(lists[i]))
+            result: dict[int, list[Span]] = {}
+            for doc in lists[first]:
+                if not all(doc in p for p in lists):
+                    continue
+                sets = [set(p[doc]) for p in lists]
+                starts = [s for s in lists[0][doc] if all(s + i in sets[i] for i in range(1, len(sets)))]
+                if starts:
+                    result[doc] = [(s, s + len(lists) - 1) for s in starts]
+            return result
+        if isinstance(node, Near):
+            left = self.spans(node.left)
+            right = self.spans(node.right)
+            result = {}
+            for doc in left.keys() & right.keys():
+                found = [
+                    (min(sa, sb), max(ea, eb))
+                    for sa, ea in left[doc] for sb, eb in right[doc]
+                    if max(sb - ea, sa - eb) <= node.distance
+                ]
+                if found:
+                    result[doc] = found
+            return result
+        raise TypeError(f"Nó sem posições: {node!r}")
+
+    def match(self, node: Node) -> set[int]:
+        if isinstance(node, Term):
+            return set(self.postings(node.text))
+        if isinstance(node, (Phrase, Near)):
+            return set(self.spans(node))
+        if isinstance(node, Or):
+            docs: set[int] = set()
+            for child in node.children:
+                docs |= self.match(child)
+            return docs
+        if isinstance(node, And):
+            positives = [c for c in node.children if not isinstance(c, Not)]
+            negatives = [c.child for c in node.children if isinstance(c, Not)]
+            docs = set(range(len(self.index))) if not positives else None
+            for child in sorted(positives, key=self._estimate):
+                matched = self.match(child)
+                docs = matched if docs is None else docs & matched
+                if not docs:
+                    return set()
+            for child in negatives:
+                docs -= self.match(child)
+            return docs
+        if isinstance(node, Not):
+            return set(range(len(self.index))) - self.match(node.child)
+        raise TypeError(f"Nó desconhecido: {node!r}")
+
+    def _estimate(self, node: Node) -> int:
+        """Custo aproximado (df) para avaliar primeiro o lado mais seletivo do AND."""
+        if isinstance(node, Term):
+            return self.index.doc_freq(node.text)
+        if isinstance(node, Phrase):
+            return min((self.index.doc_freq(t) for t in node.terms), default=0)
+        if isinstance(node, Near):
+            return min(self._estimate(node.left), self._estimate(node.right))
+        return len(self.index)
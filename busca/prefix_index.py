@@ -0,0 +1,150 @@
+"""Índice de prefixos do vocabulário para autocompletar a Busca.
+
+O vocabulário do índice posicional (termos analisados, já em ordem) fica em
+dois blobs UTF-8 com offsets `uint32`: os termos, usados na busca binária
+(`bisect` sobre uma visão dos bytes, sem criar uma lista de `str`), e a forma
+de exibição mais frequente de cada termo no texto ('paraíso' para
+'paraiso'). O df (`int32`) ordena as sugestões: os termos com o prefixo formam
+um intervalo contíguo e só os `limit` maiores df saem de `argpartition`.
+
+Para 100 mil termos são poucos MB (blobs + 3 arrays de 4 bytes por termo) e
+cada consulta custa ~2·log₂(n) comparações de bytes mais um `argpartition`
+no intervalo. Gravado em `.search_prefix.npz` ao lado do índice e
+invalidado pela mesma impressão digital.
+"""
+from __future__ import annotations
+
+import json
+import os
+from bisect import bisect_left
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+from .analyzer import TOKEN_RE, Analyzer, fold, get_analyzer
+
+PREFIX_VERSION = 1
+PREFIX_NAME = '.search_prefix.npz'
+DEFAULT_LIMIT = 10
+MIN_PREFIX = 2
+
+Suggestion = tuple[str, int]  # (forma de exibição, df)
+
+
+def _pack(strings: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.uint32)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+
+class _Packed(Sequence):
+    """Visão indexável (bytes) de um blob + offsets, para `bisect`.
+
+    Uma única cópia de cada dado: `blob` é um array sobre o próprio `bytes`
+    fatiado na busca, e os offsets são lidos por uma `memoryview` do array
+    `uint32` (sem lista de `int` do Python).
+    """
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray) -> None:
+        self._blob = blob.tobytes()
+        self.blob = np.frombuffer(self._blob, dtype=np.uint8)
+        self.offsets = np.ascontiguousarray(offsets, dtype=np.uint32)
+        self._offsets = memoryview(self.offsets).cast('B').cast('I')
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):  # type: ignore[override]
+        return self._blob[self._offsets[i]:self._offsets[i + 1]]
+
+    def text(self, i: int) -> str:
+        return self[i].decode('utf-8')
+
+
+class PrefixIndex:
+    """Termos ordenados + df + forma de exibição; `suggest(prefixo)` devolve os mais frequentes."""
+
+    def __init__(self, terms: np.ndarray, term_offsets: np.ndarray, df: np.ndarray,
+                 display: np.ndarray, display_offsets: np.ndarray, meta: dict[str, Any] | None = None,
+                 analyzer: Analyzer | None = None) -> None:
+        self.terms = _Packed(terms, term_offsets)
+        self.display = _Packed(display, display_offsets)
+        self.arrays = {'terms': self.terms.blob, 'term_offsets': self.terms.offsets, 'df': df,
+                       'display': self.display.blob, 'display_offsets': self.display.offsets}
+        self.df = df
+        self.meta = meta or {}
+        self.analyzer = analyzer or get_analyzer()
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    @property
+    def nbytes(self) -> int:
+        """Memória do índice: os arrays são os próprios dados consultados (blobs e offsets sem outra cópia)."""
+        return sum(a.nbytes for a in self.arrays.values())
+
+    # --- Construção ---
+    @classmethod
+    def build(cls, terms: Iterable[tuple[str, int]], texts: Iterable[str], meta: dict[str, Any] | None = None,
+              analyzer: Analyzer | None = None) -> 'PrefixIndex':
+        """`terms`: (termo analisado, df) em ordem; `texts` dão a forma de exibição de cada termo."""
+        analyzer = analyzer or get_analyzer()
+        stopwords = analyzer.stopwords
+        entries = [(t, n) for t, n in terms if t not in stopwords]
+        surfaces: Counter[str] = Counter()
+        for text in texts:
+            surfaces.update(TOKEN_RE.findall(text.casefold()))
+        best: dict[str, tuple[int, str]] = {}
+        for surface, count in surfaces.items():
+            term = analyzer.term(surface)
+            if count > best.get(term, (0, ''))[0]:
+                best[term] = (count, surface)
+        term_blob, term_offsets = _pack([t for t, _ in entries])
+        display_blob, display_offsets = _pack([best.get(t, (0, t))[1] for t, _ in entries])
+        df = np.fromiter((n for _, n in entries), dtype=np.int32, count=len(entries))
+        return cls(term_blob, term_offsets, df, display_blob, display_offsets, meta, analyzer)
+
+    # --- Persistência ---
+    def save(self, path: Path) -> None:
+        header = {'version': PREFIX_VERSION, 'language': self.analyzer.language,
+                  'analyzer': self.analyzer.signature, 'meta': self.meta}
+        tmp = Path(path).with_suffix('.tmp.npz')
+        np.savez(tmp, header=np.array(json.dumps(header, ensure_ascii=False)), **self.arrays)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> 'PrefixIndex':
+        with np.load(path, allow_pickle=False) as data:
+            header = json.loads(str(data['header']))
+            if header.get('version') != PREFIX_VERSION:
+                raise ValueError(f"Versão de prefixos incompatível: {path}")
+            analyzer = get_analyzer(header.get('language', ''))
+            if header.get('analyzer') != analyzer.signature:
+                raise ValueError(f"Prefixos gravados com outro analisador: {path}")
+            arrays = {name: data[name] for name in ('terms', 'term_offsets', 'df', 'display', 'display_offsets')}
+        if len(arrays['term_offsets']) != len(arrays['df']) + 1 or len(arrays['display_offsets']) != len(arrays['df']) + 1:
+            raise ValueError(f"Prefixos inconsistentes: {path}")
+        return cls(**arrays, meta=header.get('meta'), analyzer=analyzer)
+
+    # --- Consulta ---
+    def range(self, prefix: str) -> tuple[int, int]:
+        """Intervalo [lo, hi) dos termos que começam com `prefix` (dobrado, sem stemmer)."""
+        key = fold(prefix).encode('utf-8')
+        lo = bisect_left(self.terms, key)
+        hi = bisect_left(self.terms, key + b'\xff', lo)  # 0xFF nunca aparece em UTF-8
+        return lo, hi
+
+    def suggest(self, prefix: str, limit: int = DEFAULT_LIMIT) -> list[Suggestion]:
+        """Até `limit` termos com o prefixo, do maior para o menor df (empate: ordem alfabética)."""
+        if len(prefix) < MIN_PREFIX or limit <= 0:
+            return []
+        lo, hi = self.range(prefix)
+        if hi <= lo:
+            return []
+        df = self.df[lo:hi]
+        top = np.argpartition(-df, limit - 1)[:limit] if hi - lo > limit else np.arange(hi - lo)
+        top = top[np.lexsort((top, -df[top]))]
+        return [(self.display.text(lo + i), int(df[i])) for i in top.tolist()]
@@ -0,0 +1,260 @@
+"""Linguagem de consulta da Busca.
+
+Sintaxe (operadores só em maiúsculas; 'e'/'ou' minúsculos são palavras):
+    Ajustador Pensamento           AND implícito
+    "Trindade do Paraíso"          frase exata
+    luz NEAR/5 vida                até 5 posições de distância (NEAR = NEAR/10)
+    amor OR misericórdia           também OU
+    fé AND NOT medo                também E / NÃO / NAO, ou prefixo '-': fé -medo
+    (luz OR vida) AND "Filho Criador"
+
+Precedência: NOT > NEAR > AND > OR. `parse_query` recebe o analisador do
+índice, para que termos da consulta e do texto sejam normalizados da mesma
+forma (uma palavra que vira vários tokens, como 'Thought-Adjuster', é
+tratada como frase). Stopwords soltas ('de', 'the') são ignoradas; dentro
+de frases e como operando de NEAR continuam valendo.
+"""
+from __future__ import annotations
+
+import re
+from typing import Callable, Collection
+
+DEFAULT_NEAR_DISTANCE = 10
+
+AND_WORDS = {'AND', 'E'}
+OR_WORDS = {'OR', 'OU'}
+NOT_WORDS = {'NOT', 'NÃO', 'NAO'}
+
+QUERY_TOKEN_RE = re.compile(
+    r'"(?P<phrase>[^"]*)"?'
+    r'|(?P<lpar>\()|(?P<rpar>\))'
+    r'|(?P<near>(?:NEAR|PERTO)(?:/(?P<k>\d+))?)(?=[\s("]|$)'
+    r'|(?P<neg>-)(?=[^\s-])'
+    r'|(?P<word>[^\s()"]+)'
+)
+
+
+class QuerySyntaxError(ValueError):
+    """Consulta malformada (parêntese sem par, operador sem operando...)."""
+
+
+class Node:
+    __slots__ = ()
+
+
+class Term(Node):
+    __slots__ = ('text',)
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def __repr__(self) -> str:
+        return f"Term({self.text!r})"
+
+
+class Phrase(Node):
+    __slots__ = ('terms',)
+
+    def __init__(self, terms: list[str]) -> None:
+        self.terms = tuple(terms)
+
+    def __repr__(self) -> str:
+        return f"Phrase({list(self.terms)!r})"
+
+
+class Near(Node):
+    __slots__ = ('left', 'right', 'distance')
+
+    def __init__(self, left: Node, right: Node, distance: int) -> None:
+        self.left = left
+        self.right = right
+        self.distance = distance
+
+    def __repr__(self) -> str:
+        return f"Near({self.left!r}, {self.right!r}, {self.distance})"
+
+
+class And(Node):
+    __slots__ = ('children',)
+
+    def __init__(self, children: list[Node]) -> None:
+        self.children = children
+
+    def __repr__(self) -> str:
+        return f"And({self.children!r})"
+
+
+class Or(Node):
+    __slots__ = ('children',)
+
+    def __init__(self, children: list[Node]) -> None:
+        self.children = children
+
+    def __repr__(self) -> str:
+        return f"Or({self.children!r})"
+
+
+class Not(Node):
+    __slots__ = ('child',)
+
+    def __init__(self, child: Node) -> None:
+        self.child = child
+
+    def __repr__(self) -> str:
+        return f"Not({self.child!r})"
+
+
+def lex(query: str) -> list[tuple[str, str]]:
+    """Tokens (tipo, valor): phrase, lpar, rpar, near, and, or, not, word."""
+    tokens: list[tuple[str, str]] = []
+    for m in QUERY_TOKEN_RE.finditer(query):
+        kind = m.lastgroup
+        if kind == 'k':  # grupo interno de NEAR/k
+            kind = 'near'
+        if kind == 'phrase':
+            tokens.append(('phrase', m.group('phrase')))
+        elif kind == 'near':
+            tokens.append(('near', m.group('k') or str(DEFAULT_NEAR_DISTANCE)))
+        elif kind == 'neg':
+            tokens.append(('not', '-'))
+        elif kind == 'word':
+            word = m.group('word')
+            upper = word.upper() if word.isupper() else ''
+            if upper in AND_WORDS:
+                tokens.append(('and', word))
+            elif upper in OR_WORDS:
+                tokens.append(('or', word))
+            elif upper in NOT_WORDS:
+                tokens.append(('not', word))
+            else:
+                tokens.append(('word', word))
+        else:
+            tokens.append((kind or '', m.group(0)))
+    return tokens
+
+
+class _Parser:
+    def __init__(self, tokens: list[tuple[str, str]], analyze: Callable[[str], list[str]],
+                 stopwords: Collection[str] = ()) -> None:
+        self.tokens = tokens
+        self.pos = 0
+        self.analyze = analyze
+        self.stopwords = stopwords
+
+    def peek(self) -> str | None:
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def take(self) -> tuple[str, str]:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def parse(self) -> Node | None:
+        node = self.or_expr()
+        if self.peek() is not None:
+            raise QuerySyntaxError(f"Token inesperado: {self.tokens[self.pos][1]!r}")
+        return node
+
+    def or_expr(self) -> Node | None:
+        children = [self.and_expr()]
+        while self.peek() == 'or':
+            self.take()
+            children.append(self.and_expr())
+        children = [c for c in children if c is not None]
+        if not children:
+            return None
+        return children[0] if len(children) == 1 else Or(children)
+
+    def and_expr(self) -> Node | None:
+        children = []
+        while self.peek() not in (None, 'or', 'rpar'):
+            if self.peek() == 'and':
+                self.take()
+                if self.peek() in (None, 'or', 'rpar', 'and'):
+                    raise QuerySyntaxError("AND sem operando à direita")
+                continue
+            node = self.not_expr()
+            if node is not None:
+                children.append(node)
+        if not children:
+            return None
+        return children[0] if len(children) == 1 else And(children)
+
+    def not_expr(self) -> Node | None:
+        if self.peek() == 'not':
+            self.take()
+            if self.peek() in (None, 'or', 'rpar', 'and'):
+                raise QuerySyntaxError("NOT sem operando")
+            child = self.not_expr()
+            return Not(child) if child is not None else None
+        return self.near_expr()
+
+    def near_expr(self) -> Node | None:
+        bare = self.peek() == 'word'
+        left = self.primary()
+        while self.peek() == 'near':
+            distance = int(self.take()[1])
+            right = self.primary()
+            if left is None or right is None:
+                raise QuerySyntaxError("NEAR exige termos ou frases dos dois lados")
+            if not isinstance(right, (Term, Phrase, Near)) or not isinstance(left, (Term, Phrase, Near)):
+                raise QuerySyntaxError("NEAR aceita apenas termos ou frases")
+            left = Near(left, right, distance)
+            bare = False
+        if bare and isinstance(left, Term) and left.text in self.stopwords:
+            return None
+        return left
+
+    def primary(self) -> Node | None:
+        kind = self.peek()
+        if kind is None:
+            raise QuerySyntaxError("Consulta incompleta")
+        if kind == 'lpar':
+            self.take()
+            node = self.or_expr()
+            if self.peek() != 'rpar':
+                raise QuerySyntaxError("Parêntese sem fechamento")
+            self.take()
+            return node
+        if kind in ('word', 'phrase'):
+            return self._terms(self.analyze(self.take()[1]))
+        raise QuerySyntaxError(f"Token inesperado: {self.tokens[self.pos][1]!r}")
+
+    @staticmethod
+    def _terms(terms: list[str]) -> Node | None:
+        if not terms:
+            return None  # só pontuação (ou stopwords, conforme o analisador)
+        return Term(terms[0]) if len(terms) == 1 else Phrase(terms)
+
+
+def parse_query(query: str, analyze: Callable[[str], list[str]], stopwords: Collection[str] = ()) -> Node | None:
+    """Árvore da consulta (None se vazia). Levanta `QuerySyntaxError`."""
+    return _Parser(lex(query), analyze, stopwords).parse()
+
+
+def is_plain_query(query: str) -> bool:
+    """True se a consulta só tem palavras (sem aspas, parênteses ou operadores)."""
+    tokens = lex(query)
+    return bool(tokens) and all(kind == 'word' for kind, _ in tokens)
+
+
+def query_terms(node: Node | None) -> list[str]:
+    """Termos não negados da consulta (usados no ranking e no destaque)."""
+    if node is None or isinstance(node, Not):
+        return []
+    if isinstance(node, Term):
+        return [node.text]
+    if isinstance(node, Phrase):
+        return list(node.terms)
+    if isinstance(node, Near):
+        return query_terms(node.left) + query_terms(node.right)
+    return [t for child in node.children for t in query_terms(child)]  # type: ignore[attr-defined]
+
+
+def highlight_nodes(node: Node | None) -> list[Node]:
+    """Termos, frases e NEAR não negados da consulta: os trechos que o destaque marca."""
+    if node is None or isinstance(node, Not):
+        return []
+    if isinstance(node, (Term, Phrase, Near)):
+        return [node]
+    return [n for child in node.children for n in highlight_nodes(child)]  # type: ignore[attr-defined]
@@ -0,0 +1,56 @@
+"""Cache LRU de resultados de consulta.
+
+Chave montada pelo motor: (pasta/tradução, assinatura do analisador,
+geração do índice, modo, consulta normalizada). A consulta normalizada é a
+árvore analisada (`repr` do nó) na busca exata e os termos ordenados na
+semântica, de modo que 'Paraíso  luz' e 'paraiso luz' compartilham a
+entrada. Cada entrada lembra o `limit` com que foi calculada: um pedido
+menor (ou um resultado que já veio incompleto) é servido por fatia.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+MAX_ENTRIES = 128
+
+
+class QueryCache:
+    """LRU thread-safe: chave -> (limit, resultados ranqueados)."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[int, list]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, limit: int) -> list | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                cached_limit, results = entry
+                if cached_limit >= limit or len(results) < cached_limit:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return results[:limit]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, limit: int, results: list) -> None:
+        with self._lock:
+            self._entries[key] = (limit, list(results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+query_cache = QueryCache()
@@ -0,0 +1,232 @@
+"""Busca semântica local: TF-IDF + SVD truncada (LSA) com NumPy.
+
+Cada parágrafo vira um vetor denso de `dim` dimensões (float32, normalizado),
+gravado em `.search_semantic.npy` e aberto com `mmap_mode='r'`: só as páginas
+tocadas pela consulta vão para a memória. A consulta é projetada no mesmo
+espaço pela matriz de termos (`.search_semantic_terms.npy`, já multiplicada
+pelo idf) e comparada por cosseno em blocos de linhas; os k melhores saem de
+`argpartition` (O(n)) e só eles são ordenados.
+
+Construção (sem SciPy): a matriz TF-IDF fica em CSR (indptr/indices/data)
+e a SVD é a randomizada de Halko et al. — X·Ω, iterações de potência com
+QR e SVD exata da matriz pequena Qᵀ·X. Vetores de documento = X·Vₖ, os
+mesmos que a consulta recebe (q·Vₖ). Termos vêm de `Analyzer.content_terms`
+(sem stopwords) e precisam aparecer em `min_df` parágrafos.
+"""
+from __future__ import annotations
+
+import json
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+from .analyzer import Analyzer, get_analyzer
+
+SEMANTIC_VERSION = 1
+DOCS_NAME = '.search_semantic.npy'
+TERMS_NAME = '.search_semantic_terms.npy'
+META_NAME = '.search_semantic.json'
+
+DEFAULT_DIM = 128
+OVERSAMPLE = 10
+POWER_ITERATIONS = 2
+NNZ_BLOCK = 16384   # entradas por bloco nos produtos esparsos
+SCORE_BLOCK = 8192  # linhas por bloco no cosseno sobre o memmap
+MIN_SCORE = 1e-4    # abaixo disso é ruído numérico (parágrafo sem termos em comum)
+
+SemanticResult = tuple[str, float]  # (id do parágrafo, similaridade cosseno)
+
+
+class _Csr:
+    """Matriz esparsa mínima (linhas comprimidas) para os produtos da SVD."""
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, data: np.ndarray, shape: tuple[int, int]) -> None:
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.shape = shape
+
+    def dot(self, dense: np.ndarray) -> np.ndarray:
+        """self @ dense, em blocos de NNZ_BLOCK entradas (`reduceat` por linha dentro do bloco)."""
+        dense = np.asarray(dense, dtype=np.float32)
+        data = self.data.astype(np.float32)
+        out = np.zeros((self.shape[0], dense.shape[1]), dtype=np.float32)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        for a in range(0, len(self.data), NNZ_BLOCK):
+            b = min(len(self.data), a + NNZ_BLOCK)
+            prod = data[a:b, None] * dense[self.indices[a:b]]
+            block_rows = rows[a:b]
+            starts = np.flatnonzero(np.r_[True, block_rows[1:] != block_rows[:-1]])
+            out[block_rows[starts]] += np.add.reduceat(prod, starts, axis=0)
+        return out
+
+    def transpose(self) -> '_Csr':
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        order = np.argsort(self.indices, kind='stable')
+        counts = np.bincount(self.indices, minlength=self.shape[1])
+        indptr = np.zeros(self.shape[1] + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return _Csr(indptr, rows[order], self.data[order], (self.shape[1], self.shape[0]))
+
+
+def tfidf_matrix(documents: Sequence[Sequence[str]], min_df: int = 2) -> tuple[_Csr, list[str], np.ndarray]:
+    """Matriz TF-IDF (tf sublinear, linhas L2) em CSR, vocabulário e idf."""
+    df: Counter[str] = Counter()
+    counts = [Counter(terms) for terms in documents]
+    for c in counts:
+        df.update(c.keys())
+    vocab = sorted(t for t, n in df.items() if n >= min_df)
+    position = {t: i for i, t in enumerate(vocab)}
+    n_docs = len(documents)
+    idf = np.array([np.log((1.0 + n_docs) / (1.0 + df[t])) + 1.0 for t in vocab], dtype=np.float64)
+    indptr = np.zeros(n_docs + 1, dtype=np.int64)
+    indices: list[int] = []
+    weights: list[float] = []
+    for row, c in enumerate(counts):
+        cols = [position[t] for t in c if t in position]
+        tfs = [c[vocab[j]] for j in cols]
+        indices += cols
+        weights += tfs
+        indptr[row + 1] = len(indices)
+    index_arr = np.asarray(indices, dtype=np.int64)
+    data = (1.0 + np.log(np.asarray(weights, dtype=np.float64))) * idf[index_arr]
+    cumulative = np.concatenate(([0.0], np.cumsum(data ** 2)))
+    norms = np.sqrt(cumulative[indptr[1:]] - cumulative[indptr[:-1]])
+    norms[norms == 0] = 1.0
+    data /= np.repeat(norms, np.diff(indptr))
+    return _Csr(indptr, index_arr, data, (n_docs, len(vocab))), vocab, idf
+
+
+def randomized_svd(matrix: _Csr, dim: int, seed: int = 0) -> np.ndarray:
+    """Vₖ (termos × dim) da SVD truncada de `matrix`."""
+    transposed = matrix.transpose()
+    rng = np.random.default_rng(seed)
+    width = min(dim + OVERSAMPLE, min(matrix.shape))
+    q, _ = np.linalg.qr(matrix.dot(rng.standard_normal((matrix.shape[1], width))))
+    for _ in range(POWER_ITERATIONS):
+        q, _ = np.linalg.qr(transposed.dot(q))
+        q, _ = np.linalg.qr(matrix.dot(q))
+    # Bᵀ = Xᵀ·Q (termos × width); Bᵀ = U·S·Vᵀ  =>  X ≈ Q·V·S·Uᵀ, termos = U
+    u, _s, _vt = np.linalg.svd(transposed.dot(q), full_matrices=False)
+    return u[:, :dim]
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class SemanticIndex:
+    """Vetores LSA dos parágrafos + projeção de consultas."""
+
+    def __init__(self, ids: list[str], vocab: list[str], terms: np.ndarray, docs: np.ndarray,
+                 meta: dict[str, Any] | None = None, analyzer: Analyzer | None = None) -> None:
+        self.ids = ids
+        self.vocab = {t: i for i, t in enumerate(vocab)}
+        self.terms = terms  # (termos × dim) float32, idf incluído
+        self.docs = docs    # (parágrafos × dim) float32 normalizado (memmap quando carregado)
+        self.meta = meta or {}
+        self.analyzer = analyzer or get_analyzer()
+
+    @property
+    def dim(self) -> int:
+        return int(self.docs.shape[1]) if self.docs.ndim == 2 else 0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # --- Construção ---
+    @classmethod
+    def build(cls, paragraphs: Iterable[tuple[str, str]], dim: int = DEFAULT_DIM, min_df: int = 2,
+              meta: dict[str, Any] | None = None, analyzer: Analyzer | None = None) -> 'SemanticIndex':
+        analyzer = analyzer or get_analyzer()
+        paragraphs = list(paragraphs)
+        stopwords = analyzer.stopwords
+        documents = [[t for t in terms if t not in stopwords]
+                     for terms in analyzer.analyze_batch(text for _, text in paragraphs)]
+        matrix, vocab, idf = tfidf_matrix(documents, min_df=min_df)
+        dim = max(0, min(dim, matrix.shape[0] - 1, matrix.shape[1] - 1))
+        if dim == 0:
+            terms = np.zeros((len(vocab), 0), dtype=np.float32)
+            docs = np.zeros((len(paragraphs), 0), dtype=np.float32)
+        else:
+            basis = randomized_svd(matrix, dim)
+            terms = (basis * idf[:, None]).astype(np.float32)
+            docs = _normalize_rows(matrix.dot(basis)).astype(np.float32)
+        return cls([pid for pid, _ in paragraphs], vocab, terms, docs, meta, analyzer)
+
+    # --- Persistência ---
+    def save(self, folder: Path) -> None:
+        folder = Path(folder)
+        vocab = sorted(self.vocab, key=self.vocab.__getitem__)
+        for name, array in ((DOCS_NAME, self.docs), (TERMS_NAME, self.terms)):
+            tmp = folder / (name + '.tmp')
+            with open(tmp, 'wb') as f:
+                np.save(f, np.ascontiguousarray(array, dtype=np.float32))
+            os.replace(tmp, folder / name)
+        header = {'version': SEMANTIC_VERSION, 'language': self.analyzer.language,
+                  'analyzer': self.analyzer.signature, 'ids': self.ids, 'vocab': vocab, 'meta': self.meta}
+        tmp = folder / (META_NAME + '.tmp')
+        tmp.write_text(json.dumps(header, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+        os.replace(tmp, folder / META_NAME)
+
+    @classmethod
+    def load(cls, folder: Path) -> 'SemanticIndex':
+        folder = Path(folder)
+        header = json.loads((folder / META_NAME).read_text(encoding='utf-8'))
+        if header.get('version') != SEMANTIC_VERSION:
+            raise ValueError(f"Versão de vetores incompatível: {folder / META_NAME}")
+        analyzer = get_analyzer(header.get('language', ''))
+        if header.get('analyzer') != analyzer.signature:
+            raise ValueError(f"Vetores gravados com outro analisador: {folder / META_NAME}")
+        docs = np.load(folder / DOCS_NAME, mmap_mode='r')
+        terms = np.load(folder / TERMS_NAME)
+        if docs.shape[0] != len(header['ids']) or terms.shape[0] != len(header['vocab']):
+            raise ValueError(f"Vetores inconsistentes: {folder}")
+        return cls(header['ids'], header['vocab'], terms, docs, header.get('meta'), analyzer)
+
+    # --- Consulta ---
+    def query_vectors(self, queries: Sequence[str]) -> np.ndarray:
+        """(consultas × dim) normalizado; linha zero quando nenhum termo é conhecido."""
+        out = np.zeros((len(queries), self.dim), dtype=np.float32)
+        for row, text in enumerate(queries):
+            counts = Counter(t for t in self.analyzer.content_terms(text) if t in self.vocab)
+            if not counts:
+                continue
+            cols = np.fromiter((self.vocab[t] for t in counts), dtype=np.int64, count=len(counts))
+            tf = 1.0 + np.log(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+            out[row] = tf @ self.terms[cols]
+        return _normalize_rows(out)
+
+    def scores(self, queries: Sequence[str]) -> np.ndarray:
+        """(consultas × parágrafos): cosseno, calculado em blocos de linhas do memmap."""
+        vectors = self.query_vectors(queries)
+        n = len(self.ids)
+        scores = np.zeros((len(queries), n), dtype=np.float32)
+        if not self.dim:
+            return scores
+        for start in range(0, n, SCORE_BLOCK):
+            block = np.asarray(self.docs[start:start + SCORE_BLOCK])
+            scores[:, start:start + len(block)] = vectors @ block.T
+        return scores
+
+    def rank(self, row: np.ndarray, limit: int) -> list[SemanticResult]:
+        """Os `limit` maiores cossenos de uma linha de `scores` (> MIN_SCORE)."""
+        n = len(row)
+        k = min(limit, n)
+        if k <= 0:
+            return []
+        top = np.argpartition(-row, k - 1)[:k] if k < n else np.arange(n)
+        top = top[np.argsort(-row[top], kind='stable')]
+        return [(self.ids[i], float(row[i])) for i in top if row[i] > MIN_SCORE]
+
+    def search_many(self, queries: Sequence[str], limit: int = 200) -> list[list[SemanticResult]]:
+        """Os `limit` parágrafos mais similares a cada consulta (cosseno > MIN_SCORE)."""
+        return [self.rank(row, limit) for row in self.scores(queries)]
+
+    def search(self, query: str, limit: int = 200) -> list[SemanticResult]:
+        return self.search_many([query], limit)[0]
@@ -0,0 +1,209 @@
+"""Parágrafos semelhantes: assinaturas MinHash + LSH por bandas, com NumPy.
+
+Cada parágrafo vira o conjunto de seus bigramas de termos (`content_terms`,
+sem stopwords; parágrafos de um termo só usam o próprio termo). Os bigramas
+são codificados como inteiros (id₁·V + id₂) e passam por `NUM_PERM` funções
+multiply-shift ((a·x + b) mod 2⁶⁴ >> 32, `a` ímpar), calculadas de uma vez
+para blocos de `HASH_BLOCK` bigramas; o mínimo por parágrafo sai de
+`np.minimum.reduceat`. A fração de posições iguais entre duas assinaturas
+estima a similaridade de Jaccard dos conjuntos.
+
+LSH: a assinatura é dividida em `BANDS` bandas de `ROWS` valores, cada banda
+resumida em uma chave uint64. Parágrafos com a mesma chave em alguma banda
+são candidatos (probabilidade 1 - (1 - Jᴿ)ᴮ: ~50% em J≈0,42, >99% em J≥0,7).
+O número da banda vai nos bits altos da chave, e as chaves de todas as
+bandas ficam num único vetor ordenado com a permutação correspondente: os
+`BANDS` baldes de um parágrafo saem de uma chamada vetorizada a
+`searchsorted`, os candidatos de uma única leitura da permutação, e só eles
+têm a similaridade estimada (uma leitura das linhas de assinatura).
+
+Arquivos (ao lado do índice, invalidados pela mesma impressão digital):
+`.search_similar.npy` (assinaturas), `.search_similar_keys.npy` e
+`.search_similar_order.npy` (baldes por banda), todos abertos com
+`mmap_mode='r'`, e `.search_similar.json` (ids e parâmetros).
+"""
+from __future__ import annotations
+
+import json
+import os
+from itertools import chain
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+
+from .analyzer import Analyzer, get_analyzer
+
+SIMILAR_VERSION = 2
+SIGNATURES_NAME = '.search_similar.npy'
+KEYS_NAME = '.search_similar_keys.npy'
+ORDER_NAME = '.search_similar_order.npy'
+META_NAME = '.search_similar.json'
+
+BANDS = 32
+ROWS = 4
+NUM_PERM = BANDS * ROWS
+HASH_BLOCK = 8192     # bigramas por bloco de hashing (NUM_PERM × 8 bytes cada)
+MIN_SIMILARITY = 0.2  # Jaccard estimado mínimo para listar um parágrafo
+DEFAULT_LIMIT = 50
+SEED = 0
+
+_MIX = np.uint64(0x9E3779B97F4A7C15)  # espalha os ids antes do multiply-shift
+_BAND_PRIME = np.uint64(0x100000001B3)
+_SHIFT = np.uint64(32)
+_BAND_BITS = 5  # 2⁵ = BANDS: a banda ocupa os bits altos da chave
+_BAND_PREFIX = np.arange(BANDS, dtype=np.uint64) << np.uint64(64 - _BAND_BITS)
+
+SimilarResult = tuple[str, float]  # (id do parágrafo, Jaccard estimado)
+
+
+def _permutations(seed: int = SEED) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 2 ** 63, size=NUM_PERM, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2 ** 63, size=NUM_PERM, dtype=np.uint64)
+    return a, b
+
+
+def shingles(documents: list[list[str]]) -> tuple[np.ndarray, np.ndarray]:
+    """Bigramas codificados (uint64) na ordem dos documentos e quantos cada documento tem."""
+    vocab = {t: i for i, t in enumerate(dict.fromkeys(chain.from_iterable(documents)))}
+    flat = np.fromiter(map(vocab.__getitem__, chain.from_iterable(documents)), dtype=np.uint64)
+    lengths = np.fromiter(map(len, documents), dtype=np.int64, count=len(documents))
+    size = np.uint64(len(vocab) + 1)
+    ends = np.cumsum(lengths)
+    last = np.zeros(len(flat), dtype=bool)
+    last[ends[lengths > 0] - 1] = True
+    single = np.repeat(lengths == 1, lengths)
+    keep = ~last | single
+    nxt = np.empty_like(flat)
+    nxt[:-1] = flat[1:]
+    nxt[-1:] = 0
+    # bigrama (t, próximo); termo isolado vira (t, V), fora do espaço dos bigramas
+    codes = flat * size + np.where(last, size - np.uint64(1), nxt)
+    counts = np.where(lengths > 1, lengths - 1, lengths)
+    return codes[keep], counts
+
+
+def minhash(codes: np.ndarray, counts: np.ndarray, seed: int = SEED) -> np.ndarray:
+    """Assinaturas (documentos × NUM_PERM) uint32; documentos sem bigramas ficam com o máximo."""
+    a, b = _permutations(seed)
+    signatures = np.full((len(counts), NUM_PERM), np.iinfo(np.uint32).max, dtype=np.uint32)
+    mixed = codes * _MIX
+    starts = np.concatenate(([0], np.cumsum(counts)))
+    docs = np.flatnonzero(counts)
+    i = 0
+    while i < len(docs):
+        # documentos inteiros por bloco, até HASH_BLOCK bigramas (ao menos um documento)
+        j = max(i + 1, int(np.searchsorted(starts[docs + 1], starts[docs[i]] + HASH_BLOCK, side='right')))
+        block = docs[i:j]
+        lo, hi = starts[block[0]], starts[block[-1] + 1]
+        hashed = (a[:, None] * mixed[None, lo:hi] + b[:, None]) >> _SHIFT  # permutações × bigramas
+        signatures[block] = np.minimum.reduceat(hashed, starts[block] - lo, axis=1).T
+        i = j
+    return signatures
+
+
+def band_keys(signatures: np.ndarray) -> np.ndarray:
+    """(documentos × BANDS) uint64: os ROWS valores de cada banda resumidos em uma chave, com a banda nos bits altos."""
+    bands = np.asarray(signatures, dtype=np.uint64).reshape(len(signatures), BANDS, ROWS)
+    keys = np.zeros((len(signatures), BANDS), dtype=np.uint64)
+    for r in range(ROWS):
+        keys = (keys ^ bands[:, :, r]) * _BAND_PRIME
+    return (keys >> np.uint64(_BAND_BITS)) | _BAND_PREFIX
+
+
+class SimilarIndex:
+    """Assinaturas MinHash e baldes LSH dos parágrafos de uma pasta."""
+
+    def __init__(self, ids: list[str], signatures: np.ndarray, keys: np.ndarray, order: np.ndarray,
+                 meta: dict[str, Any] | None = None, analyzer: Analyzer | None = None) -> None:
+        self.ids = ids
+        self.rows = {pid: i for i, pid in enumerate(ids)}
+        self.signatures = signatures  # (parágrafos × NUM_PERM) uint32
+        self.keys = keys              # (BANDS·m) uint64 ordenadas (banda nos bits altos)
+        self.order = order            # (BANDS·m) int32: parágrafo de cada chave
+        self.meta = meta or {}
+        self.analyzer = analyzer or get_analyzer()
+        # vistas ndarray dos memmaps: mesmas páginas, sem o custo de memmap.__getitem__ por consulta
+        self._signatures = np.asarray(signatures)
+        self._keys = np.asarray(keys)
+        self._order = np.asarray(order)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # --- Construção ---
+    @classmethod
+    def build(cls, paragraphs: Iterable[tuple[str, str]], meta: dict[str, Any] | None = None,
+              analyzer: Analyzer | None = None) -> 'SimilarIndex':
+        analyzer = analyzer or get_analyzer()
+        paragraphs = list(paragraphs)
+        stopwords = analyzer.stopwords
+        documents = [[t for t in terms if t not in stopwords]
+                     for terms in analyzer.analyze_batch(text for _, text in paragraphs)]
+        codes, counts = shingles(documents)
+        signatures = minhash(codes, counts)
+        rows = np.flatnonzero(counts).astype(np.int32)  # parágrafos sem termos não entram nos baldes
+        keys = band_keys(signatures[rows]).ravel()
+        order = np.argsort(keys, kind='stable')
+        return cls([pid for pid, _ in paragraphs], signatures, keys[order], rows[order // BANDS], meta, analyzer)
+
+    # --- Persistência ---
+    def save(self, folder: Path) -> None:
+        folder = Path(folder)
+        for name, array in ((SIGNATURES_NAME, self.signatures), (KEYS_NAME, self.keys), (ORDER_NAME, self.order)):
+            tmp = folder / (name + '.tmp')
+            with open(tmp, 'wb') as f:
+                np.save(f, np.ascontiguousarray(array))
+            os.replace(tmp, folder / name)
+        header = {'version': SIMILAR_VERSION, 'language': self.analyzer.language, 'analyzer': self.analyzer.signature,
+                  'bands': BANDS, 'rows': ROWS, 'seed': SEED, 'ids': self.ids, 'meta': self.meta}
+        tmp = folder / (META_NAME + '.tmp')
+        tmp.write_text(json.dumps(header, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+        os.replace(tmp, folder / META_NAME)
+
+    @classmethod
+    def load(cls, folder: Path) -> 'SimilarIndex':
+        folder = Path(folder)
+        header = json.loads((folder / META_NAME).read_text(encoding='utf-8'))
+        if (header.get('version'), header.get('bands'), header.get('rows'), header.get('seed')) != (SIMILAR_VERSION, BANDS, ROWS, SEED):
+            raise ValueError(f"Assinaturas incompatíveis: {folder / META_NAME}")
+        analyzer = get_analyzer(header.get('language', ''))
+        if header.get('analyzer') != analyzer.signature:
+            raise ValueError(f"Assinaturas gravadas com outro analisador: {folder / META_NAME}")
+        signatures = np.load(folder / SIGNATURES_NAME, mmap_mode='r')
+        keys = np.load(folder / KEYS_NAME, mmap_mode='r')
+        order = np.load(folder / ORDER_NAME, mmap_mode='r')
+        if signatures.shape != (len(header['ids']), NUM_PERM) or keys.shape != order.shape or keys.ndim != 1 \
+                or len(keys) % BANDS:
+            raise ValueError(f"Assinaturas inconsistentes: {folder}")
+        return cls(header['ids'], signatures, keys, order, header.get('meta'), analyzer)
+
+    # --- Consulta ---
+    def candidates(self, row: int) -> np.ndarray:
+        """Parágrafos (ordenados) que dividem algum balde LSH com `row`, sem ele mesmo."""
+        keys = band_keys(self._signatures[row:row + 1])[0]
+        lo = self._keys.searchsorted(keys, side='left')
+        sizes = self._keys.searchsorted(keys, side='right') - lo
+        total = int(sizes.sum())
+        if not total:
+            return np.zeros(0, dtype=np.int32)
+        # posições lo..hi de todos os baldes num só vetor: uma leitura da permutação
+        positions = np.repeat(lo - (np.cumsum(sizes) - sizes), sizes) + np.arange(total)
+        rows = np.unique(self._order[positions])
+        return rows[rows != row]
+
+    def similar(self, pid: str, limit: int = DEFAULT_LIMIT, min_similarity: float = MIN_SIMILARITY) -> list[SimilarResult]:
+        """Os `limit` parágrafos mais parecidos com `pid` (Jaccard estimado), do mais ao menos parecido."""
+        row = self.rows.get(pid)
+        if row is None:
+            return []
+        rows = self.candidates(row)
+        if not len(rows):
+            return []
+        signatures = self._signatures
+        scores = (signatures[rows] == signatures[row]).mean(axis=1)
+        keep = scores >= min_similarity
+        rows, scores = rows[keep], scores[keep]
+        best = np.lexsort((rows, -scores))[:limit]
+        return [(self.ids[i], float(scores[j])) for j, i in zip(best, rows[best])]
@@ -1,5 +1,14 @@
+import html as html_lib
+import json
+import re
+import threading
+import time
 from pathlib import Path
-from typing import Tuple
+from typing import Mapping, Tuple
+
+from anchor_index import ANCHOR_TAG_RE, MARKDOWN_EXTRAS, AnchorIndex
+from perf_events import PerfEvents
+from perf_metrics import timed
 
 try:  # optional dependency
     import markdown2  # type: ignore
@@ -8,6 +17,41 @@ except Exception:  # pragma: no cover
 
 CONTENT_ROOT = Path('assets') / 'docs'
 
+# Anchor index: scanned only in a background thread; refreshed again after
+# this many seconds, or right away when a lookup misses
+ANCHOR_REFRESH_SECONDS = 30.0
+# How long a link without a file (doc://#anchor) waits for a running refresh
+ANCHOR_WAIT_SECONDS = 5.0
+
+_anchor_index: AnchorIndex | None = None
+_anchor_refreshed = 0.0  # time.monotonic() of the last finished refresh
+_anchor_thread: threading.Thread | None = None
+_anchor_lock = threading.Lock()
+
+# Windowed rendering: sections shipped around the anchor, and the size below
+# which a document is always sent whole
+WINDOW_MARGIN_SECTIONS = 1
+WINDOW_MIN_BYTES = 16 * 1024
+
+_BODY_STYLE = """<style>.__focus-anchor{outline:2px solid #ff9800;transition:outline 1s ease;} body{padding:1rem;} pre{background:#222;padding:8px;border-radius:4px;color:#eee;} code{background:#eee;padding:2px 4px;border-radius:3px;} </style>"""
+
+# Search hit highlighting: marks are injected here, the page only navigates them
+_HITS_STYLE = """<style>mark.__hit{background:#fff176;color:inherit;padding:0 1px;border-radius:2px;} mark.__hit-current{background:#ff9800;} #__hit-nav{position:fixed;top:8px;right:12px;z-index:1000;background:#fff;border:1px solid #ccd6e2;border-radius:4px;padding:2px 6px;font:12px 'Segoe UI',sans-serif;box-shadow:0 1px 4px rgba(0,0,0,.15);} #__hit-nav button{border:0;background:none;cursor:pointer;font-size:14px;padding:0 6px;}</style>"""
+
+TAG_RE = re.compile(r'<[^>]*>')
+RAW_TEXT_TAG_RE = re.compile(r'<(script|style)\b', re.IGNORECASE)
+
+# Search hits arrive as token positions per paragraph id; tokens and paragraph
+# boundaries must be counted exactly as busca.analyzer / busca.paragraphs do
+TOKEN_RE = re.compile(r'\w+')
+PARAGRAPH_TAG_RE = re.compile(ANCHOR_TAG_RE.pattern.decode('ascii'))
+HitSpans = Mapping[str, list[tuple[int, int]]]
+HIT_MARK = "<mark class='__hit' data-hit>"  # opening tag of each hit's first piece
+MARK = "<mark class='__hit'>"  # further pieces of a hit split by tags
+
+SECTION_RE = re.compile(r'<h[1-6]\b[^<>]*?\bid=["\']p\d{3}_\d{3}_000["\']', re.IGNORECASE)
+BODY_RE = re.compile(r'<body\b[^>]*>(?P<body>.*?)(?:</body>|$)', re.IGNORECASE | re.DOTALL)
+
 
 def parse_logical_link(link: str) -> Tuple[str | None, str | None]:
     """Parses logical link patterns.
@@ -15,6 +59,7 @@ def parse_logical_link(link: str) -> Tuple[str | None, str | None]:
     Expected formats:
       doc://Doc000.html#anchor_id
       doc://Doc000.html
+      doc://#anchor_id  (file looked up in the anchor index by resolve_doc_link)
     Returns (filename, anchor)
     """
     if not link.startswith('doc://'):
@@ -27,6 +72,7 @@ def parse_logical_link(link: str) -> Tuple[str | None, str | None]:
     return fname or None, anchor or None
 
 
+@timed('doc.load')
 def load_document_html(filename: str) -> str | None:
     """Loads HTML or Markdown into HTML.
 
@@ -51,7 +97,7 @@ def load_document_html(filename: str) -> str | None:
         try:
             text = md_path.read_text(encoding='utf-8')
             if markdown2:
-                return markdown2.markdown(text, extras=["fenced-code-blocks", "tables", "strike", "footnotes"])  # type: ignore
+                return markdown2.markdown(text, extras=MARKDOWN_EXTRAS)  # type: ignore
             # minimal fallback: wrap paragraphs
             paras = '\n'.join(f'<p>{p}</p>' for p in text.splitlines() if p.strip())
             return f"<div class='md-fallback'>{paras}</div>"
@@ -60,22 +106,337 @@ def load_document_html(filename: str) -> str | None:
     return None
 
 
+def _refresh_anchor_index(index: AnchorIndex) -> None:
+    """Background worker: incremental update of the index, then save.
+
+    Runs without a process pool (jobs=1): the packaged executable must not
+    spawn child processes from the UI. Readers keep using the previous
+    tables until update() swaps them in.
+    """
+    global _anchor_refreshed
+    try:
+        index.update(jobs=1)
+        index.save()
+    except Exception:
+        pass
+    if index is _anchor_index:
+        _anchor_refreshed = time.monotonic()
+
+
+def refresh_anchor_index(force: bool = False) -> threading.Thread | None:
+    """Starts a background refresh of the anchor index for CONTENT_ROOT.
+
+    Returns the running refresh thread, or None when the index is recent
+    enough (see ANCHOR_REFRESH_SECONDS) and `force` is not set.
+    """
+    global _anchor_index, _anchor_refreshed, _anchor_thread
+    with _anchor_lock:
+        if _anchor_index is None or _anchor_index.docs_dir != CONTENT_ROOT:
+            _anchor_index = AnchorIndex.load(CONTENT_ROOT)  # persisted table only, no scan
+            _anchor_refreshed = 0.0
+        if _anchor_thread is not None and _anchor_thread.is_alive():
+            return _anchor_thread
+        if not force and _anchor_refreshed and time.monotonic() - _anchor_refreshed < ANCHOR_REFRESH_SECONDS:
+            return None
+        _anchor_thread = threading.Thread(target=_refresh_anchor_index, args=(_anchor_index,),
+                                          name='AnchorIndexRefresh', daemon=True)
+        _anchor_thread.start()
+        return _anchor_thread
+
+
+def get_anchor_index(wait: float = 0.0, force: bool = False) -> AnchorIndex | None:
+    """Global anchor index for CONTENT_ROOT; never scans documents on the calling thread.
+
+    The persisted index is returned right away while a background refresh
+    picks up new and changed files. With `wait`, blocks up to that many
+    seconds for the running refresh.
+    """
+    try:
+        thread = refresh_anchor_index(force)
+    except Exception:
+        return None
+    if wait and thread is not None:
+        thread.join(wait)
+    return _anchor_index
+
+
+def owner_file(anchor: str, wait: float = 0.0) -> str | None:
+    """Logical name (DocNNN.html) of the document owning the anchor, without opening files.
+
+    A miss schedules a refresh right away: the anchor may live in a file
+    added or changed since the last scan.
+    """
+    index = get_anchor_index()
+    entry = index.lookup(anchor) if index is not None else None
+    if entry is None:
+        index = get_anchor_index(wait, force=True)
+        entry = index.lookup(anchor) if index is not None else None
+    if entry is None:
+        return None
+    return Path(entry[0]).stem + '.html'
+
+
+def has_anchor(html: str, anchor: str) -> bool:
+    """Whether the HTML carries the anchor id (plain substring test, no parsing)."""
+    return f'id="{anchor}"' in html or f"id='{anchor}'" in html
+
+
 def build_final_body(html_fragment: str, anchor: str | None) -> str:
     """Wraps loaded HTML in a container and optionally scrolls to anchor via JS."""
     scroll_js = """<script>document.addEventListener('DOMContentLoaded',()=>{const a=document.getElementById('%s');if(a){a.scrollIntoView({behavior:'smooth',block:'start'});a.classList.add('__focus-anchor');}});</script>""" % anchor if anchor else ""
-    style = """<style>.__focus-anchor{outline:2px solid #ff9800;transition:outline 1s ease;} body{padding:1rem;} pre{background:#222;padding:8px;border-radius:4px;color:#eee;} code{background:#eee;padding:2px 4px;border-radius:3px;} </style>"""
-    return f"<div class='doc-container'>{html_fragment}</div>{scroll_js}{style}"
+    return f"<div class='doc-container'>{html_fragment}</div>{scroll_js}{_BODY_STYLE}"
+
+
+class _HitMarker:
+    """Walks the text nodes of one document, counting tokens per paragraph."""
+
+    def __init__(self, hits: HitSpans) -> None:
+        self.hits = hits
+        self.spans: list[tuple[int, int]] = []
+        self.pos = 0       # token position inside the current paragraph
+        self.current = 0   # first span that may still cover a token
+        self.started = -1  # last span whose first piece was marked
+        self.count = 0
+
+    def paragraph(self, pid: str) -> None:
+        self.spans = self.hits.get(pid) or []
+        self.pos = self.current = 0
+        self.started = -1
+
+    def skip(self, text: str) -> None:
+        """Counts the tokens of a node that is never marked (<script>/<style> text)."""
+        if self.spans:
+            self.pos += len(TOKEN_RE.findall(html_lib.unescape(text) if '&' in text else text))
+
+    def mark(self, text: str) -> str:
+        """Wraps the tokens covered by hit spans; entities are decoded before counting."""
+        if self.current >= len(self.spans):
+            self.skip(text)
+            return text
+        escaped = '&' in text
+        plain = html_lib.unescape(text) if escaped else text
+        spans = self.spans
+        runs: list[list[int]] = []  # [start char, end char, span]
+        for m in TOKEN_RE.finditer(plain):
+            pos = self.pos
+            self.pos += 1
+            while self.current < len(spans) and spans[self.current][1] < pos:
+                self.current += 1
+            if self.current == len(spans) or spans[self.current][0] > pos:
+                continue
+            if runs and runs[-1][2] == self.current:
+                runs[-1][1] = m.end()
+            else:
+                runs.append([m.start(), m.end(), self.current])
+        if not runs:
+            return text
+        quote = (lambda s: html_lib.escape(s, quote=False)) if escaped else (lambda s: s)
+        parts = []
+        last = 0
+        for start, end, span in runs:
+            # the first piece of a hit carries data-hit: a phrase split by tags is still one hit
+            first = span > self.started
+            if first:
+                self.started = span
+                self.count += 1
+            parts.append(quote(plain[last:start]))
+            parts.append(f"{HIT_MARK if first else MARK}{quote(plain[start:end])}</mark>")
+            last = end
+        parts.append(quote(plain[last:]))
+        return ''.join(parts)
+
+
+def mark_hits(html: str, hits: HitSpans) -> tuple[str, int]:
+    """Wraps search hits in <mark class='__hit'> while assembling the document.
+
+    `hits` maps paragraph ids to the (first, last) token positions the search
+    index matched (SearchEngine.hit_spans): tokens are counted from each
+    paragraph's anchor tag the same way the index counted them, so only
+    whole phrase/NEAR matches are marked. Tags and <script>/<style> contents
+    are left untouched. Returns the new HTML and the number of hits.
+    """
+    if not hits:
+        return html, 0
+    marker = _HitMarker(hits)
+    out: list[str] = []
+    last = 0
+    raw_tag: str | None = None
+    for m in TAG_RE.finditer(html):
+        text = html[last:m.start()]
+        if text:
+            out.append(marker.mark(text) if raw_tag is None else text)
+            if raw_tag is not None:
+                marker.skip(text)
+        tag = m.group()
+        out.append(tag)
+        if raw_tag is not None:
+            if tag[2:2 + len(raw_tag)].lower() == raw_tag and tag.startswith('</'):
+                raw_tag = None
+        else:
+            raw = RAW_TEXT_TAG_RE.match(tag)
+            if raw:
+                raw_tag = raw.group(1).lower()
+        anchor = PARAGRAPH_TAG_RE.match(tag)
+        if anchor:
+            marker.paragraph(anchor.group('id'))
+        last = m.end()
+    tail = html[last:]
+    if tail:
+        out.append(marker.mark(tail) if raw_tag is None else tail)
+    return ''.join(out), marker.count
+
+
+# Hit navigation counts hits per section in Python (windowed pages keep most
+# sections out of the DOM): global hit k -> (section, local index), loading
+# the section before scrolling to it
+_HITS_JS = """<script>(function(){
+const per=%(counts)s,windowed=%(windowed)s,total=per.reduce((a,b)=>a+b,0),first=[];
+per.reduce((a,n)=>{first.push(a);return a+n;},0);
+let cur=-1,el=null;
+function root(s){if(!windowed)return document;if(window.amadonSections)window.amadonSections.ensure(s);
+ return document.querySelector('.__doc-section[data-idx="'+s+'"]');}
+function find(k){let s=0;while(s<per.length-1&&k>=first[s]+per[s])s++;const r=root(s);
+ return r?r.querySelectorAll('mark[data-hit]')[k-first[s]]||null:null;}
+function indexOf(m){if(!windowed)return Array.from(document.querySelectorAll('mark[data-hit]')).indexOf(m);
+ const d=m.closest('.__doc-section');return first[Number(d.dataset.idx)]+Array.from(d.querySelectorAll('mark[data-hit]')).indexOf(m);}
+function update(){const n=document.getElementById('__hit-count');if(n){n.textContent=(cur<0?0:cur+1)+'/'+total;}}
+function select(m){if(el)el.classList.remove('__hit-current');el=m;if(m)m.classList.add('__hit-current');}
+function go(i){if(!total)return -1;cur=((i%%total)+total)%%total;const m=find(cur);select(m);
+ if(m)m.scrollIntoView({block:'center',behavior:'smooth'});update();return cur;}
+window.amadonHits={count:()=>total,current:()=>cur,element:()=>el,go:go,next:()=>go(cur+1),prev:()=>go(cur-1)};
+function start(){const nav=document.createElement('div');nav.id='__hit-nav';
+ nav.innerHTML="<button type='button' data-step='-1' title='Shift+F3'>&#8249;</button><span id='__hit-count'></span><button type='button' data-step='1' title='F3'>&#8250;</button>";
+ nav.addEventListener('click',e=>{const s=e.target.dataset&&e.target.dataset.step;if(s){go(cur+Number(s));}});
+ document.body.appendChild(nav);
+ document.addEventListener('keydown',e=>{if(e.key==='F3'){e.preventDefault();go(cur+(e.shiftKey?-1:1));}});
+ const a=%(anchor)s?document.getElementById(%(anchor)s):null;const m=a?a.querySelector('mark[data-hit]'):null;
+ if(m){cur=indexOf(m);select(m);}
+ update();}
+if(document.readyState==='loading'){document.addEventListener('DOMContentLoaded',start);}else{start();}
+})();</script>"""
+
+
+def build_hits_script(anchor: str | None, counts: list[int], windowed: bool = False) -> str:
+    """Hit navigation API (window.amadonHits: next/prev/go/count, F3/Shift+F3 and a small counter).
+
+    `counts` has the number of hits per section of a windowed page, or a
+    single total for a whole document; the counter never depends on which
+    sections are already in the DOM.
+    """
+    params = {'counts': json.dumps(counts), 'windowed': json.dumps(windowed), 'anchor': json.dumps(anchor)}
+    return (_HITS_JS % params) + _HITS_STYLE
+
+
+def split_sections(html: str) -> list[str]:
+    """Splits a document at its section headings (ids pAAA_BBB_000).
+
+    Only the <body> content is kept when a full page is given. Anything
+    before the first heading stays with the first section.
+    """
+    m = BODY_RE.search(html)
+    if m:
+        html = m.group('body')
+    starts = [h.start() for h in SECTION_RE.finditer(html)] or [0]
+    starts[0] = 0
+    bounds = starts + [len(html)]
+    return [html[bounds[i]:bounds[i + 1]] for i in range(len(starts))]
+
+
+def section_of(html_sections: list[str], anchor: str | None) -> int:
+    """Index of the section containing the anchor id (0 if absent)."""
+    if not anchor:
+        return 0
+    for i, sec in enumerate(html_sections):
+        if has_anchor(sec, anchor):
+            return i
+    return 0
+
+
+_WINDOW_JS = """<script>(function(){
+const el=document.getElementById('__doc-sections-data');if(!el)return;
+const data=JSON.parse(el.textContent);const box=document.getElementById('__doc-sections');
+let lo=%(lo)d,hi=%(hi)d;const top=document.getElementById('__doc-top'),bottom=document.getElementById('__doc-bottom');
+function add(i,before){const d=document.createElement('div');d.className='__doc-section';d.dataset.idx=i;d.innerHTML=data[i];data[i]=null;
+ if(before){const se=document.scrollingElement,h=se.scrollHeight;box.insertBefore(d,box.firstChild);se.scrollTop+=se.scrollHeight-h;}else{box.appendChild(d);}}
+window.amadonSections={ensure:i=>{while(hi<i){add(++hi,false);}while(lo>i){add(--lo,true);}}};
+const io=new IntersectionObserver(es=>{for(const e of es){if(!e.isIntersecting)continue;
+ if(e.target===bottom&&hi<data.length-1){add(++hi,false);}else if(e.target===top&&lo>0){add(--lo,true);}else{continue;}
+ io.unobserve(e.target);io.observe(e.target);}},{rootMargin:'600px 0px'});
+function start(){const a=%(anchor)s?document.getElementById(%(anchor)s):null;
+ if(a){a.scrollIntoView({block:'start'});a.classList.add('__focus-anchor');}
+ requestAnimationFrame(()=>{io.observe(bottom);io.observe(top);});}
+if(document.readyState==='loading'){document.addEventListener('DOMContentLoaded',start);}else{start();}
+})();</script>"""
+
+
+def build_windowed_body(html_fragment: str, anchor: str | None,
+                        margin: int = WINDOW_MARGIN_SECTIONS, hits: int = 0) -> str:
+    """Ships only the anchor's section plus `margin` sections on each side.
+
+    The remaining sections travel as an inert JSON block (not parsed as HTML
+    nor laid out) and are inserted by an IntersectionObserver as the reader
+    scrolls up or down, or when hit navigation jumps to them
+    (window.amadonSections.ensure), so time to first paragraph does not
+    depend on the document length. Small documents fall back to
+    build_final_body. With `hits` (marks from mark_hits), the hit navigation
+    is appended with the per-section counts.
+    """
+    sections = split_sections(html_fragment) if len(html_fragment) >= WINDOW_MIN_BYTES else []
+    if len(sections) <= 2 * margin + 1:
+        body = build_final_body(html_fragment, anchor)
+        return body + build_hits_script(anchor, [hits]) if hits else body
+    idx = section_of(sections, anchor)
+    lo = max(0, idx - margin)
+    hi = min(len(sections) - 1, idx + margin)
+    initial = ''.join(f"<div class='__doc-section' data-idx='{i}'>{sections[i]}</div>" for i in range(lo, hi + 1))
+    pending = [None if lo <= i <= hi else sec for i, sec in enumerate(sections)]
+    data = json.dumps(pending, ensure_ascii=False).replace('</', '<\\/')
+    script = _WINDOW_JS % {'lo': lo, 'hi': hi, 'anchor': json.dumps(anchor)}
+    if hits:
+        script += build_hits_script(anchor, [sec.count(HIT_MARK) for sec in sections], windowed=True)
+    return (f"<div class='doc-container doc-windowed' data-sections='{len(sections)}'>"
+            f"<div id='__doc-top'></div><div id='__doc-sections'>{initial}</div><div id='__doc-bottom'></div></div>"
+            f"<script type='application/json' id='__doc-sections-data'>{data}</script>{script}{_BODY_STYLE}")
 
 
-def resolve_doc_link(link: str) -> str:
+def resolve_doc_link(link: str, windowed: bool = False, highlight: HitSpans | None = None) -> str:
     """Resolves a logical doc:// link into HTML body.
 
+    The requested file is checked for the anchor first; only when the anchor
+    is missing there (or no file is given) does the global anchor index pick
+    the owning document.
+    With windowed=True only the sections around the anchor are rendered up
+    front (see build_windowed_body); it needs a JS-capable view.
+    With highlight (paragraph id -> token spans), search hits are marked
+    during assembly (see mark_hits) and the page gets the hit navigation API.
     Returns an informative HTML fragment if not found.
     """
-    filename, anchor = parse_logical_link(link)
-    if not filename:
-        return f"<div class='alert alert-warning'>Link inválido: {link}</div>"
-    content = load_document_html(filename)
-    if not content:
-        return f"<div class='alert alert-danger'>Conteúdo não encontrado para <code>{filename}</code>.</div>"
-    return build_final_body(content, anchor)
+    with PerfEvents.span('doc.resolve', link=link) as ev:
+        filename, anchor = parse_logical_link(link)
+        content = load_document_html(filename) if filename else None
+        if anchor and not (content and has_anchor(content, anchor)):
+            # doc://#pAAA_BBB_CCC, or a cross reference pointing to another document
+            owner = owner_file(anchor, wait=0.0 if content else ANCHOR_WAIT_SECONDS)
+            if owner and owner != filename:
+                owner_content = load_document_html(owner)
+                if owner_content:
+                    filename, content = owner, owner_content
+                    ev['via_index'] = True
+        if not filename:
+            ev['found'] = False
+            return f"<div class='alert alert-warning'>Link inválido: {link}</div>"
+        if not content:
+            ev['found'] = False
+            return f"<div class='alert alert-danger'>Conteúdo não encontrado para <code>{filename}</code>.</div>"
+        ev['found'] = True
+        ev['bytes'] = len(content)
+        hits = 0
+        if highlight is not None:
+            content, hits = mark_hits(content, highlight)
+            ev['hits'] = hits
+        if windowed:
+            body = build_windowed_body(content, anchor, hits=hits)
+            ev['shipped_bytes'] = len(body)
+            return body
+        body = build_final_body(content, anchor)
+        return body + build_hits_script(anchor, [hits]) if hits else body
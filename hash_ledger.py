@@ -0,0 +1,181 @@
+"""Registro de MD5 já verificados (caminho → tamanho, mtime, inode, hash).
+
+Evita recalcular o MD5 de arquivos grandes (TR###.gz) quando nada mudou: se
+tamanho, mtime_ns e inode conferem com o registro, o hash gravado vale. A
+verificação profunda (`deep=True`) ignora o registro e recalcula tudo, em
+paralelo entre arquivos (hashlib libera o GIL durante o cálculo).
+
+O registro fica em `.md5_ledger.json` na pasta informada (ex.: doc_sources).
+
+Uso:
+    from hash_ledger import get_ledger
+    ledger = get_ledger(Path('doc_sources'))
+    ledger.verify(Path('doc_sources/TR034.gz'), expected_md5)
+    ledger.md5_many(paths, deep=True)   # verificação profunda
+    ledger.save()
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+LEDGER_NAME = '.md5_ledger.json'
+LEDGER_VERSION = 1
+CHUNK_SIZE = 1024 * 1024
+
+
+def compute_md5(path: Path, chunk_size: int = CHUNK_SIZE) -> str:
+    h = hashlib.md5()
+    with open(path, 'rb') as fbin:
+        for chunk in iter(lambda: fbin.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest().lower()
+
+
+def _fingerprint(st: os.stat_result) -> list[int]:
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+class HashLedger:
+    """MD5 por arquivo, válido enquanto tamanho/mtime/inode não mudarem."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.path = self.root / LEDGER_NAME
+        self._entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, root: Path) -> 'HashLedger':
+        """Carrega o registro persistido (vazio se ausente, corrompido ou de outra versão)."""
+        ledger = cls(root)
+        try:
+            data = json.loads(ledger.path.read_text(encoding='utf-8'))
+            if data.get('version') == LEDGER_VERSION:
+                ledger._entries = data.get('files', {})
+        except Exception:
+            ledger._entries = {}
+        return ledger
+
+    def save(self) -> None:
+        with self._lock:
+            if not self.dirty:
+                return
+            payload = json.dumps({'version': LEDGER_VERSION, 'files': self._entries}, separators=(',', ':'))
+            self.dirty = False
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(payload, encoding='utf-8')
+            os.replace(tmp, self.path)
+        except Exception:  # registro é opcional: pasta somente leitura, etc.
+            tmp.unlink(missing_ok=True)
+
+    def _key(self, path: Path) -> str:
+        try:
+            return Path(path).relative_to(self.root).as_posix()
+        except ValueError:
+            return str(Path(path).resolve())
+
+    def cached(self, path: Path) -> str | None:
+        """Hash registrado se o arquivo não mudou desde então; None caso contrário."""
+        try:
+            fp = _fingerprint(Path(path).stat())
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._entries.get(self._key(path))
+        if entry and entry.get('fp') == fp:
+            return entry.get('md5')
+        return None
+
+    def record(self, path: Path, digest: str) -> None:
+        """Registra um hash já conhecido (ex.: calculado sobre os bytes baixados)."""
+        fp = _fingerprint(Path(path).stat())
+        with self._lock:
+            self._entries[self._key(path)] = {'fp': fp, 'md5': digest.lower()}
+            self.dirty = True
+
+    def forget(self, path: Path) -> None:
+        with self._lock:
+            if self._entries.pop(self._key(path), None) is not None:
+                self.dirty = True
+
+    def md5(self, path: Path, deep: bool = False) -> str:
+        """MD5 do arquivo; usa o registro, a menos que `deep` seja True."""
+        if not deep:
+            digest = self.cached(path)
+            if digest is not None:
+                with self._lock:
+                    self.hits += 1
+                return digest
+        st = Path(path).stat()
+        digest = compute_md5(path)
+        with self._lock:
+            self.misses += 1
+            # só registra se o arquivo não mudou durante a leitura
+            if _fingerprint(Path(path).stat()) == _fingerprint(st):
+                self._entries[self._key(path)] = {'fp': _fingerprint(st), 'md5': digest}
+                self.dirty = True
+        return digest
+
+    def md5_many(self, paths: Iterable[Path], deep: bool = False, jobs: int | None = None) -> dict[Path, str | None]:
+        """MD5 de vários arquivos; os que precisam de cálculo rodam em paralelo.
+
+        Arquivos inexistentes ou ilegíveis retornam None.
+        """
+        paths = list(dict.fromkeys(Path(p) for p in paths))
+        result: dict[Path, str | None] = {}
+        pending: list[Path] = []
+        for path in paths:
+            digest = None if deep else self.cached(path)
+            if digest is not None:
+                with self._lock:
+                    self.hits += 1
+                result[path] = digest
+            else:
+                pending.append(path)
+
+        def _one(path: Path) -> str | None:
+            try:
+                return self.md5(path, deep=True)
+            except OSError:
+                return None
+
+        if len(pending) > 1:
+            workers = min(len(pending), jobs or (os.cpu_count() or 1) + 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for path, digest in zip(pending, pool.map(_one, pending)):
+                    result[path] = digest
+        else:
+            for path in pending:
+                result[path] = _one(path)
+        return {p: result[p] for p in paths}
+
+    def verify(self, path: Path, expected: str, deep: bool = False) -> bool:
+        try:
+            return self.md5(path, deep=deep) == expected.strip().lower()
+        except OSError:
+            return False
+
+
+_shared: dict[Path, HashLedger] = {}
+_shared_lock = threading.Lock()
+
+
+def get_ledger(root: Path) -> HashLedger:
+    """Instância compartilhada do registro da pasta `root` (carregada uma vez)."""
+    key = Path(root).resolve()
+    with _shared_lock:
+        ledger = _shared.get(key)
+        if ledger is None:
+            ledger = _shared[key] = HashLedger.load(Path(root))
+        return ledger
@@ -1,29 +1,84 @@
 """
 Configuração avançada de logging para a aplicação Amadon
 Similar ao log4net, permite configuração flexível dos logs
+
+Os handlers de arquivo/console não são chamados na thread de quem registra a
+mensagem: o logger recebe apenas um QueueHandler (fila limitada) e um
+QueueListener em thread própria faz a E/S. Assim, logs DEBUG volumosos
+durante downloads não travam a thread da interface.
 """
+import atexit
 import logging
 import logging.handlers
+import queue
 from pathlib import Path
 from datetime import datetime
 
 
+# Políticas de transbordo da fila de logging
+QUEUE_POLICY_DROP = 'drop'    # descarta registros < ERROR quando a fila está cheia
+QUEUE_POLICY_BLOCK = 'block'  # aguarda espaço na fila (até block_timeout segundos)
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler com fila limitada e política de transbordo configurável.
+
+    - 'drop': se a fila estiver cheia, registros abaixo de ERROR são descartados
+      (contabilizados em `dropped`); erros aguardam até `block_timeout`.
+    - 'block': qualquer registro aguarda até `block_timeout` por espaço na fila.
+
+    Se mesmo após a espera não houver espaço, o registro é descartado para
+    nunca travar indefinidamente quem está registrando.
+    """
+
+    def __init__(self, q: queue.Queue, policy: str = QUEUE_POLICY_DROP, block_timeout: float = 2.0):
+        super().__init__(q)
+        if policy not in (QUEUE_POLICY_DROP, QUEUE_POLICY_BLOCK):
+            raise ValueError(f"Política de fila inválida: {policy}")
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+
+    def enqueue(self, record):
+        wait = self.policy == QUEUE_POLICY_BLOCK or record.levelno >= logging.ERROR
+        try:
+            if wait:
+                self.queue.put(record, block=True, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
 class AmadonLoggingConfig:
     """Configurador de logging para a aplicação Amadon"""
+
+    # Pipelines ativos por nome de logger: (listener, queue_handler, handlers)
+    _pipelines: dict[str, tuple] = {}
+    _atexit_registered = False
     
     @staticmethod
-    def setup_advanced_logging(logger_name='Amadon', log_level=logging.DEBUG):
+    def setup_advanced_logging(logger_name='Amadon', log_level=logging.DEBUG,
+                               use_queue=True, queue_size=10000,
+                               queue_policy=QUEUE_POLICY_DROP):
         """
         Configura um sistema de logging avançado
         
         Args:
             logger_name (str): Nome do logger
             log_level: Nível de log (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            use_queue (bool): Se True, a E/S dos handlers ocorre em thread própria
+                (QueueHandler/QueueListener). Se False, handlers síncronos.
+            queue_size (int): Capacidade máxima da fila de registros.
+            queue_policy (str): 'drop' ou 'block' quando a fila estiver cheia.
         
         Returns:
             logging.Logger: Logger configurado
         """
         
+        # Encerra pipeline anterior (esvazia a fila antes de reconfigurar)
+        AmadonLoggingConfig._detach(logger_name)
+
         # Cria o logger
         logger = logging.getLogger(logger_name)
         logger.setLevel(log_level)
@@ -83,16 +138,119 @@ class AmadonLoggingConfig:
         daily_handler.setLevel(logging.INFO)
         daily_handler.setFormatter(detailed_formatter)
         
-        # Adiciona os handlers
-        logger.addHandler(main_file_handler)
-        logger.addHandler(error_file_handler)
-        logger.addHandler(console_handler)
-        logger.addHandler(daily_handler)
+        handlers = [main_file_handler, error_file_handler, console_handler, daily_handler]
+        AmadonLoggingConfig._attach(logger, handlers, use_queue, queue_size, queue_policy)
         
         # Evita propagação para o logger raiz
         logger.propagate = False
         
         return logger
+
+    @staticmethod
+    def setup_perf_logging(logger_name='AmadonPerf', path=None, queue_size=10000):
+        """
+        Configura o canal de eventos de desempenho (uma linha JSON por registro)
+
+        A mensagem de cada registro já é o JSON pronto (ver `perf_events`);
+        aqui apenas se grava a linha em arquivo, pelo mesmo pipeline assíncrono.
+
+        Args:
+            logger_name (str): Nome do logger de eventos
+            path: Caminho do arquivo (default: logs/amadon_perf.jsonl)
+            queue_size (int): Capacidade máxima da fila de eventos
+
+        Returns:
+            logging.Logger: Logger configurado
+        """
+        AmadonLoggingConfig._detach(logger_name)
+        logger = logging.getLogger(logger_name)
+        logger.setLevel(logging.INFO)
+        if logger.handlers:
+            logger.handlers.clear()
+        target = Path(path) if path is not None else Path("logs") / 'amadon_perf.jsonl'
+        target.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            target,
+            maxBytes=20*1024*1024,  # 20MB
+            backupCount=3,
+            encoding='utf-8'
+        )
+        file_handler.setLevel(logging.INFO)
+        file_handler.setFormatter(logging.Formatter('%(message)s'))
+        AmadonLoggingConfig._attach(logger, [file_handler], True, queue_size, QUEUE_POLICY_DROP)
+        logger.propagate = False
+        return logger
+
+    @staticmethod
+    def _attach(logger, handlers, use_queue, queue_size, queue_policy):
+        """Liga os handlers ao logger, diretamente ou via fila + listener."""
+        if not use_queue:
+            for handler in handlers:
+                logger.addHandler(handler)
+            AmadonLoggingConfig._pipelines[logger.name] = (None, None, handlers)
+            return
+        # Logger só enfileira; o listener despacha para os handlers reais
+        log_queue: queue.Queue = queue.Queue(maxsize=max(1, int(queue_size)))
+        queue_handler = BoundedQueueHandler(log_queue, policy=queue_policy)
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        logger.addHandler(queue_handler)
+        AmadonLoggingConfig._pipelines[logger.name] = (listener, queue_handler, handlers)
+        if not AmadonLoggingConfig._atexit_registered:
+            atexit.register(AmadonLoggingConfig.shutdown)
+            AmadonLoggingConfig._atexit_registered = True
+
+    @staticmethod
+    def _detach(logger_name):
+        """Esvazia a fila do logger indicado, encerra o listener e fecha os handlers."""
+        pipeline = AmadonLoggingConfig._pipelines.pop(logger_name, None)
+        if pipeline is None:
+            return
+        listener, queue_handler, handlers = pipeline
+        logger = logging.getLogger(logger_name)
+        if queue_handler is not None:
+            logger.removeHandler(queue_handler)
+        else:
+            for handler in handlers:
+                logger.removeHandler(handler)
+        if listener is not None:
+            # stop() processa todos os registros pendentes antes de retornar
+            listener.stop()
+        if queue_handler is not None and queue_handler.dropped:
+            record = logging.LogRecord(
+                logger_name, logging.WARNING, __file__, 0,
+                'Fila de logging cheia: %d registros descartados', (queue_handler.dropped,), None,
+            )
+            for handler in handlers:
+                if record.levelno >= handler.level:
+                    try:
+                        handler.handle(record)
+                    except Exception:
+                        pass
+        for handler in handlers:
+            try:
+                handler.flush()
+                handler.close()
+            except Exception:
+                pass
+
+    @staticmethod
+    def shutdown():
+        """Esvazia as filas de logging, encerra os listeners e fecha os handlers.
+
+        Seguro para chamar mais de uma vez (também registrado via atexit).
+        Registros descartados por fila cheia são informados nos próprios logs.
+        """
+        for logger_name in list(AmadonLoggingConfig._pipelines):
+            AmadonLoggingConfig._detach(logger_name)
+
+    @staticmethod
+    def dropped_records(logger_name='Amadon') -> int:
+        """Quantidade de registros descartados por fila cheia desde o setup."""
+        pipeline = AmadonLoggingConfig._pipelines.get(logger_name)
+        if pipeline is None or pipeline[1] is None:
+            return 0
+        return pipeline[1].dropped
     
     @staticmethod
     def get_logger_with_context(logger_name, context):
@@ -150,5 +308,8 @@ if __name__ == "__main__":
     logger.warning("Mensagem de WARNING") 
     logger.error("Mensagem de ERROR")
     logger.fatal("Mensagem de FATAL - erro crítico")
+
+    # Garante gravação de tudo que ainda está na fila
+    config.shutdown()
     
     print("Logs de teste criados! Verifique a pasta 'logs/'")
\ No newline at end of file
@@ -1,7 +1,9 @@
 import sys
 import logging
+import multiprocessing
 import threading
 import time
+_PROCESS_T0 = time.perf_counter()  # antes dos imports pesados (Qt etc.): referência das fases startup.*
 from pathlib import Path
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QFontDatabase
@@ -12,6 +14,7 @@ from app_settings import apply_global_theme, settings
 import urllib.request
 import json
 from i18n import _
+from perf_events import PerfEvents
 
 RAW_URL = "https://github.com/Rogreis/TUB_Files/raw/refs/heads/main/AvailableTranslations.json"
 DOWNLOADS_DIR = Path('downloads')
@@ -51,6 +54,7 @@ def _background_download_translations():
             raise ValueError('Estrutura inesperada: chave "AvailableTranslations" ausente')
         tmp.write_text(text, encoding='utf-8')
         tmp.replace(TRANSL_FILE)
+        PerfEvents.emit('catalog.download', ms=(time.time() - start) * 1000.0, bytes=len(data), ok=True)
         AmadonLogging.info(
             main_window if main_window else None,
             _("translations.download.success").format(duration=round(time.time()-start,2), size=len(data))
@@ -61,10 +65,19 @@ def _background_download_translations():
         except Exception:
             pass
         AmadonLogging.error(main_window if main_window else None, _("translations.download.error").format(error=e))
+        PerfEvents.emit('catalog.download', ok=False, error=e.__class__.__name__)
+
+
+def _startup_phase(phase: str, since: float) -> float:
+    """Emite evento startup.phase com duração desde `since`; retorna o novo marco."""
+    now = time.perf_counter()
+    PerfEvents.emit('startup.phase', ms=(now - since) * 1000.0, phase=phase)
+    return now
 
 
 def run():
     """Ponto de entrada principal para iniciar a aplicação GUI."""
+    mark = _startup_phase('imports', _PROCESS_T0)
     logging.basicConfig(level=logging.INFO)
     # Remove arquivo existente (refresh forçado) ANTES de iniciar UI, conforme pedido
     try:
@@ -74,6 +87,7 @@ def run():
         pass
 
     app = QApplication(sys.argv)
+    mark = _startup_phase('qapplication', mark)
 
     # Carrega fontes embarcadas (Lato e Roboto Condensed se existirem)
     def _load_embedded_fonts():
@@ -89,11 +103,16 @@ def run():
                     except Exception:
                         pass
     _load_embedded_fonts()
+    mark = _startup_phase('fonts', mark)
     # Aplica tema ANTES de criar a janela para evitar flash branco
     apply_global_theme(app)
+    mark = _startup_phase('theme', mark)
     window = main()  # obtém / cria instância global de MainWindow já com stylesheet ativo
+    mark = _startup_phase('main_window', mark)
 
     window.show()
+    mark = _startup_phase('show', mark)
+    PerfEvents.emit('startup.total', ms=(mark - _PROCESS_T0) * 1000.0)
 
     # Exemplos iniciais (podem ser removidos posteriormente)
     MensagensStatus.curto(window, "Pronto")
@@ -109,6 +128,7 @@ def run():
         AmadonLogging.info(window, f"Aplicação encerrada normalmente com código: {exit_code}")
         # Salva settings (persistência)
         settings.save()
+        _shutdown_logging()
         sys.exit(exit_code)
     except Exception as e:  # pragma: no cover
         AmadonLogging.error_with_exception(window, "Erro durante execução da aplicação", e)
@@ -116,8 +136,20 @@ def run():
             settings.save()
         except Exception:
             pass
+        _shutdown_logging()
         sys.exit(1)
 
 
+def _shutdown_logging():
+    """Esvazia a fila de logging assíncrono antes de encerrar o processo."""
+    try:
+        from logging_config import AmadonLoggingConfig
+        AmadonLoggingConfig.shutdown()
+    except Exception:
+        pass
+
+
 if __name__ == "__main__":  # pragma: no cover
+    # Necessário no executável empacotado para os pools de processos
+    multiprocessing.freeze_support()
     run()
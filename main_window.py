@@ -627,7 +627,7 @@ class MainWindow(QMainWindow):
         tb = ToolBar_Busca(self)
         html = tb.GenerateData()
         if html:
-            tb.inject_web_content(html, target='left', clear=True, css=tb.css_left())
+            tb.inject_web_content(html, target='right', clear=True, css=tb.css_right())
         tb.Show()
         if hasattr(self, '_action_busca'):
             self._action_busca.setChecked(True)
@@ -0,0 +1,227 @@
+"""Canal estruturado de eventos de desempenho (JSON lines).
+
+Cada evento vira uma linha JSON em `logs/amadon_perf.jsonl`, por exemplo:
+
+    {"ts": "2025-10-18T10:21:03.512", "event": "doc.resolve", "ms": 3.214, "file": "Doc003.html"}
+
+Campos fixos: `ts` (horário local ISO), `event` (nome hierárquico com pontos)
+e, quando houver medição de tempo, `ms`. Demais campos são livres (bytes,
+contagens, identificadores). A gravação usa o mesmo pipeline assíncrono do
+logging (`AmadonLoggingConfig.setup_perf_logging`), portanto emitir um evento
+não faz E/S na thread chamadora.
+
+Eventos emitidos pela aplicação:
+- startup.phase / startup.total   fases de inicialização (main.run)
+- doc.resolve                     resolução de link doc:// em HTML
+- doc.tree.build                  montagem da árvore de Documentos
+- web.render                      setHtml até loadFinished de um QWebEngineView
+- catalog.download                download do AvailableTranslations.json
+- translation.download            download de TR###.gz (bytes, throughput)
+- translation.extract             extração em fluxo de TR###.gz (layout, membros, bytes)
+- config.translations.status      situação local das traduções escolhidas (MD5, extração), fora da thread da UI
+- search.concordance              concordância KWIC da Busca (documentos, linhas, processos)
+- search.index.load               carga/construção do índice da Busca (parágrafos, termos, cache, KB dos prefixos)
+- search.parallel.align           paralelos de um lote da Busca nas outras traduções (resultados, traduções)
+- search.query                    consulta da Busca (resultados, limite, cache)
+- search.semantic.load            carga/cálculo dos vetores LSA (parágrafos, dimensões, cache)
+- search.semantic.query           consulta semântica (resultados, limite, cache)
+- search.similar.load             carga/cálculo das assinaturas MinHash/LSH (parágrafos, cache)
+- search.similar.query            parágrafos semelhantes a um id (resultados, limite)
+
+Uso:
+    from perf_events import PerfEvents
+    PerfEvents.emit("translation.download", ms=812.4, bytes=1048576)
+    with PerfEvents.span("doc.resolve", file="Doc003.html") as fields:
+        ...
+        fields["found"] = True
+
+Resumo de percentis por evento:
+    python perf_events.py
+    python perf_events.py --event doc. --json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import math
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+from perf_metrics import PerfMetrics
+
+PERF_FILE = Path('logs') / 'amadon_perf.jsonl'
+PERF_LOGGER_NAME = 'AmadonPerf'
+
+
+class PerfEvents:
+    """Métodos estáticos para emitir eventos de desempenho estruturados."""
+
+    _logger: logging.Logger | None = None
+    _enabled: bool | None = None  # None = consulta settings.perf_events_enabled
+
+    @staticmethod
+    def configure(path: Path | str | None = None, enabled: bool | None = None) -> None:
+        """(Re)configura o destino dos eventos e, opcionalmente, força habilitação.
+
+        Chamado de forma preguiçosa no primeiro `emit`; testes e ferramentas
+        podem chamá-lo explicitamente para gravar em outro arquivo.
+        """
+        from logging_config import AmadonLoggingConfig
+        PerfEvents._logger = AmadonLoggingConfig.setup_perf_logging(PERF_LOGGER_NAME, path=path or PERF_FILE)
+        if enabled is not None:
+            PerfEvents._enabled = enabled
+
+    @staticmethod
+    def enabled() -> bool:
+        if PerfEvents._enabled is not None:
+            return PerfEvents._enabled
+        try:
+            from app_settings import settings
+            return bool(getattr(settings, 'perf_events_enabled', True))
+        except Exception:  # pragma: no cover
+            return True
+
+    @staticmethod
+    def emit(event: str, ms: float | None = None, **fields: Any) -> None:
+        """Registra um evento. Nunca propaga exceções para o chamador.
+
+        Eventos com duração também alimentam o histograma em memória de
+        mesmo nome (`PerfMetrics`), quando as métricas estão ligadas.
+        """
+        if ms is not None and PerfMetrics._enabled:
+            PerfMetrics.record(event, ms)
+        if not PerfEvents.enabled():
+            return
+        try:
+            if PerfEvents._logger is None:
+                PerfEvents.configure()
+            payload: dict[str, Any] = {
+                'ts': datetime.now().isoformat(timespec='milliseconds'),
+                'event': event,
+            }
+            if ms is not None:
+                payload['ms'] = round(float(ms), 3)
+            payload.update(fields)
+            PerfEvents._logger.info(json.dumps(payload, ensure_ascii=False, default=str))  # type: ignore[union-attr]
+        except Exception:
+            pass
+
+    @staticmethod
+    @contextmanager
+    def span(event: str, **fields: Any) -> Iterator[dict[str, Any]]:
+        """Mede o bloco e emite o evento com `ms` ao final.
+
+        O dicionário retornado pode receber campos adicionais dentro do bloco.
+        Se o bloco lançar exceção, o evento é emitido com `error` e a exceção
+        segue normalmente.
+        """
+        start = time.perf_counter()
+        try:
+            yield fields
+        except BaseException as e:
+            fields['error'] = e.__class__.__name__
+            raise
+        finally:
+            PerfEvents.emit(event, ms=(time.perf_counter() - start) * 1000.0, **fields)
+
+
+# --- Resumo (CLI) ---
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Percentil com interpolação linear sobre lista já ordenada."""
+    if not sorted_values:
+        return math.nan
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return sorted_values[low]
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def iter_events(path: Path) -> Iterator[dict[str, Any]]:
+    """Lê eventos do arquivo ignorando linhas que não sejam JSON válido."""
+    with path.open('r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            line = line.strip()
+            if not line.startswith('{'):
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(data, dict) and 'event' in data:
+                yield data
+
+
+def summarize(path: Path = PERF_FILE, prefix: str | None = None) -> dict[str, dict[str, float]]:
+    """Agrupa eventos por nome e calcula contagem e percentis de `ms`.
+
+    Para eventos com `bytes` e `ms`, inclui também a vazão mediana em KiB/s.
+    """
+    durations: dict[str, list[float]] = {}
+    throughputs: dict[str, list[float]] = {}
+    counts: dict[str, int] = {}
+    for ev in iter_events(path):
+        name = str(ev['event'])
+        if prefix and not name.startswith(prefix):
+            continue
+        counts[name] = counts.get(name, 0) + 1
+        ms = ev.get('ms')
+        if isinstance(ms, (int, float)):
+            durations.setdefault(name, []).append(float(ms))
+            size = ev.get('bytes')
+            if isinstance(size, (int, float)) and ms > 0:
+                throughputs.setdefault(name, []).append(size / 1024.0 / (ms / 1000.0))
+    summary: dict[str, dict[str, float]] = {}
+    for name in sorted(counts):
+        values = sorted(durations.get(name, []))
+        row: dict[str, float] = {'count': counts[name]}
+        if values:
+            row.update({
+                'p50': percentile(values, 50),
+                'p90': percentile(values, 90),
+                'p95': percentile(values, 95),
+                'p99': percentile(values, 99),
+                'max': values[-1],
+            })
+        rates = sorted(throughputs.get(name, []))
+        if rates:
+            row['kib_s_p50'] = percentile(rates, 50)
+        summary[name] = row
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Resumo de percentis dos eventos de desempenho (amadon_perf.jsonl).')
+    parser.add_argument('--file', type=Path, default=PERF_FILE, help='Arquivo JSON lines de eventos.')
+    parser.add_argument('--event', default=None, help='Filtra eventos por prefixo (ex.: doc.).')
+    parser.add_argument('--json', action='store_true', help='Saída em JSON em vez de tabela.')
+    args = parser.parse_args()
+
+    if not args.file.exists():
+        print(f'Arquivo não encontrado: {args.file}')
+        return
+    summary = summarize(args.file, args.event)
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+        return
+    if not summary:
+        print('Nenhum evento encontrado.')
+        return
+    print(f"{'evento':<28} {'n':>6} {'p50 ms':>10} {'p90 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'max ms':>10} {'KiB/s':>10}")
+    for name, row in summary.items():
+        def cell(key: str) -> str:
+            v = row.get(key)
+            return f"{v:>10.2f}" if isinstance(v, float) and not math.isnan(v) else f"{'-':>10}"
+        print(f"{name:<28} {int(row['count']):>6} {cell('p50')} {cell('p90')} {cell('p95')} {cell('p99')} {cell('max')} {cell('kib_s_p50')}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,214 @@
+"""Métricas de desempenho em memória (histogramas de latência e contadores).
+
+Complementa `perf_events`: enquanto os eventos são persistidos em JSON lines,
+aqui ficam agregados em memória para inspeção rápida na aba Diagnóstico do
+diálogo de Configuração.
+
+Quando desabilitado (padrão), decoradores e context managers apenas chamam o
+código original: o custo é um teste de atributo por chamada.
+
+Uso:
+    from perf_metrics import PerfMetrics, timed, timer
+
+    @timed('doc.resolve')
+    def resolve(...): ...
+
+    with timer('config.verify'):
+        ...
+
+    PerfMetrics.count('translation.download.retry')
+"""
+from __future__ import annotations
+
+import csv
+import functools
+import json
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+# Limites superiores (ms) dos baldes do histograma; o último é "infinito"
+BUCKET_BOUNDS_MS: tuple[float, ...] = (
+    0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500,
+    1000, 2500, 5000, 10000, 30000, 60000, float('inf'),
+)
+
+
+class Histogram:
+    """Histograma de latências com baldes fixos (escala aproximadamente log)."""
+
+    __slots__ = ('count', 'total', 'min', 'max', 'buckets')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+        self.buckets = [0] * len(BUCKET_BOUNDS_MS)
+
+    def add(self, ms: float) -> None:
+        self.count += 1
+        self.total += ms
+        if ms < self.min:
+            self.min = ms
+        if ms > self.max:
+            self.max = ms
+        self.buckets[bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+
+    def percentile(self, pct: float) -> float:
+        """Estimativa do percentil por interpolação linear dentro do balde."""
+        if not self.count:
+            return 0.0
+        target = self.count * pct / 100.0
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            if not n:
+                continue
+            if seen + n >= target:
+                low = BUCKET_BOUNDS_MS[i - 1] if i else 0.0
+                high = min(BUCKET_BOUNDS_MS[i], self.max)
+                low = max(low, self.min) if low < high else high
+                return low + (high - low) * ((target - seen) / n)
+            seen += n
+        return self.max
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'min': self.min if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'max': self.max,
+        }
+
+
+class PerfMetrics:
+    """Registro global (thread-safe) de histogramas e contadores."""
+
+    _enabled: bool = False
+    _lock = threading.Lock()
+    _histograms: dict[str, Histogram] = {}
+    _counters: dict[str, int] = {}
+
+    @staticmethod
+    def enable(flag: bool = True) -> None:
+        PerfMetrics._enabled = bool(flag)
+
+    @staticmethod
+    def enabled() -> bool:
+        return PerfMetrics._enabled
+
+    @staticmethod
+    def record(name: str, ms: float) -> None:
+        if not PerfMetrics._enabled:
+            return
+        with PerfMetrics._lock:
+            hist = PerfMetrics._histograms.get(name)
+            if hist is None:
+                hist = PerfMetrics._histograms[name] = Histogram()
+            hist.add(ms)
+
+    @staticmethod
+    def count(name: str, n: int = 1) -> None:
+        if not PerfMetrics._enabled:
+            return
+        with PerfMetrics._lock:
+            PerfMetrics._counters[name] = PerfMetrics._counters.get(name, 0) + n
+
+    @staticmethod
+    def reset() -> None:
+        with PerfMetrics._lock:
+            PerfMetrics._histograms = {}
+            PerfMetrics._counters = {}
+
+    @staticmethod
+    def snapshot() -> dict[str, Any]:
+        """Cópia consistente: {'timers': {nome: stats}, 'counters': {nome: n}}."""
+        with PerfMetrics._lock:
+            timers = {k: h.as_dict() for k, h in sorted(PerfMetrics._histograms.items())}
+            counters = dict(sorted(PerfMetrics._counters.items()))
+        return {'timers': timers, 'counters': counters}
+
+    @staticmethod
+    def export(path: Path | str) -> Path:
+        """Exporta o snapshot para JSON ou CSV (decidido pela extensão)."""
+        out = Path(path)
+        snap = PerfMetrics.snapshot()
+        if out.suffix.lower() == '.csv':
+            with out.open('w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['tipo', 'nome', 'count', 'mean_ms', 'min_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'])
+                for name, st in snap['timers'].items():
+                    writer.writerow(['timer', name, st['count']] + [f"{st[k]:.3f}" for k in ('mean', 'min', 'p50', 'p95', 'p99', 'max')])
+                for name, n in snap['counters'].items():
+                    writer.writerow(['counter', name, n, '', '', '', '', '', ''])
+        else:
+            out.write_text(json.dumps(snap, ensure_ascii=False, indent=2), encoding='utf-8')
+        return out
+
+
+class _NullTimer:
+    """Context manager vazio reutilizado quando as métricas estão desligadas."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+@contextmanager
+def _active_timer(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        PerfMetrics.record(name, (time.perf_counter() - start) * 1000.0)
+
+
+def timer(name: str):
+    """Context manager que mede o bloco (no-op se métricas desligadas)."""
+    if not PerfMetrics._enabled:
+        return _NULL_TIMER
+    return _active_timer(name)
+
+
+def timed(name: str | None = None) -> Callable[[F], F]:
+    """Decorador que mede cada chamada da função (no-op se desligado).
+
+    Sem nome explícito usa `modulo.funcao`.
+    """
+    def decorator(fn: F) -> F:
+        metric = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not PerfMetrics._enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                PerfMetrics.record(metric, (time.perf_counter() - start) * 1000.0)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+# Estado inicial a partir das configurações persistidas
+try:  # pragma: no cover
+    from app_settings import settings as _settings
+    PerfMetrics.enable(bool(getattr(_settings, 'perf_metrics_enabled', False)))
+except Exception:
+    pass
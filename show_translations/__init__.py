@@ -1,6 +1,8 @@
 """Utilitários para exibir/inspecionar traduções.
 
-A classe principal exportada aqui é `ShowTranslation`.
+A classe principal exportada aqui é `ShowTranslation`; `BlobStore` guarda
+versões de traduções com deduplicação por conteúdo.
 """
 
-from .show_translation import ShowTranslation  # noqa: F401
+from .blob_store import BlobStore  # noqa: F401
+from .show_translation import ExtractionCancelled, ShowTranslation  # noqa: F401
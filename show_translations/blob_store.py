@@ -0,0 +1,158 @@
+"""Armazenamento endereçado por conteúdo para versões de traduções.
+
+Cada versão de um TR###.gz vira um manifesto que lista, para cada arquivo, os
+blocos de conteúdo que o compõem. Blocos são gravados uma única vez, pelo
+SHA-256 do conteúdo; versões que compartilham arquivos ou trechos ocupam
+disco apenas com o que mudou.
+
+Layout em `doc_sources/.store/`:
+    objects/ab/cdef0123...        bloco comprimido (zlib)
+    versions/TR###/<versão>.json  manifesto {"files": {nome: [blocos]}, ...}
+
+Os arquivos são divididos em blocos alinhados a linhas com fronteiras
+definidas pelo conteúdo (CRC32 da linha): inserir ou remover um parágrafo
+altera só os blocos vizinhos, e não todos os seguintes.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import time
+import zlib
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator
+
+STORE_DIRNAME = '.store'
+
+# Fronteira de bloco após linha com crc32 & MASK == 0 (~16 linhas por bloco)
+CHUNK_BOUNDARY_MASK = 0xF
+MAX_CHUNK_SIZE = 256 * 1024
+
+_VERSION_RE = re.compile(r'[^0-9A-Za-z._-]+')
+
+
+def iter_chunks(stream: IO[bytes]) -> Iterator[bytes]:
+    """Lê `stream` linha a linha e produz blocos definidos pelo conteúdo."""
+    parts: list[bytes] = []
+    size = 0
+    for line in iter(lambda: stream.readline(MAX_CHUNK_SIZE), b''):
+        parts.append(line)
+        size += len(line)
+        if size >= MAX_CHUNK_SIZE or (zlib.crc32(line) & CHUNK_BOUNDARY_MASK) == 0:
+            yield b''.join(parts)
+            parts = []
+            size = 0
+    if parts:
+        yield b''.join(parts)
+
+
+def safe_version(version: str) -> str:
+    """Nome de versão seguro para arquivo (ex.: '2.1 beta' -> '2.1_beta')."""
+    return _VERSION_RE.sub('_', str(version)).strip('._') or 'v'
+
+
+class BlobStore:
+    """Blocos deduplicados + manifestos de versão por tradução."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.objects_dir = self.root / 'objects'
+        self.versions_dir = self.root / 'versions'
+
+    # --- Blocos ---
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def has(self, digest: str) -> bool:
+        return self._object_path(digest).exists()
+
+    def put(self, data: bytes) -> str:
+        """Grava o bloco (se ainda não existir) e retorna seu SHA-256."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + '.tmp')
+            tmp.write_bytes(zlib.compress(data, 6))
+            os.replace(tmp, path)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        return zlib.decompress(self._object_path(digest).read_bytes())
+
+    def put_stream(self, stream: IO[bytes]) -> list[str]:
+        """Grava o conteúdo de `stream` em blocos; retorna a lista de blocos (receita)."""
+        return [self.put(chunk) for chunk in iter_chunks(stream)]
+
+    def read_file(self, recipe: Iterable[str]) -> bytes:
+        return b''.join(self.get(d) for d in recipe)
+
+    # --- Versões ---
+    def _version_path(self, number: int, version: str) -> Path:
+        return self.versions_dir / f"TR{number:03d}" / f"{safe_version(version)}.json"
+
+    def save_version(self, number: int, version: str, files: dict[str, list[str]], meta: dict[str, Any] | None = None) -> Path:
+        path = self._version_path(number, version)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {'number': number, 'version': str(version), 'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                **(meta or {}), 'files': files}
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(data, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+        os.replace(tmp, path)
+        return path
+
+    def load_version(self, number: int, version: str) -> dict[str, Any]:
+        path = self._version_path(number, version)
+        if not path.exists():
+            raise FileNotFoundError(f"Versão não encontrada: TR{number:03d} {version}")
+        return json.loads(path.read_text(encoding='utf-8'))
+
+    def versions(self, number: int) -> list[str]:
+        """Versões guardadas da tradução, da mais antiga para a mais recente."""
+        folder = self.versions_dir / f"TR{number:03d}"
+        if not folder.exists():
+            return []
+        found = []
+        for path in folder.glob('*.json'):
+            try:
+                data = json.loads(path.read_text(encoding='utf-8'))
+            except Exception:
+                continue
+            found.append((data.get('created', ''), str(data.get('version', path.stem))))
+        return [v for _, v in sorted(found)]
+
+    def delete_version(self, number: int, version: str) -> None:
+        """Remove o manifesto; blocos órfãos só saem em `gc()`."""
+        self._version_path(number, version).unlink(missing_ok=True)
+
+    def referenced(self) -> set[str]:
+        refs: set[str] = set()
+        for path in self.versions_dir.glob('TR*/*.json'):
+            try:
+                files = json.loads(path.read_text(encoding='utf-8')).get('files', {})
+            except Exception:
+                continue
+            for recipe in files.values():
+                refs.update(recipe)
+        return refs
+
+    def gc(self) -> int:
+        """Apaga blocos não referenciados por nenhuma versão; retorna quantos."""
+        refs = self.referenced()
+        removed = 0
+        for path in self.objects_dir.glob('??/*'):
+            if path.parent.name + path.name not in refs:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def usage(self) -> dict[str, int]:
+        """Quantidade de blocos e bytes ocupados em disco (comprimidos)."""
+        blobs = 0
+        size = 0
+        for path in self.objects_dir.glob('??/*'):
+            blobs += 1
+            size += path.stat().st_size
+        return {'blobs': blobs, 'bytes': size}
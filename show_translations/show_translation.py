@@ -1,10 +1,84 @@
 from __future__ import annotations
 
 import gzip
-import io
+import hashlib
+import json
+import multiprocessing
+import os
+import shutil
 import tarfile
-from pathlib import Path
-from typing import Optional
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable, Optional
+
+from perf_events import PerfEvents
+
+from .blob_store import STORE_DIRNAME, BlobStore
+
+# Tamanho dos blocos de cópia na extração (memória de pico independe do arquivo)
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Manifesto da última extração, gravado dentro de cada doc_sources/TR###/
+MANIFEST_NAME = '.manifest.json'
+MANIFEST_VERSION = 2  # 2: SHA-1 do conteúdo de cada membro
+
+# Membro que já existe em disco é descomprimido para cá (memória até este
+# tamanho, depois arquivo temporário) e só regravado se o SHA-1 mudou
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+# progress(nome_do_membro, bytes_comprimidos_lidos, bytes_comprimidos_total)
+ProgressCallback = Callable[[str, int, int], None]
+
+
+class ExtractionCancelled(RuntimeError):
+    """Extração interrompida a pedido (a pasta parcial é removida)."""
+
+
+def _copy_stream(src: Any, dst: Any, should_cancel: Optional[Callable[[], bool]] = None, digest: Any = None) -> None:
+    """Copia em blocos de COPY_BUFFER_SIZE, consultando `should_cancel` antes de cada bloco.
+
+    Com `digest` (hashlib), o conteúdo é somado ao hash durante a cópia.
+    """
+    read, write = src.read, dst.write
+    while True:
+        if should_cancel is not None and should_cancel():
+            raise ExtractionCancelled()
+        chunk = read(COPY_BUFFER_SIZE)
+        if not chunk:
+            return
+        if digest is not None:
+            digest.update(chunk)
+        write(chunk)
+
+
+def _file_sha1(path: Path) -> str:
+    digest = hashlib.sha1()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(COPY_BUFFER_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _extract_worker(project_root: str, sources_subdir: str, number: int, cancel_event: Any = None) -> tuple[int, str, float]:
+    """Extrai uma tradução num processo do pool; retorna (numero, status, ms).
+
+    Função de módulo (serializável). Eventos de desempenho ficam com o
+    processo principal, que registra um evento por tradução.
+    """
+    PerfEvents._enabled = False
+    start = time.perf_counter()
+    st = ShowTranslation(base_dir=Path(project_root), sources_subdir=sources_subdir)
+    should_cancel = cancel_event.is_set if cancel_event is not None else None
+    try:
+        st.extract_archive(number, should_cancel=should_cancel)
+        status = 'extracted'
+    except ExtractionCancelled:
+        status = 'cancelled'
+    except Exception as e:
+        status = f'error:{e.__class__.__name__}'
+    return number, status, (time.perf_counter() - start) * 1000.0
 
 
 class ShowTranslation:
@@ -24,7 +98,10 @@ class ShowTranslation:
 
     def __init__(self, base_dir: Optional[Path] = None, sources_subdir: str = "doc_sources") -> None:
         self.project_root = base_dir or Path(__file__).resolve().parent.parent
+        self.sources_subdir = sources_subdir
         self.sources_dir = self.project_root / sources_subdir
+        # MD5 já calculado por (caminho, tamanho, mtime_ns): status + extração leem o .gz uma vez só
+        self._md5_memo: dict[tuple[str, int, int], str] = {}
 
     def _file_path(self, number: int) -> Path:
         if number < 0:
@@ -47,17 +124,116 @@ class ShowTranslation:
         # tentativa de decodificar como texto puro
         return data.decode(encoding)
 
+    # --- Manifesto de extração ---
+    def _target_dir(self, number: int) -> Path:
+        return self.sources_dir / f"TR{number:03d}"
+
+    @staticmethod
+    def archive_fingerprint(path: Path, with_md5: bool = True) -> dict[str, Any]:
+        """Impressão digital do .gz: tamanho, mtime (ns) e MD5 (lido em blocos)."""
+        st = path.stat()
+        info: dict[str, Any] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+        if with_md5:
+            md5 = hashlib.md5()
+            with open(path, 'rb') as fh:
+                for chunk in iter(lambda: fh.read(COPY_BUFFER_SIZE), b''):
+                    md5.update(chunk)
+            info['md5'] = md5.hexdigest()
+        return info
+
+    def _archive_fingerprint(self, path: Path, with_md5: bool = True) -> dict[str, Any]:
+        """`archive_fingerprint` reaproveitando o MD5 se o .gz não mudou desde o último cálculo."""
+        info = self.archive_fingerprint(path, with_md5=False)
+        if with_md5:
+            key = (str(path), info['size'], info['mtime_ns'])
+            md5 = self._md5_memo.get(key)
+            if md5 is None:
+                md5 = self._md5_memo[key] = self.archive_fingerprint(path)['md5']
+            info['md5'] = md5
+        return info
+
+    def read_manifest(self, number: int) -> Optional[dict[str, Any]]:
+        """Manifesto gravado na última extração de TR###.gz (None se ausente/inválido)."""
+        try:
+            data = json.loads((self._target_dir(number) / MANIFEST_NAME).read_text(encoding='utf-8'))
+        except Exception:
+            return None
+        return data if isinstance(data, dict) and data.get('version') == MANIFEST_VERSION else None
+
+    def _write_manifest(self, number: int, archive: dict[str, Any], layout: str, members: dict[str, dict]) -> None:
+        target = self._target_dir(number) / MANIFEST_NAME
+        tmp = target.with_suffix('.tmp')
+        tmp.write_text(json.dumps({'version': MANIFEST_VERSION, 'archive': archive, 'layout': layout,
+                                   'members': members}, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+        os.replace(tmp, target)
+
+    def extraction_status(self, number: int) -> str:
+        """Estado da pasta TR### em relação ao TR###.gz atual.
+
+        Returns:
+            'missing-archive', 'pending' (sem pasta ou vazia), 'stale'
+            (sem manifesto, arquivo alterado ou membros ausentes) ou 'ok'.
+            Com mtime diferente mas mesmo tamanho, o MD5 decide (e o mtime
+            do manifesto é atualizado).
+        """
+        archive_path = self._file_path(number)
+        if not archive_path.exists():
+            return 'missing-archive'
+        folder = self._target_dir(number)
+        if not folder.exists() or not any(p.name != MANIFEST_NAME for p in folder.iterdir()):
+            return 'pending'
+        manifest = self.read_manifest(number)
+        if manifest is None:
+            return 'stale'
+        recorded = manifest.get('archive', {})
+        current = self._archive_fingerprint(archive_path, with_md5=False)
+        if current['size'] != recorded.get('size'):
+            return 'stale'
+        if current['mtime_ns'] != recorded.get('mtime_ns'):
+            current = self._archive_fingerprint(archive_path)
+            if current['md5'] != recorded.get('md5'):
+                return 'stale'
+            self._write_manifest(number, current, manifest.get('layout', 'tar'), manifest.get('members', {}))
+        for name, info in manifest.get('members', {}).items():
+            try:
+                if (folder / name).stat().st_size != info.get('size'):
+                    return 'stale'
+            except OSError:
+                return 'stale'
+        return 'ok'
+
     # --- Novos métodos multi-arquivo ---
-    def extract_archive(self, number: int, overwrite: bool = False) -> Path:
+    def extract_archive(self, number: int, overwrite: bool = False,
+                        progress: Optional[ProgressCallback] = None,
+                        should_cancel: Optional[Callable[[], bool]] = None) -> Path:
         """Extrai todos os arquivos contidos em TR###.gz para pasta doc_sources/TR###.
 
         Suporta dois formatos:
           1. gzip de um único arquivo (cria arquivo único dentro da pasta)
           2. tar.gz (gzip contendo um tar) -> extrai árvore inteira
 
+        A leitura é em fluxo (`tarfile` modo 'r|gz'): cada membro é copiado
+        direto para o disco em blocos de COPY_BUFFER_SIZE, sem carregar o
+        arquivo inteiro em memória.
+
+        Cada extração grava `TR###/.manifest.json` (tamanho/mtime/MD5 do .gz
+        e tamanho/mtime/SHA-1 de cada membro; o SHA-1 é calculado durante a
+        descompressão). Sem `overwrite`:
+          - se o .gz não mudou desde o manifesto, nada é lido;
+          - se mudou, só são regravados os membros cujo conteúdo (SHA-1)
+            difere do manifesto, e membros que deixaram de existir no .gz são
+            apagados. Em pasta antiga, sem manifesto, o SHA-1 é comparado com
+            o do arquivo em disco.
+
         Args:
             number: número da tradução
-            overwrite: se True, substitui arquivos existentes
+            overwrite: se True, regrava todos os arquivos
+            progress: chamado após cada membro com (nome, bytes comprimidos
+                lidos, tamanho do .gz), para barras de progresso
+            should_cancel: consultado entre membros e entre blocos da cópia
+                (também no gzip de um único arquivo); se retornar True, a
+                extração para, o arquivo parcial e a pasta criada são
+                removidos e ExtractionCancelled é lançada
 
         Returns:
             Caminho da pasta destino (doc_sources/TR###)
@@ -65,74 +241,302 @@ class ShowTranslation:
         archive_path = self._file_path(number)
         if not archive_path.exists():
             raise FileNotFoundError(f"Arquivo não encontrado: {archive_path}")
-        target_dir = self.sources_dir / f"TR{number:03d}"
+        target_dir = self._target_dir(number)
+        if not overwrite and self.extraction_status(number) == 'ok':
+            return target_dir
+        created = not target_dir.exists()
         target_dir.mkdir(parents=True, exist_ok=True)
+        archive = self._archive_fingerprint(archive_path)
+        old_members = {} if overwrite else (self.read_manifest(number) or {}).get('members', {})
+        # Sem manifesto durante a atualização: se interrompida, a próxima compara pelo disco
+        (target_dir / MANIFEST_NAME).unlink(missing_ok=True)
+        total = archive['size']
+        start = time.perf_counter()
+        members: dict[str, dict] = {}
+        written = 0
+        made_dirs = {target_dir}
 
-        # Ler bytes do gzip
-        with open(archive_path, 'rb') as fh:
-            raw = fh.read()
-        try:
-            decompressed = gzip.decompress(raw)
-        except OSError as e:
-            raise RuntimeError(f"Falha ao descomprimir gzip: {archive_path}: {e}") from e
+        def cancelled() -> ExtractionCancelled:
+            if created:
+                shutil.rmtree(target_dir, ignore_errors=True)
+            return ExtractionCancelled(f"Extração cancelada: {archive_path}")
 
-        bio = io.BytesIO(decompressed)
-        # Tentar abrir como tar diretamente (tarfile.is_tarfile não aceita fileobj)
-        try:
-            with tarfile.open(fileobj=bio, mode='r:*') as tf:
-                # Se conseguir abrir como tar, extraímos membros
-                for member in tf.getmembers():
-                    if member.isdir():
-                        continue
-                    out_path = target_dir / member.name
+        def recorded_sha1(out_path: Path, name: str, size: Optional[int]) -> Optional[str]:
+            """SHA-1 do conteúdo já em disco (None: arquivo ausente ou de outro tamanho)."""
+            if overwrite:
+                return None
+            try:
+                on_disk = out_path.stat().st_size
+            except OSError:
+                return None
+            if size is not None and on_disk != size:
+                return None
+            old = old_members.get(name)
+            if old is not None:
+                return old.get('sha1') if old.get('size') == on_disk else None
+            return _file_sha1(out_path)  # extração antiga, sem manifesto: confere o disco
+
+        def write_member(src: Any, out_path: Path, name: str, size: Optional[int]) -> tuple[str, bool]:
+            """Descomprime `src` calculando o SHA-1; regrava `out_path` só se o conteúdo mudou."""
+            digest = hashlib.sha1()
+            recorded = recorded_sha1(out_path, name, size)
+            if recorded is None:
+                if out_path.parent not in made_dirs:
                     out_path.parent.mkdir(parents=True, exist_ok=True)
-                    if out_path.exists() and not overwrite:
-                        continue
-                    extracted = tf.extractfile(member)
-                    if extracted is None:
-                        continue
-                    out_path.write_bytes(extracted.read())
-        except tarfile.TarError:
-            # Não é tar: tratar como um único arquivo
-            bio.seek(0)
+                    made_dirs.add(out_path.parent)
+                try:
+                    with open(out_path, 'wb') as dst:
+                        _copy_stream(src, dst, should_cancel, digest)
+                except ExtractionCancelled:
+                    out_path.unlink(missing_ok=True)
+                    raise
+                return digest.hexdigest(), True
+            with tempfile.SpooledTemporaryFile(SPOOL_MAX_SIZE) as spool:
+                _copy_stream(src, spool, should_cancel, digest)
+                if digest.hexdigest() == recorded:
+                    return recorded, False
+                spool.seek(0)
+                with open(out_path, 'wb') as dst:
+                    _copy_stream(spool, dst)
+            return digest.hexdigest(), True
+
+        with open(archive_path, 'rb') as fh:
+            try:
+                with tarfile.open(fileobj=fh, mode='r|gz') as tf:
+                    for member in tf:
+                        if should_cancel is not None and should_cancel():
+                            raise cancelled()
+                        if not member.isfile():
+                            continue
+                        # ignora membros que escapariam da pasta destino (../, absolutos)
+                        name = PurePosixPath(member.name)
+                        if name.is_absolute() or '..' in name.parts or member.name == MANIFEST_NAME:
+                            continue
+                        out_path = target_dir / name
+                        extracted = tf.extractfile(member)
+                        if extracted is None:
+                            continue
+                        try:
+                            sha1, changed = write_member(extracted, out_path, name.as_posix(), member.size)
+                        except ExtractionCancelled:
+                            raise cancelled() from None
+                        members[name.as_posix()] = {'size': member.size, 'mtime': int(member.mtime), 'sha1': sha1}
+                        if changed:
+                            written += member.size
+                        if progress:
+                            progress(member.name, fh.tell(), total)
+                layout = 'tar'
+            except (tarfile.ReadError, EOFError, OSError) as e:
+                if members:
+                    # tar válido, mas truncado/corrompido no meio
+                    raise RuntimeError(f"Falha ao descomprimir gzip: {archive_path}: {e}") from e
+                layout = 'gzip'
+        if layout == 'gzip':
+            # Não é tar: tratar como um único arquivo (o .gz mudou ou não havia manifesto)
             single_name = target_dir / f"TR{number:03d}.txt"
-            if single_name.exists() and not overwrite:
-                return target_dir
-            single_name.write_bytes(bio.read())
+            try:
+                with gzip.open(archive_path, 'rb') as src:
+                    sha1, changed = write_member(src, single_name, single_name.name, None)
+            except ExtractionCancelled:
+                raise cancelled() from None
+            except (OSError, EOFError) as e:
+                single_name.unlink(missing_ok=True)
+                if created:
+                    shutil.rmtree(target_dir, ignore_errors=True)
+                raise RuntimeError(f"Falha ao descomprimir gzip: {archive_path}: {e}") from e
+            size = single_name.stat().st_size
+            written = size if changed else 0
+            members = {single_name.name: {'size': size, 'mtime': int(archive['mtime_ns'] // 10**9), 'sha1': sha1}}
+            if progress:
+                progress(single_name.name, total, total)
+        removed = 0
+        for stale in set(old_members) - set(members):
+            try:
+                (target_dir / stale).unlink()
+                removed += 1
+            except OSError:
+                pass
+        self._write_manifest(number, archive, layout, members)
+        PerfEvents.emit('translation.extract', ms=(time.perf_counter() - start) * 1000.0,
+                        number=number, layout=layout, members=len(members), bytes=written, removed=removed)
         return target_dir
 
     def verify_user_translations_choice(self, chosen: list[int], auto_extract: bool = True) -> dict[int, str]:
-        """Verifica se cada tradução escolhida possui pasta expandida.
+        """Verifica se cada tradução escolhida possui pasta expandida e atual.
 
         Para cada número em `chosen`:
           - Confere existência de TR###.gz
-          - Verifica se `doc_sources/TR###/` existe com algum conteúdo
-          - Se não existir e `auto_extract=True`, chama `extract_archive`.
+          - Compara `doc_sources/TR###/` com o manifesto da última extração
+            (ver `extraction_status`)
+          - Se faltar ou estiver desatualizada e `auto_extract=True`, chama
+            `extract_archive` (que só regrava os membros alterados).
 
         Returns:
             dict {numero: status}
-              status pode ser: 'ok', 'missing-archive', 'extracted', 'exists'
+              status pode ser: 'ok', 'missing-archive', 'extracted', 'updated',
+              'exists', 'pending', 'stale'
         """
         results: dict[int, str] = {}
         for n in chosen:
             try:
-                archive = self._file_path(n)
-                if not archive.exists():
-                    results[n] = 'missing-archive'
-                    continue
-                folder = self.sources_dir / f"TR{n:03d}"
-                if folder.exists() and any(folder.iterdir()):
-                    results[n] = 'ok'
+                status = self.extraction_status(n)
+                if status in ('missing-archive', 'ok'):
+                    results[n] = status
                     continue
                 if auto_extract:
                     self.extract_archive(n)
-                    results[n] = 'extracted'
+                    results[n] = 'updated' if status == 'stale' else 'extracted'
+                elif status == 'stale':
+                    results[n] = 'stale'
                 else:
-                    results[n] = 'exists' if folder.exists() else 'pending'
+                    results[n] = 'exists' if self._target_dir(n).exists() else 'pending'
             except Exception as e:  # coleta falhas isoladas sem interromper
                 results[n] = f'error:{e.__class__.__name__}'
         return results
 
+    def verify_user_translations_parallel(self, chosen: list[int], max_workers: Optional[int] = None,
+                                          cancel: Optional[Callable[[], bool]] = None
+                                          ) -> tuple[dict[int, str], dict[int, float]]:
+        """Como `verify_user_translations_choice(auto_extract=True)`, extraindo em paralelo.
+
+        A descompressão é limitada por CPU; cada tradução pendente é extraída
+        em um processo do pool, então três traduções levam cerca do tempo da
+        maior delas.
+
+        Args:
+            chosen: números das traduções
+            max_workers: processos (default: min(pendentes, CPUs))
+            cancel: consultado enquanto aguarda; se retornar True, traduções
+                ainda não iniciadas são descartadas e as em andamento param no
+                próximo bloco copiado (status 'cancelled')
+
+        Returns:
+            (status por número, tempo em ms por número processado). Status igual
+            ao da versão serial, mais 'cancelled'.
+        """
+        results = self.verify_user_translations_choice(chosen, auto_extract=False)
+        pending = [n for n, status in results.items() if status in ('exists', 'pending', 'stale')]
+        stale = {n for n in pending if results[n] == 'stale'}
+        timings: dict[int, float] = {}
+        if not pending:
+            return results, timings
+        workers = max(1, min(len(pending), max_workers or os.cpu_count() or 1))
+        if workers == 1:
+            for n in pending:
+                if cancel is not None and cancel():
+                    results[n] = 'cancelled'
+                    continue
+                _, results[n], timings[n] = _extract_worker(str(self.project_root), self.sources_subdir, n)
+                if n in stale and results[n] == 'extracted':
+                    results[n] = 'updated'
+                PerfEvents.emit('translation.extract', ms=timings[n], number=n, status=results[n], parallel=False)
+            return results, timings
+
+        manager = multiprocessing.Manager() if cancel is not None else None
+        cancel_event = manager.Event() if manager is not None else None
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(_extract_worker, str(self.project_root), self.sources_subdir, n, cancel_event): n
+                           for n in pending}
+                remaining = set(futures)
+                while remaining:
+                    done, remaining = wait(remaining, timeout=0.1, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        n = futures[fut]
+                        if fut.cancelled():
+                            results[n] = 'cancelled'
+                            continue
+                        try:
+                            _, results[n], timings[n] = fut.result()
+                        except Exception as e:  # processo filho morreu, etc.
+                            results[n] = f'error:{e.__class__.__name__}'
+                            continue
+                        if n in stale and results[n] == 'extracted':
+                            results[n] = 'updated'
+                        PerfEvents.emit('translation.extract', ms=timings[n], number=n, status=results[n], parallel=True)
+                    if cancel_event is not None and not cancel_event.is_set() and cancel():  # type: ignore[misc]
+                        cancel_event.set()
+                        for fut in remaining:
+                            fut.cancel()
+        finally:
+            if manager is not None:
+                manager.shutdown()
+        return results, timings
+
+    # --- Versões deduplicadas ---
+    @property
+    def blob_store(self) -> BlobStore:
+        """Armazenamento de versões em doc_sources/.store (ver `blob_store`)."""
+        return BlobStore(self.sources_dir / STORE_DIRNAME)
+
+    def store_version(self, number: int, version: Optional[str] = None, catalog_hash: Optional[str] = None) -> str:
+        """Guarda o conteúdo atual de TR###.gz como uma versão no armazenamento.
+
+        Lê o .gz em fluxo (tar membro a membro ou gzip simples) e grava só
+        os blocos ainda inexistentes. Sem `version`, usa o início do MD5 do .gz.
+
+        Returns:
+            Nome da versão gravada.
+        """
+        archive_path = self._file_path(number)
+        if not archive_path.exists():
+            raise FileNotFoundError(f"Arquivo não encontrado: {archive_path}")
+        fingerprint = self.archive_fingerprint(archive_path)
+        version = str(version or fingerprint['md5'][:12])
+        store = self.blob_store
+        start = time.perf_counter()
+        files: dict[str, list[str]] = {}
+        try:
+            with open(archive_path, 'rb') as fh, tarfile.open(fileobj=fh, mode='r|gz') as tf:
+                for member in tf:
+                    if member.isfile():
+                        extracted = tf.extractfile(member)
+                        if extracted is not None:
+                            files[PurePosixPath(member.name).as_posix()] = store.put_stream(extracted)
+            layout = 'tar'
+        except (tarfile.ReadError, EOFError, OSError) as e:
+            if files:
+                raise RuntimeError(f"Falha ao descomprimir gzip: {archive_path}: {e}") from e
+            with gzip.open(archive_path, 'rb') as src:
+                files = {f"TR{number:03d}.txt": store.put_stream(src)}
+            layout = 'gzip'
+        store.save_version(number, version, files, {
+            'layout': layout, 'archive_md5': fingerprint['md5'], 'catalog_hash': catalog_hash or '',
+        })
+        PerfEvents.emit('translation.store_version', ms=(time.perf_counter() - start) * 1000.0,
+                        number=number, files=len(files), chunks=sum(len(r) for r in files.values()))
+        return version
+
+    def stored_versions(self, number: int) -> list[str]:
+        return self.blob_store.versions(number)
+
+    def restore_version(self, number: int, version: str, target_dir: Optional[Path] = None) -> Path:
+        """Reconstrói os arquivos de uma versão guardada (default: doc_sources/TR###@versão)."""
+        store = self.blob_store
+        manifest = store.load_version(number, version)
+        target = target_dir or self.sources_dir / f"TR{number:03d}@{version}"
+        for name, recipe in manifest.get('files', {}).items():
+            rel = PurePosixPath(name)
+            if rel.is_absolute() or '..' in rel.parts:
+                continue
+            out_path = target / rel
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(out_path, 'wb') as dst:
+                for digest in recipe:
+                    dst.write(store.get(digest))
+        return target
+
+    def diff_versions(self, number: int, old: str, new: str) -> dict[str, list[str]]:
+        """Arquivos adicionados, removidos e alterados entre duas versões guardadas."""
+        store = self.blob_store
+        a = store.load_version(number, old).get('files', {})
+        b = store.load_version(number, new).get('files', {})
+        return {
+            'added': sorted(set(b) - set(a)),
+            'removed': sorted(set(a) - set(b)),
+            'changed': sorted(n for n in set(a) & set(b) if a[n] != b[n]),
+        }
+
     def extract_to_file(self, number: int, out_dir: Optional[Path] = None, overwrite: bool = False, encoding: str = "utf-8") -> Path:
         """Extrai o conteúdo para um arquivo de texto ao lado ou em `out_dir`.
 
@@ -148,4 +552,4 @@ class ShowTranslation:
         out_path.write_text(text, encoding=encoding)
         return out_path
 
-__all__ = ["ShowTranslation"]
+__all__ = ["ShowTranslation", "ExtractionCancelled"]
@@ -0,0 +1,158 @@
+"""Lista virtualizada dos resultados da Busca (modelo + delegate).
+
+O modelo guarda só (pid, score); referência e trecho destacado são gerados
+quando o delegate pinta a linha, ou seja, apenas para as linhas visíveis, e
+ficam em cache por pid. Todas as linhas têm a mesma altura
+(`setUniformItemSizes`), então a rolagem não mede itens fora da tela e
+centenas de resultados rolam sem reconstruir nenhuma página HTML.
+"""
+from __future__ import annotations
+
+from typing import Callable
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QRect, QSize, Qt
+from PySide6.QtGui import QFont, QPainter, QTextDocument
+from PySide6.QtWidgets import QAbstractItemView, QListView, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from busca.paragraphs import pid_reference
+
+PID_ROLE = Qt.ItemDataRole.UserRole + 1
+SCORE_ROLE = Qt.ItemDataRole.UserRole + 2
+SNIPPET_ROLE = Qt.ItemDataRole.UserRole + 3
+
+SNIPPET_LINES = 3
+PADDING = 4
+DOC_CACHE_SIZE = 256  # QTextDocument já diagramados (linhas visíveis + margem)
+
+
+class SearchResultsModel(QAbstractListModel):
+    """Resultados ranqueados; o trecho HTML vem de `snippet_html(pid)` sob demanda."""
+
+    def __init__(self, snippet_html: Callable[[str], str], parent=None) -> None:
+        super().__init__(parent)
+        self._snippet_html = snippet_html
+        self._hits: list[tuple[str, float]] = []
+        self._snippets: dict[str, str] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._hits)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._hits):
+            return None
+        pid, score = self._hits[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return pid_reference(pid)
+        if role == PID_ROLE:
+            return pid
+        if role == SCORE_ROLE:
+            return score
+        if role == SNIPPET_ROLE:
+            snippet = self._snippets.get(pid)
+            if snippet is None:
+                snippet = self._snippets[pid] = self._snippet_html(pid)
+            return snippet
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return pid
+        return None
+
+    def clear(self, snippet_html: Callable[[str], str] | None = None) -> None:
+        """Esvazia a lista (nova consulta: os destaques mudam, então o cache também)."""
+        self.beginResetModel()
+        self._hits = []
+        self._snippets = {}
+        if snippet_html is not None:
+            self._snippet_html = snippet_html
+        self.endResetModel()
+
+    def refresh_snippets(self) -> None:
+        """Descarta os trechos já gerados (ex.: destaques chegaram depois do primeiro lote) e avisa a view."""
+        self._snippets = {}
+        if self._hits:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._hits) - 1, 0), [SNIPPET_ROLE])
+
+    def append_hits(self, hits: list[tuple[str, float]]) -> None:
+        if not hits:
+            return
+        first = len(self._hits)
+        self.beginInsertRows(QModelIndex(), first, first + len(hits) - 1)
+        self._hits.extend(hits)
+        self.endInsertRows()
+
+
+class SearchResultDelegate(QStyledItemDelegate):
+    """Pinta referência + score na primeira linha e o trecho (rich text) abaixo."""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._docs: dict[tuple[str, int], QTextDocument] = {}
+        self.snippet_lines = SNIPPET_LINES
+
+    def clear_cache(self) -> None:
+        self._docs.clear()
+
+    def set_snippet_lines(self, lines: int) -> None:
+        """Altura do trecho em linhas (ex.: paralelos de outras traduções); vale após o próximo reset do modelo."""
+        self.snippet_lines = max(1, lines)
+        self._docs.clear()
+
+    def _document(self, pid: str, html: str, width: int, font: QFont) -> QTextDocument:
+        key = (pid, width)
+        doc = self._docs.get(key)
+        if doc is None:
+            if len(self._docs) >= DOC_CACHE_SIZE:
+                self._docs.pop(next(iter(self._docs)))
+            doc = QTextDocument()
+            doc.setDefaultFont(font)
+            doc.setDocumentMargin(0)
+            doc.setHtml(html)
+            doc.setTextWidth(width)
+            self._docs[key] = doc
+        return doc
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:  # noqa: N802
+        line = option.fontMetrics.lineSpacing()
+        return QSize(option.rect.width(), line * (1 + self.snippet_lines) + 3 * PADDING)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        painter.save()
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight().color().lighter(170))
+        elif option.state & QStyle.StateFlag.State_MouseOver:
+            painter.fillRect(option.rect, option.palette.alternateBase())
+        rect = option.rect.adjusted(PADDING, PADDING, -PADDING, -PADDING)
+        line = option.fontMetrics.lineSpacing()
+        bold = QFont(option.font)
+        bold.setBold(True)
+        painter.setFont(bold)
+        painter.setPen(option.palette.link().color())
+        reference = index.data(Qt.ItemDataRole.DisplayRole) or ''
+        painter.drawText(QRect(rect.left(), rect.top(), rect.width(), line), Qt.AlignmentFlag.AlignLeft, reference)
+        score = index.data(SCORE_ROLE)
+        if score is not None:
+            painter.setFont(option.font)
+            painter.setPen(option.palette.placeholderText().color())
+            painter.drawText(QRect(rect.left(), rect.top(), rect.width(), line), Qt.AlignmentFlag.AlignRight, f"{score:.2f}")
+        snippet_rect = QRect(rect.left(), rect.top() + line + PADDING, rect.width(), line * self.snippet_lines)
+        doc = self._document(index.data(PID_ROLE), index.data(SNIPPET_ROLE) or '', snippet_rect.width(), option.font)
+        painter.translate(snippet_rect.topLeft())
+        painter.setClipRect(QRect(0, 0, snippet_rect.width(), snippet_rect.height()))
+        doc.drawContents(painter)
+        painter.restore()
+        painter.save()
+        painter.setPen(option.palette.midlight().color())
+        painter.drawLine(option.rect.bottomLeft(), option.rect.bottomRight())
+        painter.restore()
+
+
+def create_results_view(model: SearchResultsModel, parent=None) -> QListView:
+    """QListView configurada para o modelo: altura uniforme, rolagem por pixel, hover."""
+    view = QListView(parent)
+    view.setModel(model)
+    view.setItemDelegate(SearchResultDelegate(view))
+    view.setUniformItemSizes(True)
+    view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+    view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+    view.setMouseTracking(True)
+    view.setWordWrap(True)
+    return view
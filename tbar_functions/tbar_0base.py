@@ -1,6 +1,9 @@
+import time
 from abc import ABC, abstractmethod
 from typing import Any
 from i18n import _
+from perf_events import PerfEvents
+from perf_metrics import timed
 from PySide6.QtWidgets import QWidget, QTextBrowser, QScrollArea, QVBoxLayout
 from PySide6.QtCore import Qt
 
@@ -156,6 +159,7 @@ class ToolBar_Base(ABC):
         self.inject_widget(container, target=target, clear=clear)
         return container
 
+    @timed('web.inject')
     def inject_web_content(
         self,
         body_html: str,
@@ -402,6 +406,26 @@ class ToolBar_Base(ABC):
                 super().keyPressEvent(event)
 
         view = AmadonWebView()
+        # Mede do setHtml até o fim do carregamento (evento web.render)
+        render_start = time.perf_counter()
+        render_module = self.__class__.__name__
+        def _emit_render(ok: bool):
+            try:
+                view.loadFinished.disconnect(_emit_render)  # type: ignore
+            except Exception:
+                pass
+            PerfEvents.emit(
+                'web.render',
+                ms=(time.perf_counter() - render_start) * 1000.0,
+                module=render_module,
+                target=target,
+                bytes=len(full_html),
+                ok=bool(ok),
+            )
+        try:
+            view.loadFinished.connect(_emit_render)  # type: ignore
+        except Exception:
+            pass
         view.setHtml(full_html)
         self.inject_widget(view, target=target, clear=clear)
 
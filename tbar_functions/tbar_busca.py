@@ -1,5 +1,41 @@
 from tbar_functions.tbar_0base import ToolBar_Base
 from i18n import _
+from PySide6.QtWidgets import QComboBox, QCompleter, QFileDialog, QHBoxLayout, QLineEdit, QLabel, QMenu, QMessageBox, QPushButton, QWidget, QVBoxLayout
+from PySide6.QtCore import QModelIndex, QObject, QPoint, QStringListModel, Qt, QTimer, Signal
+from busca import QuerySyntaxError, get_engine, is_plain_query, iter_concordance, write_csv, write_html
+from busca.concordance import CSS as KWIC_CSS, PaperLines, html_table
+from busca.parallel import AlignedText, ParallelSearch, Translation, slot_translations
+from busca.paragraphs import paragraph_id, pid_reference
+from document_resolver import CONTENT_ROOT
+from tbar_functions.busca_results import PID_ROLE, SNIPPET_LINES, SearchResultsModel, create_results_view
+from tbar_functions.tbar_documentos import documentos_assets, render_document_page
+from translation_catalog import SLOT_ATTRS, TranslationCatalog
+from pathlib import Path
+import html
+import re
+import threading
+import time
+
+SEARCH_DELAY_MS = 300  # pausa na digitação antes de buscar
+SNIPPET_CHARS = 240
+SNIPPET_LEAD = 60  # contexto antes do primeiro termo destacado
+KWIC_DISPLAY_LINES = 3000  # linhas mostradas no painel; a exportação leva todas
+ALIGNED_CHARS = 160  # trecho de cada paralelo em outra tradução
+ALIGNED_LINES = 2
+SUGGESTIONS = 10
+LAST_WORD_RE = re.compile(r'(\w+)$')  # palavra em digitação (fim do texto)
+
+
+class _BuscaSignals(QObject):
+    index_ready = Signal(int, str)  # parágrafos indexados, erro ('' se ok)
+    semantic_ready = Signal(str)    # erro ('' se ok)
+    results_batch = Signal(int, object, bool, float)  # geração, lote ranqueado, último?, ms
+    hits_ready = Signal(int, object)  # geração, trechos a destacar (id -> posições de token)
+    query_failed = Signal(int, str)  # geração, erro
+    kwic_batch = Signal(int, int, object)  # geração, documento, linhas KWIC
+    kwic_done = Signal(int, float, str)    # geração, ms, erro ('' se ok)
+    translations_ready = Signal(object)    # list[Translation] dos slots já extraídos
+
 
 class ToolBar_Busca(ToolBar_Base):
     def __init__(self, context=None):
@@ -7,21 +43,517 @@ class ToolBar_Busca(ToolBar_Base):
         self._log_info("log.open.busca")
         self._status_curto("status.curto.bus")
         self._status_principal("status.msg.busca")
-        self._css_left = "body{font-family:'Segoe UI';color:#133;} h2{color:#0a3d7a;border-bottom:1px solid #ccd6e2;margin-top:0;} ul{padding-left:18px;} li{margin:3px 0;}"
+        self._css_right = "body{font-family:'Segoe UI';color:#133;} h2{color:#0a3d7a;border-bottom:1px solid #ccd6e2;margin-top:0;} ul{padding-left:18px;} li{margin:3px 0;}"
+        self._css_doc, self._js_doc = documentos_assets()
+        self._engine = get_engine(CONTENT_ROOT)
+
+        # Painel esquerdo: consulta + lista de resultados
+        container = QWidget()
+        vlayout = QVBoxLayout(container)
+        vlayout.setContentsMargins(0, 0, 0, 0)
+        vlayout.setSpacing(4)
+        translation = QComboBox()
+        translation.setToolTip(_("busca.translation.tip"))
+        translation.hide()  # só aparece se houver traduções extraídas nos slots
+        vlayout.addWidget(translation)
+        query = QLineEdit()
+        query.setPlaceholderText(_("busca.placeholder"))
+        query.setClearButtonEnabled(True)
+        vlayout.addWidget(query)
+        buttons = QHBoxLayout()
+        btn_kwic = QPushButton(_("busca.concordance.button"))
+        btn_kwic.setToolTip(_("busca.concordance.tip"))
+        btn_export = QPushButton(_("busca.concordance.export"))
+        btn_export.setEnabled(False)
+        buttons.addWidget(btn_kwic)
+        buttons.addWidget(btn_export)
+        buttons.addStretch(1)
+        vlayout.addLayout(buttons)
+        status = QLabel()
+        status.setWordWrap(True)
+        vlayout.addWidget(status)
+        model = SearchResultsModel(lambda pid: self._snippet(pid), container)
+        results = create_results_view(model)
+        vlayout.addWidget(results, 1)
+        completer = QCompleter(QStringListModel(container), container)
+        # a lista já vem filtrada pelo índice de prefixos (acentos e caixa dobrados)
+        completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        completer.setMaxVisibleItems(SUGGESTIONS)
+        query.setCompleter(completer)
+        self._query = query
+        self._completer = completer
+        self._translation = translation
+        self._status = status
+        self._model = model
+        self._results = results
+        # Consulta em andamento: a geração descarta lotes antigos, o Event interrompe o worker
+        self._generation = 0
+        self._semantic_query = False
+        self._cancel = threading.Event()
+        self._hits: dict[str, list[tuple[int, int]]] = {}  # trechos casados, de SearchEngine.hit_spans
+        # Busca paralela: a consulta roda em uma tradução e os resultados trazem os mesmos ids nas outras
+        self._translations = [Translation(_("busca.translation.docs"), self._engine)]
+        self._parallel = ParallelSearch(self._engine, [])
+        self._aligned: dict[str, list[AlignedText]] = {}
+        self._similar_source = ''  # pid da lista de semelhantes exibida ('' = resultados de consulta)
+        # Concordância: mesma convenção (geração + Event), independente da lista de resultados
+        self._btn_kwic = btn_kwic
+        self._btn_export = btn_export
+        self._kwic_generation = 0
+        self._kwic_cancel = threading.Event()
+        self._kwic_query = ''
+        self._kwic: list[PaperLines] = []
+        self._delay = QTimer(container)
+        self._delay.setSingleShot(True)
+        self._delay.setInterval(SEARCH_DELAY_MS)
+        # lambdas mantêm esta instância viva enquanto o painel existir
+        self._delay.timeout.connect(lambda: self._run_query())  # type: ignore
+        query.textEdited.connect(lambda text: self._on_text_edited(text))  # type: ignore
+        completer.activated.connect(lambda _text: self._delay.start())  # type: ignore
+        query.returnPressed.connect(lambda: self._run_query())  # type: ignore
+        results.clicked.connect(lambda index: self._open_result(index))  # type: ignore
+        results.activated.connect(lambda index: self._open_result(index))  # type: ignore
+        results.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        results.customContextMenuRequested.connect(lambda pos: self._results_menu(pos))  # type: ignore
+        btn_kwic.clicked.connect(lambda: self._run_concordance())  # type: ignore
+        translation.currentIndexChanged.connect(lambda i: self._set_query_translation(i))  # type: ignore
+        btn_export.clicked.connect(lambda: self._export_concordance())  # type: ignore
+
+        # Índice: carregado/construído fora da thread da interface
+        self._signals = _BuscaSignals(container)
+        self._signals.index_ready.connect(lambda count, error: self._on_index_ready(count, error))
+        self._signals.semantic_ready.connect(lambda error: self._on_semantic_ready(error))
+        self._signals.results_batch.connect(lambda gen, hits, done, ms: self._on_results(gen, hits, done, ms))
+        self._signals.hits_ready.connect(lambda gen, hits: self._on_hits(gen, hits))
+        self._signals.query_failed.connect(lambda gen, error: self._on_query_failed(gen, error))
+        self._signals.kwic_batch.connect(lambda gen, paper, lines: self._on_kwic_batch(gen, paper, lines))
+        self._signals.kwic_done.connect(lambda gen, ms, error: self._on_kwic_done(gen, ms, error))
+        self._signals.translations_ready.connect(lambda translations: self._on_translations_ready(translations))
+        if self._engine.ready:
+            status.setText(_("busca.index.ready").format(n=len(self._engine.index)))
+            semantic = self._semantic_enabled() and not self._engine.semantic_ready
+            if semantic:
+                status.setText(_("busca.semantic.indexing").format(n=len(self._engine.index)))
+            threading.Thread(target=self._load_extras, args=(semantic,), daemon=True).start()
+        else:
+            status.setText(_("busca.indexing"))
+            query.setEnabled(False)
+            btn_kwic.setEnabled(False)
+            threading.Thread(target=self._load_index, daemon=True).start()
+        threading.Thread(target=self._load_translations, daemon=True).start()
+        if self.context:
+            self.inject_widget(container, target='left', clear=True)
+
+    def _load_index(self):
+        try:
+            index = self._engine.ensure_index()
+            count, error = len(index), ''
+        except Exception as e:  # noqa: BLE001
+            count, error = 0, str(e)
+        try:
+            self._signals.index_ready.emit(count, error)
+        except RuntimeError:  # painel já substituído
+            return
+        if not error:
+            self._load_extras(self._semantic_enabled())
+
+    def _load_extras(self, semantic: bool):
+        """Pré-cálculos em segundo plano: vetores LSA (se habilitados) e assinaturas MinHash."""
+        engine = self._engine
+        if semantic:
+            self._load_semantic()
+        try:
+            engine.ensure_similar()
+        except Exception:  # noqa: BLE001 (refeito sob demanda em "Parágrafos semelhantes")
+            pass
+
+    def _load_semantic(self):
+        try:
+            self._engine.ensure_semantic()
+            error = ''
+        except Exception as e:  # noqa: BLE001
+            error = str(e)
+        try:
+            self._signals.semantic_ready.emit(error)
+        except RuntimeError:  # painel já substituído
+            pass
+
+    def _load_translations(self):
+        """Traduções dos slots 1..3 já extraídas em doc_sources, com os índices carregados."""
+        try:
+            from app_settings import settings
+            translations = slot_translations([getattr(settings, attr, -1) for attr in SLOT_ATTRS],
+                                             Path('doc_sources'), TranslationCatalog.load())
+            for translation in translations:
+                translation.engine.ensure_index()
+        except Exception:  # noqa: BLE001 (sem traduções: busca só nos documentos)
+            translations = []
+        try:
+            self._signals.translations_ready.emit(translations)
+        except RuntimeError:  # painel já substituído
+            pass
+
+    def _on_translations_ready(self, translations: list):
+        if not translations:
+            return
+        self._translations = self._translations[:1] + translations
+        self._translation.blockSignals(True)
+        self._translation.clear()
+        for translation in self._translations:
+            self._translation.addItem(_("busca.translation.item").format(nome=translation.label))
+        self._translation.blockSignals(False)
+        self._translation.show()
+        self._set_query_translation(0)
+
+    def _set_query_translation(self, i: int):
+        """Tradução em que a consulta roda; as demais entram como paralelos."""
+        if not 0 <= i < len(self._translations):
+            return
+        self._engine = self._translations[i].engine
+        self._parallel = ParallelSearch(self._engine, [t for j, t in enumerate(self._translations) if j != i])
+        if self._engine.ready:
+            self._on_index_ready(len(self._engine.index), '')
+            if self._query.text().strip():
+                self._run_query()
+        else:
+            self._status.setText(_("busca.indexing"))
+            self._query.setEnabled(False)
+            self._btn_kwic.setEnabled(False)
+            threading.Thread(target=self._load_index, daemon=True).start()
+
+    @staticmethod
+    def _semantic_enabled() -> bool:
+        from app_settings import settings
+        return bool(getattr(settings, 'search_semantic_enabled', False))
+
+    def _on_index_ready(self, count: int, error: str):
+        if error:
+            self._status.setText(_("busca.index.error").format(erro=error))
+            return
+        if self._semantic_enabled() and not self._engine.semantic_ready:
+            self._status.setText(_("busca.semantic.indexing").format(n=count))
+        else:
+            self._status.setText(_("busca.index.ready").format(n=count))
+        self._query.setEnabled(True)
+        self._btn_kwic.setEnabled(True)
+        self._query.setFocus()
+
+    def _on_semantic_ready(self, error: str):
+        if error:
+            self._status.setText(_("busca.index.error").format(erro=error))
+        elif self._engine.ready:
+            self._status.setText(_("busca.index.ready").format(n=len(self._engine.index)))
+
+    def _on_text_edited(self, text: str):
+        """Digitação: sugere termos para a palavra atual, cancela a consulta em andamento e agenda a nova."""
+        self._cancel.set()
+        self._update_suggestions(text)
+        self._delay.start()
+
+    def _update_suggestions(self, text: str):
+        """Completa a última palavra com os termos mais frequentes do vocabulário (índice de prefixos)."""
+        m = LAST_WORD_RE.search(text)
+        word = m.group(1) if m else ''
+        suggestions = self._engine.suggest(word, SUGGESTIONS) if word and not paragraph_id(text) else []
+        head = text[:len(text) - len(word)]
+        if word[:1].isupper():
+            suggestions = [(term[:1].upper() + term[1:], df) for term, df in suggestions]
+        items = [head + term for term, _df in suggestions if term != word]
+        self._completer.model().setStringList(items)
+        if items:
+            self._completer.complete()
+        else:
+            self._completer.popup().hide()
+
+    def _run_query(self):
+        self._delay.stop()
+        self._cancel.set()
+        text = self._query.text().strip()
+        if not text or not self._engine.ready:
+            return
+        pid = paragraph_id(text)
+        if pid:  # '1:2.3' ou 'p001_002_003': parágrafos semelhantes
+            self._run_similar(pid)
+            return
+        limit = self._limit()
+        # Consultas só com palavras vão para a busca semântica, quando habilitada e pronta
+        semantic = self._semantic_enabled() and self._engine.semantic_ready and is_plain_query(text)
+        try:
+            self._engine.cache_key(text)  # valida a sintaxe antes de disparar o worker
+        except QuerySyntaxError as e:
+            self._status.setText(_("busca.syntax.error").format(erro=e))
+            return
+        self._generation += 1
+        self._cancel = threading.Event()
+        self._semantic_query = semantic
+        self._similar_source = ''
+        self._hits = {}
+        self._reset_results()
+        threading.Thread(target=self._query_worker, args=(self._generation, self._cancel, self._parallel, text, limit, semantic),
+                         daemon=True).start()
+
+    @staticmethod
+    def _limit() -> int:
+        from app_settings import settings
+        return max(10, min(300, getattr(settings, 'search_max_items', 200) or 200))
+
+    def _reset_results(self):
+        self._aligned = {}
+        delegate = self._results.itemDelegate()
+        delegate.clear_cache()
+        delegate.set_snippet_lines(SNIPPET_LINES + ALIGNED_LINES * len(self._parallel.others))
+        self._model.clear()
+
+    def _query_worker(self, generation: int, cancel: threading.Event, parallel: ParallelSearch, text: str, limit: int,
+                      semantic: bool):
+        """Entrega os resultados em lotes ranqueados (com os paralelos); para no primeiro lote após o cancelamento."""
+        start = time.perf_counter()
+        batches = parallel.search_batches(text, limit=limit, semantic=semantic)
+        try:
+            for i, batch in enumerate(batches):
+                if cancel.is_set():
+                    return
+                self._signals.results_batch.emit(generation, batch, False, (time.perf_counter() - start) * 1000.0)
+                if i == 0:  # destaques depois do primeiro lote: não atrasam os primeiros resultados
+                    self._signals.hits_ready.emit(generation, parallel.engine.hit_spans(text, semantic))
+            if not cancel.is_set():
+                self._signals.results_batch.emit(generation, [], True, (time.perf_counter() - start) * 1000.0)
+        except RuntimeError:  # painel já substituído
+            pass
+        except Exception as e:  # noqa: BLE001
+            try:
+                self._signals.query_failed.emit(generation, str(e))
+            except RuntimeError:
+                pass
+        finally:
+            batches.close()
+
+    def _results_menu(self, pos: QPoint):
+        pid = self._results.indexAt(pos).data(PID_ROLE)
+        if not pid:
+            return
+        menu = QMenu(self._results)
+        action = menu.addAction(_("busca.similar.action"))
+        action.triggered.connect(lambda: self._run_similar(pid))  # type: ignore
+        menu.exec(self._results.viewport().mapToGlobal(pos))
+
+    def _run_similar(self, pid: str):
+        """Lista os parágrafos semelhantes a `pid` (assinaturas MinHash/LSH da tradução da consulta)."""
+        self._delay.stop()
+        self._cancel.set()
+        if not self._engine.ready:
+            return
+        if not self._engine.similar_ready:
+            self._status.setText(_("busca.similar.indexing"))
+        self._generation += 1
+        self._cancel = threading.Event()
+        self._semantic_query = False
+        self._similar_source = pid
+        self._hits = {}
+        self._reset_results()
+        threading.Thread(target=self._similar_worker, args=(self._generation, self._cancel, self._parallel, pid, self._limit()),
+                         daemon=True).start()
+
+    def _similar_worker(self, generation: int, cancel: threading.Event, parallel: ParallelSearch, pid: str, limit: int):
+        start = time.perf_counter()
+        try:
+            hits = parallel.similar(pid, limit)
+            if cancel.is_set():
+                return
+            ms = (time.perf_counter() - start) * 1000.0
+            # destaca os termos do parágrafo de origem nos trechos
+            engine = parallel.engine
+            terms = engine.analyzer.content_terms(engine.text(pid))
+            self._signals.hits_ready.emit(generation, engine.term_spans([hit_pid for hit_pid, _, _ in hits], terms))
+            self._signals.results_batch.emit(generation, hits, False, ms)
+            self._signals.results_batch.emit(generation, [], True, ms)
+        except RuntimeError:  # painel já substituído
+            pass
+        except Exception as e:  # noqa: BLE001
+            try:
+                self._signals.query_failed.emit(generation, str(e))
+            except RuntimeError:
+                pass
+
+    def _on_results(self, generation: int, hits: list, done: bool, ms: float):
+        if generation != self._generation:
+            return
+        for pid, _score, aligned in hits:
+            self._aligned[pid] = aligned
+        self._model.append_hits([(pid, score) for pid, score, _aligned in hits])
+        count = self._model.rowCount()
+        if self._similar_source:
+            ref = pid_reference(self._similar_source)
+            if count:
+                self._status.setText(_("busca.similar.count").format(n=count, ref=ref, ms=f"{ms:.0f}"))
+            elif done:
+                self._status.setText(_("busca.similar.none").format(ref=ref))
+            return
+        if not count:
+            if done:
+                self._status.setText(_("busca.results.none"))
+            return
+        count_key = "busca.results.semantic" if self._semantic_query else "busca.results.count"
+        self._status.setText(_(count_key).format(n=count, ms=f"{ms:.0f}"))
+
+    def _on_hits(self, generation: int, hits: dict):
+        if generation != self._generation:
+            return
+        self._hits = hits
+        # trechos já gerados (primeiro lote) são refeitos com os destaques
+        self._results.itemDelegate().clear_cache()
+        self._model.refresh_snippets()
+
+    def _on_query_failed(self, generation: int, error: str):
+        if generation == self._generation:
+            self._status.setText(_("busca.query.error").format(erro=error))
+
+    def _snippet(self, pid: str) -> str:
+        """Trecho do parágrafo a partir do primeiro termo da consulta, com destaques (HTML)."""
+        text = self._engine.text(pid)
+        spans = self._engine.hit_offsets(pid, self._hits.get(pid, []))
+        start = max(0, spans[0][0] - SNIPPET_LEAD) if spans else 0
+        if start:
+            start = text.find(' ', start) + 1 or start
+        end = start + SNIPPET_CHARS
+        parts = ["…"] if start else []
+        last = start
+        for hit_start, hit_end in spans:
+            if hit_start < start:
+                continue
+            if hit_end > end:
+                break
+            parts.append(html.escape(text[last:hit_start]))
+            parts.append(f"<b>{html.escape(text[hit_start:hit_end])}</b>")
+            last = hit_end
+        parts.append(html.escape(text[last:end]))
+        if end < len(text):
+            parts.append("…")
+        for label, aligned in self._aligned.get(pid, ()):
+            more = "…" if len(aligned) > ALIGNED_CHARS else ""
+            parts.append(f"<br><span style='color:#567'><b>{html.escape(label)}:</b> {html.escape(aligned[:ALIGNED_CHARS])}{more}</span>")
+        return "".join(parts)
+
+    def _open_result(self, index: QModelIndex):
+        pid = index.data(PID_ROLE)
+        if not pid:
+            return
+        link = f"doc://#{pid}"
+        # posições de token só valem para os documentos da tradução indexada
+        hits = self._hits if self._engine.folder == CONTENT_ROOT else None
+        body = render_document_page(pid_reference(pid), link, highlight=hits)
+        self.inject_web_content(body, target='right', clear=True, use_bootstrap=True, css=self._css_doc, js=self._js_doc)
+
+    def _run_concordance(self):
+        """Concordância KWIC da consulta (termo, "frase" ou NEAR) em todos os documentos."""
+        text = self._query.text().strip()
+        if not text or not self._engine.ready:
+            return
+        self._kwic_cancel.set()
+        self._kwic_generation += 1
+        self._kwic_cancel = threading.Event()
+        self._kwic_query = text
+        self._kwic = []
+        self._btn_export.setEnabled(False)
+        self._status.setText(_("busca.concordance.running").format(n=0, docs=0))
+        threading.Thread(target=self._concordance_worker, args=(self._kwic_generation, self._kwic_cancel, text),
+                         daemon=True).start()
+
+    def _concordance_worker(self, generation: int, cancel: threading.Event, text: str):
+        """Entrega a concordância documento a documento, sem pool de processos (jobs=1)."""
+        start = time.perf_counter()
+        error = ''
+        papers = iter_concordance(self._engine, text, jobs=1)
+        try:
+            for paper, lines in papers:
+                if cancel.is_set():
+                    return
+                self._signals.kwic_batch.emit(generation, paper, lines)
+        except RuntimeError:  # painel já substituído
+            return
+        except Exception as e:  # noqa: BLE001 (inclui QuerySyntaxError: AND/OR/NOT)
+            error = str(e)
+        finally:
+            papers.close()
+        try:
+            self._signals.kwic_done.emit(generation, (time.perf_counter() - start) * 1000.0, error)
+        except RuntimeError:
+            pass
+
+    def _kwic_counts(self) -> tuple[int, int]:
+        return sum(len(lines) for _, lines in self._kwic), len(self._kwic)
+
+    def _on_kwic_batch(self, generation: int, paper: int, lines: list):
+        if generation != self._kwic_generation:
+            return
+        self._kwic.append((paper, lines))
+        n, docs = self._kwic_counts()
+        self._status.setText(_("busca.concordance.running").format(n=n, docs=docs))
+
+    def _on_kwic_done(self, generation: int, ms: float, error: str):
+        if generation != self._kwic_generation:
+            return
+        if error:
+            self._status.setText(_("busca.query.error").format(erro=error))
+            return
+        n, docs = self._kwic_counts()
+        self._status.setText(_("busca.concordance.done").format(n=n, docs=docs, ms=f"{ms:.0f}"))
+        self._btn_export.setEnabled(bool(n))
+        parts = [f"<div style='padding:10px'><h1>{html.escape(_('busca.concordance.title').format(consulta=self._kwic_query))}</h1>"]
+        shown = 0
+        for paper, lines in self._kwic:
+            if shown >= KWIC_DISPLAY_LINES:
+                parts.append(f"<p><i>{_('busca.concordance.truncated').format(n=shown, total=n)}</i></p>")
+                break
+            lines = lines[:KWIC_DISPLAY_LINES - shown]
+            parts.append(html_table(paper, lines))
+            shown += len(lines)
+        if not n:
+            parts.append(f"<p>{_('busca.results.none')}</p>")
+        parts.append("</div>")
+        self.inject_web_content("".join(parts), target='right', clear=True, css=self._css_right + KWIC_CSS)
+
+    def _export_concordance(self):
+        if not self._kwic:
+            return
+        path, selected = QFileDialog.getSaveFileName(
+            self._query, _("busca.concordance.export"), "concordancia.csv", "CSV (*.csv);;HTML (*.html)"
+        )
+        if not path:
+            return
+        as_html = path.lower().endswith(('.html', '.htm')) or (selected.startswith('HTML') and not path.lower().endswith('.csv'))
+        try:
+            if as_html:
+                with open(path, 'w', encoding='utf-8') as out:
+                    n = write_html(self._kwic, out, title=_("busca.concordance.title").format(consulta=self._kwic_query))
+            else:
+                with open(path, 'w', encoding='utf-8-sig', newline='') as out:  # BOM: acentos corretos no Excel
+                    n = write_csv(self._kwic, out)
+            self._status.setText(_("busca.concordance.exported").format(n=n, path=path))
+        except OSError as e:
+            QMessageBox.warning(self._query, _("busca.concordance.export"), str(e))
 
     def GenerateData(self) -> str:  # noqa: N802
         return f"""
         <div style='padding:10px'>
             <h2>{_("html.busca.title")}</h2>
             <p>{_("html.busca.intro")}</p>
-            <p><b>Planos:</b></p>
+            <p><b>{_("html.busca.syntax")}:</b></p>
             <ul>
-                <li>Indexação incremental</li>
-                <li>Busca booleana</li>
-                <li>Destaque de termos</li>
+                <li>{_("html.busca.syntax.terms")}</li>
+                <li>{_("html.busca.syntax.phrase")}</li>
+                <li>{_("html.busca.syntax.near")}</li>
+                <li>{_("html.busca.syntax.bool")}</li>
+                <li>{_("html.busca.syntax.group")}</li>
             </ul>
+            <p>{_("html.busca.syntax.semantic")}</p>
+            <p>{_("html.busca.suggest")}</p>
+            <p>{_("html.busca.hits")}</p>
+            <p>{_("html.busca.concordance")}</p>
+            <p>{_("html.busca.parallel")}</p>
+            <p>{_("html.busca.similar")}</p>
         </div>
         """
 
-    def css_left(self):
-        return getattr(self, '_css_left', None)
\ No newline at end of file
+    def css_right(self):
+        return getattr(self, '_css_right', None)
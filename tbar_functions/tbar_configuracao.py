@@ -3,9 +3,15 @@ from i18n import _
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QCheckBox, QMessageBox, QApplication, QPlainTextEdit, QSpinBox, QLineEdit
 from PySide6.QtCore import Signal, QObject
 from PySide6.QtWidgets import QComboBox, QHBoxLayout, QGroupBox, QFormLayout, QTabWidget, QWidget
+from PySide6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog
 from PySide6.QtCore import Qt
 from app_settings import settings, apply_global_theme
-import json, os, hashlib, threading, urllib.request, time
+from perf_events import PerfEvents
+from perf_metrics import PerfMetrics, timed
+from hash_ledger import get_ledger
+from translation_catalog import TranslationCatalog, migrate_translation_slots, translation_file_status, DEFAULT_SLOT1_DESCRIPTION, DEFAULT_SLOT2_DESCRIPTION
+import os, hashlib, threading, urllib.request, time
+from pathlib import Path
 
 
 class ToolBar_Configuracao(ToolBar_Base):
@@ -105,7 +111,7 @@ class ToolBar_Configuracao(ToolBar_Base):
             lbl_tr_exec = QLabel(_("tab.traducao.execucao.placeholder"), tab_tr_exec)
             lbl_tr_exec.setWordWrap(True)
             tab_tr_exec_layout.addWidget(lbl_tr_exec)
-            # Placeholders - serão preenchidos após carregamento de available_translations
+            # Placeholders - serão preenchidos após carregamento do catálogo de traduções
             chk_edit_enable = None
             edit_group = None
             cmb_edit_translation = None
@@ -192,46 +198,11 @@ class ToolBar_Configuracao(ToolBar_Base):
 
             form = QFormLayout()
             form.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
-            # Carrega AvailableTranslations.json (estrutura esperada: lista de objetos com campos id/descricao/... )
-            available_translations: list[dict] = []
-            # Prioriza arquivo baixado em 'downloads', depois fallback em 'resources'
-            candidate_paths = [
-                os.path.join('downloads', 'AvailableTranslations.json'),
-                os.path.join('resources', 'AvailableTranslations.json')
-            ]
-            for translations_path in candidate_paths:
-                if not os.path.exists(translations_path):
-                    continue
-                try:
-                    with open(translations_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        # Estrutura esperada: { "AvailableTranslations": [ ... ] }
-                        if isinstance(data, dict) and isinstance(data.get('AvailableTranslations'), list):
-                            for item in data['AvailableTranslations']:
-                                if isinstance(item, dict) and ('Description' in item or 'descricao' in item):
-                                    available_translations.append(item)
-                            break  # já carregou com sucesso
-                        # Fallback: se for lista direta
-                        elif isinstance(data, list):
-                            for item in data:
-                                if isinstance(item, dict) and ('Description' in item or 'descricao' in item):
-                                    available_translations.append(item)
-                            break
-                except Exception:
-                    continue
-
-            # Localiza índices preferenciais por Description (case-insensitive)
-            english_idx = -1
-            portuguese_alt_idx = -1
-            for idx, item in enumerate(available_translations):
-                desc_raw = str(item.get('Description') or item.get('descricao') or '')
-                low = desc_raw.lower()
-                if english_idx == -1 and low == 'english 2009':
-                    english_idx = idx
-                if portuguese_alt_idx == -1 and low == 'portuguese alternative':
-                    portuguese_alt_idx = idx
-
-            # Agora que available_translations está carregado, construir painel de edição de tradução
+            # O catálogo de traduções e a situação dos arquivos locais são carregados
+            # em segundo plano; os combos abrem com um marcador e são preenchidos depois
+            catalog_state = {'catalog': TranslationCatalog([])}
+
+            # Painel de edição de tradução (combo preenchido junto com os slots)
             try:
                 from PySide6.QtWidgets import QCheckBox as _QB, QGroupBox as _GB, QFormLayout as _FL, QComboBox as _CB, QLineEdit as _LE
                 # Usamos um dicionário container para guardar referências mutáveis dentro deste escopo
@@ -245,24 +216,8 @@ class ToolBar_Configuracao(ToolBar_Base):
                 edit_form.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
                 cmb_edit_translation_local = _CB(edit_group_local)
                 cmb_edit_translation_local.setToolTip(_("config.trx.edit.translation.tip"))
-                cmb_edit_translation_local.addItem(_("config.translation.none"), -1)
-                for t_idx, t_item in enumerate(available_translations):
-                    desc = (t_item.get('descricao') or t_item.get('Description') or t_item.get('description') or t_item.get('desc') or f"Item {t_idx}")
-                    lang_id = None
-                    try:
-                        raw_id = t_item.get('LanguageID') if isinstance(t_item, dict) else getattr(t_item, 'LanguageID', None)
-                        if raw_id is not None:
-                            lang_id = int(raw_id)
-                    except Exception:
-                        lang_id = None
-                    if lang_id is None:
-                        lang_id = t_idx
-                    cmb_edit_translation_local.addItem(desc, lang_id)
-                initial_edit_id = getattr(settings, 'translation_edit_target', -1)
-                for i_c in range(cmb_edit_translation_local.count()):
-                    if cmb_edit_translation_local.itemData(i_c) == initial_edit_id:
-                        cmb_edit_translation_local.setCurrentIndex(i_c)
-                        break
+                cmb_edit_translation_local.addItem(_("config.translations.loading"), None)
+                cmb_edit_translation_local.setEnabled(False)
                 edit_form.addRow(_("config.trx.edit.translation")+":", cmb_edit_translation_local)
                 txt_repo_base_local = _LE(edit_group_local)
                 txt_repo_base_local.setPlaceholderText(_("config.trx.edit.repo.placeholder"))
@@ -278,75 +233,64 @@ class ToolBar_Configuracao(ToolBar_Base):
                     except Exception:
                         pass
                 chk_edit_enable_local.stateChanged.connect(_toggle_edit_group2)  # type: ignore
-                controls_to_disable.extend([chk_edit_enable_local, cmb_edit_translation_local, txt_repo_base_local])
                 # Guarda em edit_refs para acesso no _on_finished
                 edit_refs['chk'] = chk_edit_enable_local
                 edit_refs['cmb'] = cmb_edit_translation_local
                 edit_refs['repo'] = txt_repo_base_local
             except Exception:
                 edit_refs = {}
-            # Helper para criar combo com ajustes específicos por slot
-            def build_translation_combo(label_key: str, slot_attr: str, tip_key: str, allow_none: bool, force_default_idx: int|None=None, fallback_default_idx: int|None=None) -> QComboBox:
+            # Helper para criar combo de slot (vazio até o catálogo chegar)
+            def build_translation_combo(label_key: str, tip_key: str) -> QComboBox:
                 cmb = QComboBox(translations_box)
                 cmb.setToolTip(_(tip_key))
-                # Lista ordenada (descricao, idxOriginal)
-                display_items: list[tuple[str,int]] = []
-                for idx, item in enumerate(available_translations):
-                    desc = (
-                        item.get('descricao') or item.get('Description') or item.get('description') or
-                        item.get('desc') or f"Item {idx}"
-                    )
-                    display_items.append((desc, idx))
-                display_items.sort(key=lambda x: x[0].lower())
-                if allow_none:
-                    cmb.addItem(_("config.translation.none"), -1)
-                for desc, original_idx in display_items:
-                    cmb.addItem(desc, original_idx)
-                # Determina valor salvo
-                current_val = getattr(settings, slot_attr, -1)
-                # Aplica lógica de default forçado (slot1 deve ser English 2009)
-                if force_default_idx is not None:
-                    # Se ainda não selecionado (valor -1 ou inválido), define para default
-                    if current_val == -1 or all(cmb.itemData(i) != current_val for i in range(cmb.count())):
-                        current_val = force_default_idx
-                        setattr(settings, slot_attr, current_val)
-                        settings.save()
-                elif (current_val == -1 or all(cmb.itemData(i) != current_val for i in range(cmb.count()))) and fallback_default_idx is not None:
-                    # Usa fallback (ex.: Portuguese Alternative para slot2)
-                    current_val = fallback_default_idx
-                    setattr(settings, slot_attr, current_val)
-                    settings.save()
-                # Seleciona no combo
-                for i in range(cmb.count()):
-                    if cmb.itemData(i) == current_val:
-                        cmb.setCurrentIndex(i)
-                        break
+                cmb.addItem(_("config.translations.loading"), None)
+                cmb.setEnabled(False)
                 form.addRow(_(label_key)+":", cmb)
                 return cmb
 
             # Slot1: sem opção Nenhuma, default = English 2009
-            cmb_slot1 = build_translation_combo(
-                "config.translation.slot1",
-                'translation_slot1',
-                'config.translation.slot1.tip',
-                allow_none=False,
-                force_default_idx=english_idx if english_idx != -1 else (0 if available_translations else None)
-            )
+            cmb_slot1 = build_translation_combo("config.translation.slot1", 'config.translation.slot1.tip')
             # Slot2: com opção Nenhuma, fallback default = Portuguese Alternative se ainda não escolhido
-            cmb_slot2 = build_translation_combo(
-                "config.translation.slot2",
-                'translation_slot2',
-                'config.translation.slot2.tip',
-                allow_none=True,
-                fallback_default_idx=portuguese_alt_idx if portuguese_alt_idx != -1 else -1
-            )
+            cmb_slot2 = build_translation_combo("config.translation.slot2", 'config.translation.slot2.tip')
             # Slot3: com opção Nenhuma, sem default especial
-            cmb_slot3 = build_translation_combo(
-                "config.translation.slot3",
-                'translation_slot3',
-                'config.translation.slot3.tip',
-                allow_none=True
-            )
+            cmb_slot3 = build_translation_combo("config.translation.slot3", 'config.translation.slot3.tip')
+            # Situação dos arquivos locais das traduções escolhidas
+            lbl_files_status = QLabel(_("config.translations.loading"), translations_box)
+            lbl_files_status.setWordWrap(True)
+            lbl_files_status.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+
+            def _fill_translation_combo(cmb: QComboBox, slot_attr: str, allow_none: bool, force_default_id: int|None=None, fallback_default_id: int|None=None):
+                catalog = catalog_state['catalog']
+                cmb.blockSignals(True)
+                try:
+                    cmb.clear()
+                    # Itens ordenados por descrição; o dado do item é o LanguageID
+                    if allow_none:
+                        cmb.addItem(_("config.translation.none"), -1)
+                    for info in catalog.sorted_by_description():
+                        cmb.addItem(info.description, info.language_id)
+                    # Determina valor salvo
+                    current_val = getattr(settings, slot_attr, -1)
+                    # Aplica lógica de default forçado (slot1 deve ser English 2009)
+                    if force_default_id is not None:
+                        # Se ainda não selecionado (valor -1 ou inválido), define para default
+                        if current_val == -1 or current_val not in catalog:
+                            current_val = force_default_id
+                            setattr(settings, slot_attr, current_val)
+                            settings.save()
+                    elif (current_val == -1 or current_val not in catalog) and fallback_default_id is not None:
+                        # Usa fallback (ex.: Portuguese Alternative para slot2)
+                        current_val = fallback_default_id
+                        setattr(settings, slot_attr, current_val)
+                        settings.save()
+                    # Seleciona no combo
+                    for i in range(cmb.count()):
+                        if cmb.itemData(i) == current_val:
+                            cmb.setCurrentIndex(i)
+                            break
+                finally:
+                    cmb.blockSignals(False)
+                cmb.setEnabled(True)
 
             # Prevenção de duplicação entre combos
             translation_combo_map = {
@@ -388,10 +332,123 @@ class ToolBar_Configuracao(ToolBar_Base):
                                     other_cmb.setCurrentIndex(0)
                                     setattr(settings, attr, -1)
                 settings.save()
+                _start_status_check()
 
             for c in translation_combo_map.keys():
                 c.currentIndexChanged.connect(lambda _i, cmb=c: _on_translation_change(cmb))  # type: ignore
             translations_layout.addLayout(form)
+            translations_layout.addWidget(lbl_files_status)
+            # Verificação profunda: recalcula o MD5 de todos os arquivos ao fechar (não é persistida)
+            chk_deep_verify = QCheckBox(_("config.translations.deep_verify"), translations_box)
+            chk_deep_verify.setToolTip(_("config.translations.deep_verify.tip"))
+            translations_layout.addWidget(chk_deep_verify)
+
+            class _CatalogSignals(QObject):
+                loaded = Signal(object)                   # TranslationCatalog
+                status = Signal(int, list)                # geração, lista de TranslationFileStatus
+            _catalog_signals = _CatalogSignals(dialog)
+            status_generation = {'n': 0}
+
+            def _load_catalog_worker():
+                try:
+                    catalog = TranslationCatalog.load()
+                except Exception:
+                    catalog = TranslationCatalog([])
+                try:
+                    _catalog_signals.loaded.emit(catalog)
+                except RuntimeError:  # diálogo já fechado
+                    pass
+
+            def _status_worker(generation: int, infos: list):
+                # MD5 dos TR###.gz: sempre fora da thread da interface
+                statuses = []
+                try:
+                    from show_translations import ShowTranslation
+                    extraction = ShowTranslation(base_dir=Path('.')).extraction_status
+                except Exception:
+                    extraction = None
+                ledger = get_ledger(Path('doc_sources'))
+                with PerfEvents.span('config.translations.status', files=len(infos)):
+                    for info in infos:
+                        statuses.append(translation_file_status(info, Path('doc_sources'), extraction, ledger=ledger))
+                ledger.save()
+                try:
+                    _catalog_signals.status.emit(generation, statuses)
+                except RuntimeError:
+                    pass
+
+            def _start_status_check():
+                catalog = catalog_state['catalog']
+                ids = [settings.translation_slot1, settings.translation_slot2, settings.translation_slot3]
+                infos = [catalog.get(i) for i in dict.fromkeys(ids) if isinstance(i, int) and i >= 0]
+                infos = [info for info in infos if info is not None]
+                status_generation['n'] += 1
+                if not infos:
+                    lbl_files_status.setText("")
+                    return
+                lbl_files_status.setText(_("config.translations.status.checking"))
+                threading.Thread(target=_status_worker, args=(status_generation['n'], infos), daemon=True).start()
+
+            def _describe_status(st) -> str:
+                info = catalog_state['catalog'].get(st.language_id)
+                desc = info.description if info else str(st.language_id)
+                if not st.present:
+                    state = _("config.translations.status.missing")
+                else:
+                    parts = [f"{st.size / (1024 * 1024):.1f} MB"]
+                    if st.hash_ok is True:
+                        parts.append(_("config.translations.status.hash.ok"))
+                    elif st.hash_ok is False:
+                        parts.append(_("config.translations.status.hash.bad"))
+                    if st.extraction == 'ok':
+                        parts.append(_("config.translations.status.extracted"))
+                    elif st.extraction == 'stale':
+                        parts.append(_("config.translations.status.outdated"))
+                    elif st.extraction == 'pending':
+                        parts.append(_("config.translations.status.not_extracted"))
+                    state = ", ".join(parts)
+                return _("config.translations.status.line").format(file=st.archive, desc=desc, state=state)
+
+            def _on_status(generation: int, statuses: list):
+                if generation != status_generation['n']:
+                    return  # seleção mudou enquanto verificava
+                lbl_files_status.setText("\n".join(_describe_status(st) for st in statuses))
+
+            def _on_catalog_loaded(catalog):
+                catalog_state['catalog'] = catalog
+                if not len(catalog):
+                    lbl_files_status.setText(_("config.translations.catalog.empty"))
+                    return
+                if migrate_translation_slots(settings, catalog):
+                    settings.save()
+                english_info = catalog.find_description(DEFAULT_SLOT1_DESCRIPTION)
+                portuguese_alt_info = catalog.find_description(DEFAULT_SLOT2_DESCRIPTION)
+                _fill_translation_combo(cmb_slot1, 'translation_slot1', allow_none=False,
+                                        force_default_id=english_info.language_id if english_info else catalog.items[0].language_id)
+                _fill_translation_combo(cmb_slot2, 'translation_slot2', allow_none=True,
+                                        fallback_default_id=portuguese_alt_info.language_id if portuguese_alt_info else -1)
+                _fill_translation_combo(cmb_slot3, 'translation_slot3', allow_none=True)
+                cmb_edit = edit_refs.get('cmb')
+                if cmb_edit is not None:
+                    cmb_edit.blockSignals(True)
+                    cmb_edit.clear()
+                    cmb_edit.addItem(_("config.translation.none"), -1)
+                    for info in catalog:
+                        cmb_edit.addItem(info.description, info.language_id)
+                    initial_edit_id = getattr(settings, 'translation_edit_target', -1)
+                    for i_c in range(cmb_edit.count()):
+                        if cmb_edit.itemData(i_c) == initial_edit_id:
+                            cmb_edit.setCurrentIndex(i_c)
+                            break
+                    cmb_edit.blockSignals(False)
+                    cmb_edit.setEnabled(btn_close.isEnabled())
+                if not btn_close.isEnabled():  # verificação em andamento: mantém desabilitado
+                    for c in translation_combo_map:
+                        c.setEnabled(False)
+                _start_status_check()
+
+            _catalog_signals.loaded.connect(_on_catalog_loaded)
+            _catalog_signals.status.connect(_on_status)
             tab_trans_layout.addWidget(translations_box)
             tab_trans_layout.addStretch(1)
             tab_cfg_layout.addStretch(1)
@@ -401,6 +458,9 @@ class ToolBar_Configuracao(ToolBar_Base):
             # Novas abas adicionadas ao final conforme solicitado
             tabs.addTab(tab_buscas, _("tab.buscas.title"))
             tabs.addTab(tab_tr_exec, _("tab.traducao.execucao.title"))
+            tab_diag, refresh_diag = self._build_diagnostics_tab(dialog)
+            tabs.addTab(tab_diag, _("config.tab.diagnostics"))
+            tabs.currentChanged.connect(lambda i: refresh_diag() if tabs.widget(i) is tab_diag else None)  # type: ignore
 
             # Removido botão Aplicar (aplicação imediata). Mantém apenas Fechar.
             btn_close = QPushButton(_("config.close"), dialog)
@@ -428,7 +488,8 @@ class ToolBar_Configuracao(ToolBar_Base):
                 finished = Signal(bool, list)             # sucesso geral, lista de índices que falharam
             _signals = _TransSignals()
 
-            def _verify_and_download():
+            @timed('config.verify_download')
+            def _verify_and_download(deep: bool = False):
                 try:
                     AmadonLogging = None
                     try:
@@ -438,50 +499,46 @@ class ToolBar_Configuracao(ToolBar_Base):
                         pass
                     if AmadonLogging:
                         AmadonLogging.info(self.context, _("config.translations.check.start"))
-                    # Map idxOriginal -> item dict
-                    idx_map = {i: it for i, it in enumerate(available_translations)}
+                    # Slots guardam LanguageIDs; o catálogo é relido só se o arquivo mudou
+                    current_catalog = TranslationCatalog.load()
+                    # Fechar antes de o catálogo chegar à interface: slots ainda podem ser posições antigas
+                    if migrate_translation_slots(settings, current_catalog):
+                        settings.save()
                     slots = [settings.translation_slot1, settings.translation_slot2, settings.translation_slot3]
                     any_download = False
                     had_failure = False
                     failed_indices: list[int] = []
+                    # MD5 via registro (só recalcula arquivos alterados); verificação
+                    # profunda recalcula todos, em paralelo
+                    ledger = get_ledger(Path('doc_sources'))
+                    chosen = [current_catalog.get(v) for v in slots if isinstance(v, int) and v >= 0]
+                    to_check = [Path('doc_sources') / i.archive_name for i in chosen if i is not None and i.hash]
+                    to_check = [p for p in to_check if p.exists()]
+                    PerfMetrics.count('translation.hash.check', len(to_check))
+                    misses_before = ledger.misses
+                    digests = ledger.md5_many(to_check, deep=deep)
+                    PerfMetrics.count('translation.hash.rehash', ledger.misses - misses_before)
                     for slot_val in slots:
                         if slot_val is None or slot_val < 0:
                             continue
-                        item = idx_map.get(slot_val)
-                        if not item:
+                        info = current_catalog.get(slot_val)
+                        if info is None:
                             continue
-                        # Determina o LanguageID de forma robusta (converte para int; fallback = slot_val)
-                        try:
-                            lang_raw = item.get('LanguageID') if isinstance(item, dict) else getattr(item, 'LanguageID', slot_val)
-                        except Exception:
-                            lang_raw = slot_val
-                        try:
-                            lang_id = int(lang_raw)
-                        except Exception:
-                            lang_id = slot_val if isinstance(slot_val, int) else 0
-                        fname = f"TR{lang_id:03d}.gz"
+                        lang_id = info.language_id
+                        fname = info.archive_name
                         local_dir = os.path.join('doc_sources')
                         os.makedirs(local_dir, exist_ok=True)
                         local_path = os.path.join(local_dir, fname)
-                        expected_hash = str(item.get('Hash') or item.get('hash') or '').strip().lower()
+                        expected_hash = info.hash
                         need_download = False
                         if not os.path.exists(local_path):
                             need_download = True
                             if AmadonLogging:
                                 AmadonLogging.warning(self.context, _("config.translations.file.missing").format(file=fname))
-                        else:
-                            if expected_hash:
-                                try:
-                                    h = hashlib.md5()
-                                    with open(local_path, 'rb') as fbin:
-                                        for chunk in iter(lambda: fbin.read(65536), b''):
-                                            h.update(chunk)
-                                    if h.hexdigest().lower() != expected_hash:
-                                        need_download = True
-                                        if AmadonLogging:
-                                            AmadonLogging.warning(self.context, _("config.translations.hash.mismatch").format(file=fname))
-                                except Exception:
-                                    need_download = True
+                        elif expected_hash and digests.get(Path(local_path)) != expected_hash:
+                            need_download = True
+                            if AmadonLogging:
+                                AmadonLogging.warning(self.context, _("config.translations.hash.mismatch").format(file=fname))
                         if need_download:
                             any_download = True
                             _signals.progress.emit(_("config.translations.downloading.ui").format(idx=slot_val))
@@ -506,15 +563,27 @@ class ToolBar_Configuracao(ToolBar_Base):
                                             raise RuntimeError(f"HTTP {status_code}")
                                         data = resp.read()
                                     # Verifica hash antes de gravar (se houver hash esperado)
-                                    if expected_hash:
-                                        h2 = hashlib.md5(); h2.update(data)
-                                        if h2.hexdigest().lower() != expected_hash:
-                                            raise ValueError("MD5 mismatch")
+                                    downloaded_md5 = hashlib.md5(data).hexdigest().lower()
+                                    if expected_hash and downloaded_md5 != expected_hash:
+                                        raise ValueError("MD5 mismatch")
                                     # Escreve somente após validação
                                     with open(local_path, 'wb') as fout:
                                         fout.write(data)
+                                    ledger.record(Path(local_path), downloaded_md5)
                                     duration = time.monotonic() - start_t
                                     size_bytes = len(data)
+                                    PerfEvents.emit('translation.download', ms=duration * 1000.0, bytes=size_bytes, lang_id=lang_id, attempt=attempt, ok=True)
+                                    if getattr(settings, 'translation_keep_versions', False):
+                                        # Guarda a versão baixada no armazenamento deduplicado (doc_sources/.store)
+                                        try:
+                                            from show_translations import ShowTranslation
+                                            version = str(info.version or '').strip() or None
+                                            stored = ShowTranslation(base_dir=Path('.')).store_version(lang_id, version=version, catalog_hash=expected_hash or None)
+                                            if AmadonLogging:
+                                                AmadonLogging.info(self.context, _("config.translations.version.stored").format(file=fname, version=stored))
+                                        except Exception as e:  # noqa: BLE001
+                                            if AmadonLogging:
+                                                AmadonLogging.warning(self.context, _("config.translations.version.store.error").format(file=fname, erro=e))
                                     if AmadonLogging:
                                         # Log simples de sucesso + detalhado
                                         try:
@@ -528,12 +597,14 @@ class ToolBar_Configuracao(ToolBar_Base):
                                     break  # sucesso
                                 except Exception as e:  # noqa: BLE001
                                     duration = time.monotonic() - start_t
+                                    PerfEvents.emit('translation.download', ms=duration * 1000.0, lang_id=lang_id, attempt=attempt, ok=False, error=e.__class__.__name__)
                                     if AmadonLogging:
                                         try:
                                             AmadonLogging.warning(self.context, _("config.translations.download.error.url").format(idx=slot_val, url=raw_url, erro=e))
                                         except Exception:
                                             pass
                                     if attempt < max_attempts:
+                                        PerfMetrics.count('translation.download.retry')
                                         # Backoff exponencial
                                         wait_for = backoff_base * (2 ** (attempt - 1))
                                         if AmadonLogging:
@@ -553,6 +624,7 @@ class ToolBar_Configuracao(ToolBar_Base):
                                         try:
                                             if os.path.exists(local_path):
                                                 os.remove(local_path)
+                                            ledger.forget(Path(local_path))
                                         except Exception:
                                             pass
                                         had_failure = True
@@ -570,13 +642,17 @@ class ToolBar_Configuracao(ToolBar_Base):
                     except Exception:
                         failed_indices = []
                 finally:
+                    try:
+                        get_ledger(Path('doc_sources')).save()
+                    except Exception:
+                        pass
                     _signals.progress.emit(_("config.translations.done"))
                     try:
                         _signals.finished.emit(success_all, failed_indices)
                     except Exception:
                         pass
 
-            controls_to_disable = [cmb_slot1, cmb_slot2, cmb_slot3, chk_dark]
+            controls_to_disable = [cmb_slot1, cmb_slot2, cmb_slot3, chk_dark, chk_deep_verify]
             try:
                 controls_to_disable.append(cmb_font)
             except Exception:
@@ -587,12 +663,16 @@ class ToolBar_Configuracao(ToolBar_Base):
             except Exception:
                 pass
             # Incluir controles de edição de tradução
-            # (Edição de tradução será adicionada depois que criarmos os controles reais)
+            controls_to_disable.extend(w for w in (edit_refs.get('chk'), edit_refs.get('cmb'), edit_refs.get('repo')) if w is not None)
+
+            # Combos preenchidos pelo catálogo: até ele chegar só têm o item "carregando" (dado None)
+            catalog_combos = [cmb_slot1, cmb_slot2, cmb_slot3, edit_refs.get('cmb')]
 
             def _set_controls_enabled(flag: bool):
+                catalog_ready = bool(len(catalog_state['catalog']))
                 for w in controls_to_disable:
                     try:
-                        w.setEnabled(flag)
+                        w.setEnabled(flag and (catalog_ready or w not in catalog_combos))
                     except Exception:
                         pass
                 btn_close.setEnabled(flag)
@@ -609,7 +689,7 @@ class ToolBar_Configuracao(ToolBar_Base):
                 _set_controls_enabled(False)
                 log_box.appendPlainText("")
                 log_box.appendPlainText("== " + _("config.translations.verifying") + " ==")
-                threading.Thread(target=_verify_and_download, daemon=True).start()
+                threading.Thread(target=_verify_and_download, args=(chk_deep_verify.isChecked(),), daemon=True).start()
 
             def _on_progress(msg: str):
                 log_box.appendPlainText(msg)
@@ -636,7 +716,7 @@ class ToolBar_Configuracao(ToolBar_Base):
                             sel_id = cmb_ref.itemData(cmb_ref.currentIndex())
                             if isinstance(sel_id, int):
                                 settings.translation_edit_target = sel_id
-                            else:
+                            elif sel_id is not None:  # None = catálogo ainda carregando
                                 settings.translation_edit_target = -1
                             settings.translation_edit_repo_base = repo_ref.text().strip()
                     except Exception:
@@ -669,10 +749,93 @@ class ToolBar_Configuracao(ToolBar_Base):
             btn_retry.clicked.connect(_start_verification_and_close)
 
             dialog.resize(600, 520)
+            threading.Thread(target=_load_catalog_worker, daemon=True).start()
             dialog.exec()
         except Exception:
             pass
 
+    def _build_diagnostics_tab(self, dialog):
+        """Cria a aba Diagnóstico (histogramas de `PerfMetrics`).
+
+        Retorna (widget, função de atualização da tabela).
+        """
+        tab = QWidget()
+        tab_layout = QVBoxLayout(tab)
+        tab_layout.setContentsMargins(8,8,8,8)
+        tab_layout.setSpacing(6)
+        chk_enable = QCheckBox(_("config.diag.enable"), tab)
+        chk_enable.setChecked(PerfMetrics.enabled())
+        chk_enable.setToolTip(_("config.diag.enable.tip"))
+        tab_layout.addWidget(chk_enable)
+        columns = ["config.diag.col.name", "config.diag.col.count", "config.diag.col.mean",
+                   "config.diag.col.p50", "config.diag.col.p95", "config.diag.col.max"]
+        table = QTableWidget(0, len(columns), tab)
+        table.setHorizontalHeaderLabels([_(c) for c in columns])
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        tab_layout.addWidget(table, 1)
+        lbl_info = QLabel(tab)
+        lbl_info.setWordWrap(True)
+        tab_layout.addWidget(lbl_info)
+        buttons = QHBoxLayout()
+        btn_refresh = QPushButton(_("config.diag.refresh"), tab)
+        btn_reset = QPushButton(_("config.diag.reset"), tab)
+        btn_export = QPushButton(_("config.diag.export"), tab)
+        btn_export.setToolTip(_("config.diag.export.tip"))
+        buttons.addWidget(btn_refresh)
+        buttons.addWidget(btn_reset)
+        buttons.addWidget(btn_export)
+        buttons.addStretch(1)
+        tab_layout.addLayout(buttons)
+
+        def _refresh():
+            snap = PerfMetrics.snapshot()
+            rows = [(name, st) for name, st in snap['timers'].items()]
+            rows += [(name, {'count': n}) for name, n in snap['counters'].items()]
+            table.setRowCount(len(rows))
+            for r, (name, st) in enumerate(rows):
+                values = [name, str(st['count'])]
+                for key in ('mean', 'p50', 'p95', 'max'):
+                    values.append(f"{st[key]:.2f}" if key in st else "-")
+                for c, text in enumerate(values):
+                    cell = QTableWidgetItem(text)
+                    if c:
+                        cell.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                    table.setItem(r, c, cell)
+            state_key = "config.diag.state.on" if PerfMetrics.enabled() else "config.diag.state.off"
+            lbl_info.setText(_(state_key))
+
+        def _toggle(_state: int):
+            PerfMetrics.enable(chk_enable.isChecked())
+            settings.perf_metrics_enabled = chk_enable.isChecked()
+            settings.save()
+            _refresh()
+
+        def _reset():
+            PerfMetrics.reset()
+            _refresh()
+
+        def _export():
+            path, _filter = QFileDialog.getSaveFileName(
+                dialog, _("config.diag.export"), "amadon_metrics.json", "JSON (*.json);;CSV (*.csv)"
+            )
+            if not path:
+                return
+            try:
+                out = PerfMetrics.export(path)
+                from mensagens import AmadonLogging
+                AmadonLogging.info(self.context, _("config.diag.exported").format(path=out))
+            except Exception as e:  # noqa: BLE001
+                QMessageBox.warning(dialog, _("config.diag.export"), str(e))
+
+        chk_enable.stateChanged.connect(_toggle)  # type: ignore
+        btn_refresh.clicked.connect(_refresh)  # type: ignore
+        btn_reset.clicked.connect(_reset)  # type: ignore
+        btn_export.clicked.connect(_export)  # type: ignore
+        _refresh()
+        return tab, _refresh
+
     def _update_webview_font(self, panel, font):
         """Aplica fonte às instâncias de QWebEngineView já carregadas."""
         try:
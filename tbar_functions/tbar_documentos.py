@@ -9,26 +9,103 @@ from PySide6.QtWidgets import (
 )
 from pathlib import Path
 from PySide6.QtWidgets import QApplication
-from document_resolver import resolve_doc_link
+from document_resolver import refresh_anchor_index, resolve_doc_link
+from busca.analyzer import fold
+from perf_events import PerfEvents
+from perf_metrics import timed
+
+
+def web_engine_available() -> bool:
+    """True se QWebEngineView pode ser usado (sem ele não há JS para a renderização em janela)."""
+    try:
+        from PySide6.QtWebEngineWidgets import QWebEngineView  # type: ignore  # noqa: F401
+    except Exception:
+        return False
+    return True
+
+def documentos_assets() -> tuple[str, str]:
+    """CSS e JS do painel de documento (assets/css/documentos.css, assets/js/documentos.js)."""
+    base = Path(__file__).resolve().parent.parent
+    try:
+        css = (base / 'assets' / 'css' / 'documentos.css').read_text(encoding='utf-8')
+    except Exception:
+        css = "body{font-family:Segoe UI,Arial,sans-serif;}"
+    try:
+        js = (base / 'assets' / 'js' / 'documentos.js').read_text(encoding='utf-8')
+    except Exception:
+        js = "console.warn('documentos.js não encontrado');"
+    return css, js
+
+
+def render_document_page(title: str, link: str, highlight=None) -> str:
+    """Corpo HTML do painel direito para o link lógico `link` (doc://...).
+
+    `highlight` (id do parágrafo -> trechos em posições de token) marca os
+    acertos da Busca durante a montagem (ver `document_resolver.mark_hits`).
+    """
+    try:
+        from app_settings import settings as _settings
+        windowed = bool(getattr(_settings, 'doc_windowed_rendering', True))
+    except Exception:  # pragma: no cover
+        windowed = False
+    resolved = resolve_doc_link(str(link), windowed=windowed and web_engine_available(), highlight=highlight)
+    return f"""
+    <div class='container py-3'>
+        <h2>{title}</h2>
+        <p class='text-muted small mb-2'>ID lógico: <code>{link}</code></p>
+        <div class='mb-3 doc-content'>{resolved}</div>
+        <button id='btnCount' class='btn btn-primary btn-sm'>Clique para contar <span class='badge text-bg-light' id='ctr'>0</span></button>
+        <hr/>
+        <p class='footer-note text-secondary'>Renderizado em tempo real. Markdown suportado.</p>
+    </div>
+    """
+
+
+def populate_tree(tree: QTreeWidget, nodes: list[dict]) -> int:
+    """Preenche `tree` com os nós {"titulo", "link", "filhos"}; retorna total de itens.
+
+    O link lógico fica em `item.data(0, 32)` (Qt.UserRole).
+    """
+    style = QApplication.instance().style() if QApplication.instance() else None
+    icons = []
+    if style:
+        icons = [
+            style.standardIcon(style.StandardPixmap.SP_DirIcon),
+            style.standardIcon(style.StandardPixmap.SP_FileDialogListView),
+            style.standardIcon(style.StandardPixmap.SP_FileIcon),
+        ]
+    count = 0
+
+    def add_nodes(parent_item, nodes, level=0):
+        nonlocal count
+        for n in nodes:
+            titulo = n.get("titulo", "(sem título)")
+            item = QTreeWidgetItem([titulo])
+            item.setData(0, 32, n.get("link"))
+            if icons:
+                item.setIcon(0, icons[min(level, 2)])
+            if parent_item:
+                parent_item.addChild(item)
+            else:
+                tree.addTopLevelItem(item)
+            count += 1
+            filhos = n.get("filhos")
+            if filhos:
+                add_nodes(item, filhos, level + 1)
+    add_nodes(None, nodes)
+    return count
+
 
 class ToolBar_Documentos(ToolBar_Base):
+    @timed('documentos.init')
     def __init__(self, context=None):
         super().__init__(context)
         self._log_info("log.open.documentos")
         self._status_curto("status.curto.doc")
         self._status_principal("status.msg.documentos")
         base = Path(__file__).resolve().parent.parent
-        css_path = base / 'assets' / 'css' / 'documentos.css'
-        js_path = base / 'assets' / 'js' / 'documentos.js'
         tree_json = base / 'assets' / 'data' / 'documentos_tree.json'
-        try:
-            self._css_external = css_path.read_text(encoding='utf-8')
-        except Exception:
-            self._css_external = "body{font-family:Segoe UI,Arial,sans-serif;}"
-        try:
-            self._js_external = js_path.read_text(encoding='utf-8')
-        except Exception:
-            self._js_external = "console.warn('documentos.js não encontrado');"
+        self._css_external, self._js_external = documentos_assets()
 
         # Monta árvore (widget esquerdo)
         container = QWidget()
@@ -46,6 +123,8 @@ class ToolBar_Documentos(ToolBar_Base):
         self._tree = tree
         self._filter = filtro
         import json
+        import time
+        build_start = time.perf_counter()
         cls = self.__class__
         if not hasattr(cls, '_cache_data'):
             cls._cache_data = None  # type: ignore[attr-defined]
@@ -54,7 +133,8 @@ class ToolBar_Documentos(ToolBar_Base):
             mtime = tree_json.stat().st_mtime
         except Exception:
             mtime = None
-        if getattr(cls, '_cache_data') is None or getattr(cls, '_cache_mtime') != mtime:
+        json_cached = not (getattr(cls, '_cache_data') is None or getattr(cls, '_cache_mtime') != mtime)
+        if not json_cached:
             try:
                 data = json.loads(tree_json.read_text(encoding='utf-8'))
             except Exception:
@@ -63,29 +143,11 @@ class ToolBar_Documentos(ToolBar_Base):
             setattr(cls, '_cache_mtime', mtime)
         else:
             data = getattr(cls, '_cache_data')
-        style = QApplication.instance().style() if QApplication.instance() else None
-
-        def add_nodes(parent_item, nodes, level=0):
-            for n in nodes:
-                titulo = n.get("titulo", "(sem título)")
-                item = QTreeWidgetItem([titulo])
-                item.setData(0, 32, n.get("link"))
-                if style:
-                    if level == 0:
-                        item.setIcon(0, style.standardIcon(style.StandardPixmap.SP_DirIcon))
-                    elif level == 1:
-                        item.setIcon(0, style.standardIcon(style.StandardPixmap.SP_FileDialogListView))
-                    else:
-                        item.setIcon(0, style.standardIcon(style.StandardPixmap.SP_FileIcon))
-                if parent_item:
-                    parent_item.addChild(item)
-                else:
-                    tree.addTopLevelItem(item)
-                filhos = n.get("filhos")
-                if filhos:
-                    add_nodes(item, filhos, level + 1)
-        add_nodes(None, data.get("nodes", []))
+        node_count = populate_tree(tree, data.get("nodes", []))
         tree.expandToDepth(1)
+        PerfEvents.emit('doc.tree.build', ms=(time.perf_counter() - build_start) * 1000.0, nodes=node_count, json_cached=json_cached)
+        # Índice de âncoras (links doc://#âncora e referências cruzadas) atualizado em segundo plano
+        refresh_anchor_index()
 
         def on_item_clicked(item: QTreeWidgetItem):
             link = item.data(0, 32) or "(sem link)"
@@ -94,29 +156,25 @@ class ToolBar_Documentos(ToolBar_Base):
                 AmadonLogging.info(self.context, _("log.open.documentos.node").format(link=link))
             except Exception:
                 pass
-            resolved = resolve_doc_link(str(link))
-            body = f"""
-            <div class='container py-3'>
-                <h2>{item.text(0)}</h2>
-                <p class='text-muted small mb-2'>ID lógico: <code>{link}</code></p>
-                <div class='mb-3 doc-content'>{resolved}</div>
-                <button id='btnCount' class='btn btn-primary btn-sm'>Clique para contar <span class='badge text-bg-light' id='ctr'>0</span></button>
-                <hr/>
-                <p class='footer-note text-secondary'>Renderizado em tempo real. Markdown suportado.</p>
-            </div>
-            """
+            body = render_document_page(item.text(0), str(link))
             self.inject_web_content(body, target='right', clear=True, use_bootstrap=True, css=self._css_external, js=self._js_external)
         tree.itemClicked.connect(on_item_clicked)  # type: ignore
 
+        # Títulos já dobrados (sem acentos/caixa), como no índice da Busca
+        folded_titles: dict[str, str] = {}
         def apply_filter(text: str):
-            pattern = text.strip().lower()
+            pattern = fold(text.strip())
             def match_item(it: QTreeWidgetItem):
                 child_match = False
                 for i in range(it.childCount()):
                     child = it.child(i)
                     child_visible = match_item(child)
                     child_match = child_match or child_visible
-                own = pattern in it.text(0).lower() if pattern else True
+                raw = it.text(0)
+                title = folded_titles.get(raw)
+                if title is None:
+                    title = folded_titles[raw] = fold(raw)
+                own = pattern in title if pattern else True
                 visible = own or child_match
                 it.setHidden(not visible)
                 return visible
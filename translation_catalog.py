@@ -0,0 +1,240 @@
+"""Catálogo de traduções disponíveis (`AvailableTranslations.json`) em memória.
+
+O arquivo é lido uma única vez e mantido como registros compactos
+(`TranslationInfo`, com `__slots__`), indexados por LanguageID, Description e
+TIN. A instância compartilhada é revalidada pelo mtime/tamanho do arquivo:
+quando o download em segundo plano grava uma versão nova, a próxima chamada
+a `TranslationCatalog.load()` já devolve o catálogo atualizado.
+
+Uso:
+    from translation_catalog import TranslationCatalog
+    catalog = TranslationCatalog.load()
+    info = catalog.get(34)                       # por LanguageID
+    info = catalog.find_description('English 2009')
+    for info in catalog.sorted_by_description(): ...
+
+`translation_file_status` descreve o TR###.gz local de uma tradução (presença,
+tamanho, hash e extração); pode calcular MD5, então deve rodar fora da thread
+da interface.
+
+As escolhas de tradução em `settings.translation_slot1..3` guardam
+LanguageIDs; `migrate_translation_slots` converte valores antigos (posição na
+lista do arquivo) uma única vez.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from hash_ledger import HashLedger, compute_md5
+
+# Prioriza o arquivo baixado em 'downloads', depois o fallback em 'resources'
+CATALOG_PATHS = (
+    Path('downloads') / 'AvailableTranslations.json',
+    Path('resources') / 'AvailableTranslations.json',
+)
+
+DEFAULT_SLOT1_DESCRIPTION = 'English 2009'
+DEFAULT_SLOT2_DESCRIPTION = 'Portuguese Alternative'
+
+
+class TranslationInfo:
+    """Uma tradução do catálogo (campos do JSON em snake_case)."""
+
+    __slots__ = (
+        'position', 'language_id', 'description', 'version', 'tin', 'tub',
+        'text_button', 'culture_id', 'use_bold', 'right_to_left',
+        'starting_year', 'ending_year', 'paper_translation', 'is_editing', 'hash',
+    )
+
+    def __init__(self, position: int, data: dict[str, Any]) -> None:
+        self.position = position
+        try:
+            self.language_id = int(data.get('LanguageID'))  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            self.language_id = position
+        self.description = str(data.get('Description') or data.get('descricao') or data.get('description') or f"Item {position}")
+        self.version = data.get('Version')
+        self.tin = str(data.get('TIN') or '')
+        self.tub = str(data.get('TUB') or '')
+        self.text_button = str(data.get('TextButton') or '').strip()
+        self.culture_id = data.get('CultureID')
+        self.use_bold = bool(data.get('UseBold', False))
+        self.right_to_left = bool(data.get('RightToLeft', False))
+        self.starting_year = data.get('StartingYear')
+        self.ending_year = data.get('EndingYear')
+        self.paper_translation = str(data.get('PaperTranslation') or '')
+        self.is_editing = bool(data.get('IsEditingTranslation', False))
+        self.hash = str(data.get('Hash') or data.get('hash') or '').strip().lower()
+
+    @property
+    def archive_name(self) -> str:
+        return f"TR{self.language_id:03d}.gz"
+
+    def __repr__(self) -> str:
+        return f"TranslationInfo({self.language_id}, {self.description!r})"
+
+
+class TranslationCatalog:
+    """Lista imutável de `TranslationInfo` com índices para busca direta."""
+
+    _lock = threading.Lock()
+    _shared: dict[Path, tuple[tuple[int, int], 'TranslationCatalog']] = {}
+
+    def __init__(self, items: list[TranslationInfo], source: Path | None = None) -> None:
+        self.items: tuple[TranslationInfo, ...] = tuple(items)
+        self.source = source
+        self.by_id: dict[int, TranslationInfo] = {}
+        self.by_description: dict[str, TranslationInfo] = {}
+        self.by_tin: dict[str, TranslationInfo] = {}
+        for info in self.items:
+            self.by_id.setdefault(info.language_id, info)
+            self.by_description.setdefault(info.description.casefold(), info)
+            if info.tin:
+                self.by_tin.setdefault(info.tin.casefold(), info)
+
+    # --- Carga ---
+    @staticmethod
+    def parse(data: Any) -> list[TranslationInfo]:
+        """Aceita {"AvailableTranslations": [...]} ou lista direta; ignora itens sem descrição."""
+        if isinstance(data, dict):
+            data = data.get('AvailableTranslations')
+        if not isinstance(data, list):
+            return []
+        raw = [d for d in data if isinstance(d, dict) and ('Description' in d or 'descricao' in d)]
+        return [TranslationInfo(i, d) for i, d in enumerate(raw)]
+
+    @classmethod
+    def from_file(cls, path: Path) -> 'TranslationCatalog':
+        data = json.loads(Path(path).read_text(encoding='utf-8'))
+        return cls(cls.parse(data), Path(path))
+
+    @classmethod
+    def load(cls, paths: tuple[Path, ...] | list[Path] = CATALOG_PATHS) -> 'TranslationCatalog':
+        """Catálogo compartilhado do primeiro arquivo válido em `paths`.
+
+        Só relê o arquivo quando mtime ou tamanho mudam; sem arquivo válido
+        devolve um catálogo vazio.
+        """
+        for path in paths:
+            path = Path(path)
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            key = (st.st_mtime_ns, st.st_size)
+            with cls._lock:
+                cached = cls._shared.get(path)
+                if cached is not None and cached[0] == key:
+                    return cached[1]
+            try:
+                catalog = cls.from_file(path)
+            except Exception:
+                continue
+            with cls._lock:
+                cls._shared[path] = (key, catalog)
+            return catalog
+        return cls([])
+
+    @classmethod
+    def invalidate(cls) -> None:
+        with cls._lock:
+            cls._shared = {}
+
+    # --- Consultas ---
+    def get(self, language_id: int) -> TranslationInfo | None:
+        return self.by_id.get(language_id)
+
+    def find_description(self, description: str) -> TranslationInfo | None:
+        return self.by_description.get(description.casefold())
+
+    def find_tin(self, tin: str) -> TranslationInfo | None:
+        return self.by_tin.get(tin.casefold())
+
+    def sorted_by_description(self) -> list[TranslationInfo]:
+        return sorted(self.items, key=lambda info: info.description.lower())
+
+    def __iter__(self) -> Iterator[TranslationInfo]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, language_id: object) -> bool:
+        return language_id in self.by_id
+
+
+SLOT_ATTRS = ('translation_slot1', 'translation_slot2', 'translation_slot3')
+
+
+_migrate_lock = threading.Lock()
+
+
+def migrate_translation_slots(settings: Any, catalog: TranslationCatalog) -> bool:
+    """Converte slots salvos como posição na lista para LanguageID (uma única vez).
+
+    Chamada pela interface (catálogo carregado) e pela verificação (thread
+    própria); o lock garante que os valores não sejam convertidos duas vezes.
+    Retorna True se alguma configuração foi alterada (o chamador salva).
+    """
+    with _migrate_lock:
+        if getattr(settings, 'translation_slots_by_id', False) or not len(catalog):
+            return False
+        for attr in SLOT_ATTRS:
+            value = getattr(settings, attr, -1)
+            if isinstance(value, int) and 0 <= value < len(catalog.items):
+                setattr(settings, attr, catalog.items[value].language_id)
+            elif value != -1:
+                setattr(settings, attr, -1)
+        settings.translation_slots_by_id = True
+        return True
+
+
+class TranslationFileStatus:
+    """Situação local de uma tradução: arquivo TR###.gz e pasta extraída."""
+
+    __slots__ = ('language_id', 'archive', 'present', 'size', 'hash_ok', 'extraction')
+
+    def __init__(self, language_id: int, archive: str, present: bool = False, size: int = 0,
+                 hash_ok: bool | None = None, extraction: str | None = None) -> None:
+        self.language_id = language_id
+        self.archive = archive
+        self.present = present
+        self.size = size
+        self.hash_ok = hash_ok          # None = sem hash no catálogo ou arquivo ausente
+        self.extraction = extraction    # estados de ShowTranslation.extraction_status
+
+    def __repr__(self) -> str:
+        return f"TranslationFileStatus({self.archive!r}, present={self.present}, hash_ok={self.hash_ok}, extraction={self.extraction!r})"
+
+
+def translation_file_status(info: TranslationInfo, sources_dir: Path,
+                            extraction: Callable[[int], str] | None = None,
+                            ledger: HashLedger | None = None) -> TranslationFileStatus:
+    """Confere o TR###.gz de `info` em `sources_dir` (MD5 contra o hash do catálogo).
+
+    `extraction`, se informado, recebe o LanguageID e devolve o estado da pasta
+    extraída (ex.: `ShowTranslation.extraction_status`). Com `ledger`, o MD5
+    só é recalculado se o arquivo mudou desde a última verificação.
+    """
+    path = Path(sources_dir) / info.archive_name
+    status = TranslationFileStatus(info.language_id, info.archive_name)
+    try:
+        status.size = path.stat().st_size
+    except OSError:
+        return status
+    status.present = True
+    if info.hash:
+        try:
+            digest = ledger.md5(path) if ledger is not None else compute_md5(path)
+            status.hash_ok = digest == info.hash
+        except OSError:
+            status.hash_ok = False
+    if extraction is not None:
+        try:
+            status.extraction = extraction(info.language_id)
+        except Exception:
+            status.extraction = None
+    return status
@@ -0,0 +1,35 @@
+import pytest
+
+from perf_events import PerfEvents
+
+
+@pytest.fixture(autouse=True)
+def no_perf_events(monkeypatch):
+    """Eventos de desempenho desligados: `logs/amadon_perf.jsonl` é relativo ao diretório atual."""
+    monkeypatch.setattr(PerfEvents, '_enabled', False)
+
+
+@pytest.fixture()
+def docs_folder(tmp_path):
+    """Fábrica `docs_folder(paragraphs, subdir='')`: grava pares (id, texto) como `<p id=…>`.
+
+    Um DocNNN.html por documento do id (p001_… -> Doc001.html); retorna a pasta.
+    """
+    def make(paragraphs, subdir: str = ''):
+        folder = tmp_path / subdir if subdir else tmp_path
+        folder.mkdir(parents=True, exist_ok=True)
+        docs: dict[str, list[str]] = {}
+        for pid, text in paragraphs:
+            docs.setdefault(pid[1:4], []).append(f'<p id="{pid}">{text}</p>')
+        for paper, rows in docs.items():
+            (folder / f'Doc{paper}.html').write_text(''.join(rows), encoding='utf-8')
+        return folder
+    return make
+
+
+@pytest.fixture()
+def forbid_build(monkeypatch):
+    """`forbid_build(Classe)`: falha o teste se o índice for reconstruído em vez de carregado do disco."""
+    def forbid(cls):
+        monkeypatch.setattr(cls, 'build', lambda *a, **k: pytest.fail('deveria carregar do disco'))
+    return forbid
@@ -0,0 +1,55 @@
+from busca.analyzer import Analyzer, fold, get_analyzer, language_for_culture
+from busca.positional_index import PositionalIndex
+from busca.query import Term, parse_query
+
+
+def test_fold_removes_accents_and_case():
+    assert fold('Paraíso ÇÃO Ñandú') == 'paraiso cao nandu'
+    assert fold('ﬁnal') == 'final'
+    assert fold('한국어') == '한국어'  # sílabas recompostas após NFKD
+
+
+def test_language_for_culture():
+    assert language_for_culture(1046) == 'pt'
+    assert language_for_culture(3082) == 'es'
+    assert language_for_culture('en-US') == 'en'
+    assert language_for_culture(None) == ''
+    assert get_analyzer(1046) is get_analyzer(2070)  # pt-BR e pt-PT compartilham regras
+
+
+def test_minimal_stemmers():
+    pt = get_analyzer(1046)
+    assert pt.terms('Corações dos Homens, papéis e lençóis; mulheres') == \
+        ['coracao', 'dos', 'homem', 'papel', 'e', 'lencol', 'mulher']
+    assert get_analyzer(3082).terms('luces ciudades') == ['luz', 'ciudad']
+    assert get_analyzer(1033).terms('bodies churches thoughts') == ['body', 'church', 'thought']
+    assert Analyzer().terms('Corações') == ['coracoes']  # idioma desconhecido: só dobra
+
+
+def test_batch_matches_single_and_spans():
+    pt = get_analyzer(1046)
+    texts = ['Luz e vida', 'As luzes eternas', '']
+    assert pt.analyze_batch(texts) == [pt.terms(t) for t in texts]
+    text = 'Corações e coração'
+    positions = pt.term_positions(text, pt.terms('coração'))
+    assert positions == [(0, 0), (2, 2)]
+    assert [text[s:e] for s, e in pt.span_offsets(text, positions + [(0, 2), (2, 3)])] == ['Corações', 'coração', text]
+
+
+def test_index_query_and_stopwords():
+    pt = get_analyzer(1046)
+    index = PositionalIndex.build([('p1', 'O Pai do Paraíso'), ('p2', 'Os pais da terra')], analyzer=pt)
+    assert [pid for pid, _ in index.search('PARAISO')] == ['p1']
+    assert {pid for pid, _ in index.search('pai')} == {'p1', 'p2'}
+    assert [pid for pid, _ in index.search('"pai do paraíso"')] == ['p1']  # stopword dentro de frase
+    assert isinstance(parse_query('pai do', pt, pt.stopwords), Term)  # 'do' solto é ignorado
+
+
+def test_hit_spans_whole_phrases_without_loose_stopwords():
+    pt = get_analyzer(1046)
+    index = PositionalIndex.build([('p1', 'A Trindade do Paraíso e o Filho do Pai'), ('p2', 'Filho do Paraíso')], analyzer=pt)
+    assert index.hit_spans('"Trindade do Paraíso"') == {0: [(1, 3)]}  # só a frase: o outro "do" não
+    assert index.hit_spans('"trindade do paraíso" filho do') == {0: [(1, 3), (6, 6)]}
+    assert index.hit_spans('filho -trindade') == {1: [(0, 0)]}
+    assert index.hit_spans('trindade NEAR/2 paraíso OR paraíso') == {0: [(1, 3)], 1: [(2, 2)]}
+    assert index.hit_spans('trindade filho', matched_only=False) == {0: [(1, 1), (6, 6)], 1: [(0, 0)]}
@@ -0,0 +1,80 @@
+import threading
+from pathlib import Path
+
+from anchor_index import INDEX_NAME, PARALLEL_MIN_FILES, AnchorIndex, render_bytes
+
+
+def _docs(tmp_path: Path) -> Path:
+    docs = tmp_path / 'docs'
+    docs.mkdir()
+    (docs / 'Doc001.html').write_text(
+        '<h1 id="p001_000_000">Título</h1>\n<h2 id="p001_001_000">Seção</h2>\n<p id="p001_001_001">ção</p>', encoding='utf-8')
+    (docs / 'Doc002.md').write_text('<h1 id="p002_000_000">T</h1>\n\n<a id="p002_001_001"></a>Texto\n', encoding='utf-8')
+    return docs
+
+
+def test_lookup_offset_and_level(tmp_path):
+    docs = _docs(tmp_path)
+    index = AnchorIndex(docs)
+    stats = index.update(jobs=1)
+    assert stats == {'files': 2, 'cached': 0, 'scanned': 2, 'removed': 0}
+    name, offset, level = index.lookup('p001_001_001')
+    assert (name, level) == ('Doc001.html', 0)
+    # offset em bytes aponta para a tag no HTML final
+    assert render_bytes(docs / name)[offset:].startswith(b'<p id="p001_001_001"')
+    assert index.lookup('p001_001_000')[2] == 2
+    assert index.lookup('p002_000_000') == ('Doc002.md', 0, 1)
+    assert index.lookup('p999_000_000') is None
+    assert index.file_anchors('Doc002.md') == {'p002_000_000', 'p002_001_001'}
+
+
+def test_persisted_and_incremental(tmp_path):
+    docs = _docs(tmp_path)
+    index = AnchorIndex(docs)
+    index.update(jobs=1)
+    index.save()
+    assert (docs / INDEX_NAME).exists()
+
+    again = AnchorIndex.load(docs)
+    assert len(again) == 5
+    assert again.update(jobs=1)['scanned'] == 0
+
+    (docs / 'Doc002.md').unlink()
+    (docs / 'Doc003.html').write_text('<p id="p001_000_000">dup</p>', encoding='utf-8')
+    stats = again.update(jobs=1)
+    assert (stats['scanned'], stats['removed']) == (1, 1)
+    assert 'p002_000_000' not in again
+    assert [e[0] for e in again.duplicates['p001_000_000']] == ['Doc001.html', 'Doc003.html']
+    assert again.lookup('p001_000_000')[0] == 'Doc001.html'
+
+
+def test_parallel_update_matches_serial(tmp_path):
+    docs = tmp_path / 'docs'
+    docs.mkdir()
+    for n in range(PARALLEL_MIN_FILES):
+        (docs / f'Doc{n:03d}.html').write_text(f'<p id="p{n:03d}_001_001">x</p>', encoding='utf-8')
+    index = AnchorIndex(docs)
+    assert index.update(jobs=2)['scanned'] == PARALLEL_MIN_FILES
+    assert index.lookup('p003_001_001') == ('Doc003.html', 0, 0)
+
+
+def test_resolver_uses_index_for_anchor_only_and_cross_links(tmp_path, monkeypatch):
+    import document_resolver as dr
+    docs = _docs(tmp_path)
+    monkeypatch.setattr(dr, 'CONTENT_ROOT', docs)
+    monkeypatch.setattr(dr, '_anchor_index', None)
+    scans = []
+    update = AnchorIndex.update
+    monkeypatch.setattr(AnchorIndex, 'update', lambda self, *a, **k: scans.append(threading.current_thread().name) or update(self, *a, **k))
+    # âncora no próprio arquivo: nenhum índice é consultado
+    assert 'Título' in dr.resolve_doc_link('doc://Doc001.html#p001_001_001')
+    assert scans == [] and dr._anchor_index is None
+    # sem arquivo: espera a varredura, que roda fora da thread chamadora
+    assert 'Texto' in dr.resolve_doc_link('doc://#p002_001_001')
+    assert scans == ['AnchorIndexRefresh']
+    assert dr.owner_file('p002_001_001') == 'Doc002.html'
+    assert 'Texto' in dr.resolve_doc_link('doc://Doc001.html#p002_001_001')
+    # arquivo novo é encontrado: a falta no índice dispara nova varredura
+    (docs / 'Doc003.html').write_text('<p id="p003_001_001">Novo</p>', encoding='utf-8')
+    assert 'Novo' in dr.resolve_doc_link('doc://#p003_001_001')
+    assert dr.get_anchor_index().file_anchors('Doc003.html') is dr.get_anchor_index().file_anchors('Doc003.html')
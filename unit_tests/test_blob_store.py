@@ -0,0 +1,73 @@
+import gzip
+import io
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from show_translations import BlobStore, ShowTranslation
+from show_translations.blob_store import iter_chunks
+
+
+def _paper(n: int, changed: int | None = None) -> bytes:
+    lines = [f'<p id="p{n:03d}_001_{i:03d}">parágrafo {i} do documento {n}</p>\n' for i in range(1, 200)]
+    if changed is not None:
+        lines[changed] = f'<p id="p{n:03d}_001_{changed + 1:03d}">texto revisado</p>\n'
+    return ''.join(lines).encode('utf-8')
+
+
+def _write_tar_gz(path: Path, files: dict[str, bytes]):
+    with tarfile.open(path, mode='w:gz') as tf:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name=name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+
+
+@pytest.fixture()
+def st(tmp_path):
+    (tmp_path / 'doc_sources').mkdir()
+    return ShowTranslation(base_dir=tmp_path)
+
+
+def test_chunks_are_content_defined():
+    base = _paper(1)
+    edited = b'<p>novo</p>\n' + base
+    a = list(iter_chunks(io.BytesIO(base)))
+    b = list(iter_chunks(io.BytesIO(edited)))
+    assert b''.join(a) == base and len(a) > 3
+    # inserir uma linha no início só altera o primeiro bloco
+    assert a[1:] == b[1:]
+
+
+def test_versions_share_unchanged_content(st):
+    path = st.sources_dir / 'TR005.gz'
+    _write_tar_gz(path, {f'Doc{n:03d}.html': _paper(n) for n in range(10)})
+    st.store_version(5, version='1.0', catalog_hash='abc')
+    first = st.blob_store.usage()
+
+    _write_tar_gz(path, {**{f'Doc{n:03d}.html': _paper(n) for n in range(10)}, 'Doc003.html': _paper(3, changed=50)})
+    st.store_version(5, version='1.1')
+    second = st.blob_store.usage()
+    # apenas o bloco com o parágrafo revisado é novo
+    assert second['blobs'] - first['blobs'] == 1
+    assert st.stored_versions(5) == ['1.0', '1.1']
+    assert st.diff_versions(5, '1.0', '1.1') == {'added': [], 'removed': [], 'changed': ['Doc003.html']}
+
+    out = st.restore_version(5, '1.0')
+    assert (out / 'Doc003.html').read_bytes() == _paper(3)
+    assert st.blob_store.load_version(5, '1.0')['catalog_hash'] == 'abc'
+
+
+def test_single_gzip_and_gc(st):
+    path = st.sources_dir / 'TR006.gz'
+    with gzip.open(path, 'wb') as gz:
+        gz.write(_paper(6))
+    version = st.store_version(6)
+    assert len(version) == 12
+    assert st.blob_store.load_version(6, version)['layout'] == 'gzip'
+    store: BlobStore = st.blob_store
+    assert store.gc() == 0
+    store.delete_version(6, version)
+    assert store.gc() > 0
+    assert store.usage()['blobs'] == 0
@@ -0,0 +1,26 @@
+import os
+
+from busca.engine import INDEX_NAME, SearchEngine
+from busca.paragraphs import iter_paragraphs, load_paragraphs, pid_reference
+
+
+def test_iter_paragraphs_html_and_markdown(tmp_path):
+    raw = '<h2 id="p001_001_000">Seção &amp; título</h2>\n<p id="p001_001_001">Texto <b>um</b>.</p>'.encode()
+    assert list(iter_paragraphs(raw)) == [('p001_001_000', 'Seção & título'), ('p001_001_001', 'Texto um .')]
+    (tmp_path / 'Doc002.md').write_text('<a id="p002_001_001"></a>Parágrafo em Markdown\n', encoding='utf-8')
+    (tmp_path / 'Doc001.html').write_bytes(raw)
+    assert [pid for pid, _ in load_paragraphs(tmp_path)] == ['p001_001_000', 'p001_001_001', 'p002_001_001']
+    assert pid_reference('p002_001_010') == '2:1.10'
+
+
+def test_engine_caches_and_rebuilds(tmp_path):
+    doc = tmp_path / 'Doc001.html'
+    doc.write_text('<p id="p001_001_001">luz e vida</p>', encoding='utf-8')
+    engine = SearchEngine(tmp_path)
+    assert engine.search('luz') == [('p001_001_001', engine.search('luz')[0][1])]
+    assert (tmp_path / INDEX_NAME).exists() and engine.text('p001_001_001') == 'luz e vida'
+    assert SearchEngine(tmp_path).ensure_index().ids == ['p001_001_001']  # carregado do arquivo
+    doc.write_text('<p id="p001_001_001">trevas</p><p id="p001_001_002">luz</p>', encoding='utf-8')
+    st = doc.stat()
+    os.utime(doc, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert [pid for pid, _ in engine.search('luz')] == ['p001_001_002']
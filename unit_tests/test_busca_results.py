@@ -0,0 +1,53 @@
+from PySide6.QtCore import Qt
+
+from tbar_functions.busca_results import PID_ROLE, SCORE_ROLE, SNIPPET_ROLE, SearchResultsModel
+
+
+def test_model_appends_and_builds_snippets_on_demand():
+    calls = []
+
+    def snippet(pid):
+        calls.append(pid)
+        return f"<b>{pid}</b>"
+
+    model = SearchResultsModel(snippet)
+    inserted = []
+    model.rowsInserted.connect(lambda _parent, first, last: inserted.append((first, last)))
+    model.append_hits([('p001_001_001', 2.5), ('p002_003_004', 1.0)])
+    model.append_hits([])
+    model.append_hits([('p003_001_001', 0.5)])
+    assert model.rowCount() == 3 and inserted == [(0, 1), (2, 2)]
+    index = model.index(1, 0)
+    assert index.data(Qt.ItemDataRole.DisplayRole) == '2:3.4'
+    assert index.data(PID_ROLE) == 'p002_003_004' and index.data(SCORE_ROLE) == 1.0
+    assert calls == []  # trecho só quando alguém (o delegate) pede
+    assert index.data(SNIPPET_ROLE) == '<b>p002_003_004</b>'
+    index.data(SNIPPET_ROLE)
+    assert calls == ['p002_003_004']
+    model.clear(lambda pid: pid.upper())
+    assert model.rowCount() == 0
+    model.append_hits([('p002_003_004', 1.0)])
+    assert model.index(0, 0).data(SNIPPET_ROLE) == 'P002_003_004'
+
+
+def test_hits_after_first_batch_refresh_cached_snippets():
+    hits: dict[str, list[tuple[int, int]]] = {}
+    text = 'A luz do Paraíso'
+
+    def snippet(pid):
+        parts, last = [], 0
+        for start, end in hits.get(pid, []):
+            parts += [text[last:start], f'<b>{text[start:end]}</b>']
+            last = end
+        return ''.join(parts) + text[last:]
+
+    model = SearchResultsModel(snippet)
+    changed = []
+    model.dataChanged.connect(lambda first, last, roles: changed.append((first.row(), last.row(), list(roles))))
+    model.append_hits([('p001_001_001', 2.5), ('p001_001_002', 1.0)])
+    index = model.index(0, 0)
+    assert index.data(SNIPPET_ROLE) == text  # pintado antes dos destaques
+    hits['p001_001_001'] = [(2, 5)]           # hits_ready do worker
+    model.refresh_snippets()
+    assert index.data(SNIPPET_ROLE) == 'A <b>luz</b> do Paraíso'
+    assert changed == [(0, 1, [SNIPPET_ROLE])]
@@ -0,0 +1,68 @@
+import csv
+import io
+
+import pytest
+
+from busca import QuerySyntaxError, concordance
+from busca.concordance import iter_concordance, kwic_lines, write_csv, write_html
+from busca.engine import SearchEngine
+
+
+PARAGRAPHS = [
+    ('p001_001_001', 'Um dois três Luz quatro cinco, seis sete.'),
+    ('p001_001_002', 'A luz da vida & a luz do Paraíso.'),
+    ('p002_001_001', 'Sem o termo aqui.'),
+    ('p002_001_002', 'Luz.'),
+]
+
+
+def test_kwic_lines_context_window():
+    text = 'Um dois, três Luz quatro cinco seis'
+    assert kwic_lines('p001_001_001', text, [(3, 3)], 2) == [('p001_001_001', 'dois, três', 'Luz', 'quatro cinco')]
+    assert kwic_lines('p001_001_001', text, [(0, 1), (9, 9)], 1) == [('p001_001_001', '', 'Um dois', ', três')]
+
+
+def test_concordance_grouped_by_paper(docs_folder):
+    engine = SearchEngine(docs_folder(PARAGRAPHS))
+    papers = list(iter_concordance(engine, 'luz', context=2))
+    assert [paper for paper, _ in papers] == [1, 2]
+    assert papers[0][1] == [
+        ('p001_001_001', 'dois três', 'Luz', 'quatro cinco'),
+        ('p001_001_002', 'A', 'luz', 'da vida'),
+        ('p001_001_002', 'vida & a', 'luz', 'do Paraíso'),
+    ]
+    assert papers[1][1] == [('p002_001_002', '', 'Luz', '')]
+    phrase = list(iter_concordance(engine, '"luz do paraiso"', context=1))
+    assert phrase == [(1, [('p001_001_002', 'a', 'luz do Paraíso', '')])]
+    with pytest.raises(QuerySyntaxError):
+        list(iter_concordance(engine, 'luz OR vida'))
+
+
+def test_concordance_process_pool_matches_inline(docs_folder, monkeypatch):
+    engine = SearchEngine(docs_folder(PARAGRAPHS))
+    monkeypatch.setattr(concordance, 'PARALLEL_MIN_PAPERS', 1)
+    monkeypatch.setattr(concordance, 'PARALLEL_MIN_SPANS', 1)
+    assert list(iter_concordance(engine, 'luz', jobs=2)) == list(iter_concordance(engine, 'luz', jobs=1))
+
+
+def test_concordance_process_pool_closed_early(docs_folder, monkeypatch):
+    engine = SearchEngine(docs_folder(PARAGRAPHS))
+    monkeypatch.setattr(concordance, 'PARALLEL_MIN_PAPERS', 1)
+    monkeypatch.setattr(concordance, 'PARALLEL_MIN_SPANS', 1)
+    papers = iter_concordance(engine, 'luz', jobs=2)
+    assert next(papers)[0] == 1
+    papers.close()  # cancelar a concordância: não espera os documentos restantes
+
+
+def test_export_csv_and_html(docs_folder):
+    engine = SearchEngine(docs_folder(PARAGRAPHS))
+    papers = list(iter_concordance(engine, 'luz', context=2))
+    out = io.StringIO()
+    assert write_csv(papers, out) == 4
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert rows[0] == list(concordance.CSV_HEADER)
+    assert rows[1][0] == '1' and rows[1][2:] == ['dois três', 'Luz', 'quatro cinco']
+    out = io.StringIO()
+    assert write_html(papers, out, title='luz') == 4
+    page = out.getvalue()
+    assert page.count("<td class='k'>") == 4 and 'vida &amp; a' in page
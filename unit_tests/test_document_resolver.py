@@ -0,0 +1,100 @@
+import json
+import re
+
+import document_resolver as dr
+
+
+def _paper(sections: int = 8, paragraphs: int = 12) -> str:
+    parts = ['<h1 id="p010_000_000">Documento 10</h1>']
+    for s in range(1, sections + 1):
+        parts.append(f'<h2 id="p010_{s:03d}_000">Seção {s}</h2>')
+        parts += [f'<p id="p010_{s:03d}_{p:03d}">{"texto " * 40}</p>' for p in range(1, paragraphs + 1)]
+    return '<html><head><title>x</title></head><body>' + '\n'.join(parts) + '</body></html>'
+
+
+def test_split_sections_keeps_body_only():
+    html = _paper()
+    sections = dr.split_sections(html)
+    assert len(sections) == 9
+    assert sections[0].startswith('<h1 id="p010_000_000"')
+    assert sections[3].startswith('<h2 id="p010_003_000"')
+    assert '<head>' not in ''.join(sections)
+    assert dr.section_of(sections, 'p010_005_007') == 5
+    assert dr.section_of(sections, 'p999_000_000') == 0
+
+
+def test_windowed_body_ships_anchor_section_and_margin():
+    html = _paper()
+    assert len(html) > dr.WINDOW_MIN_BYTES
+    body = dr.build_windowed_body(html, 'p010_005_007', margin=1)
+    initial = body.split("<script type='application/json'")[0]
+    assert 'id="p010_005_007"' in initial
+    assert 'id="p010_004_000"' in initial and 'id="p010_006_000"' in initial
+    assert 'id="p010_002_000"' not in initial
+    data = json.loads(re.search(r"id='__doc-sections-data'>(.*?)</script>", body, re.S).group(1))
+    assert [i for i, sec in enumerate(data) if sec is None] == [4, 5, 6]
+    assert 'p010_008_012' in data[8]
+    assert len(initial) < len(html) / 2
+
+
+def test_small_document_is_sent_whole():
+    html = _paper(sections=2, paragraphs=1)
+    assert dr.build_windowed_body(html, 'p010_001_001') == dr.build_final_body(html, 'p010_001_001')
+
+
+def test_mark_hits_counts_tokens_per_paragraph():
+    html = ('<p id="p001_001_001" title="luz">A luz do Para&iacute;so &amp; <b>luzes</b> do</p>'
+            '<script>var luz = 1;</script>luz'
+            '<p id="p001_001_002">Trindade <i>do</i> Paraíso, a luz do dia</p>')
+    hits = {'p001_001_001': [(1, 3), (4, 4), (9, 9)], 'p001_001_002': [(0, 2)]}
+    marked, count = dr.mark_hits(html, hits)
+    assert count == 4
+    assert 'title="luz"' in marked
+    assert ("A <mark class='__hit' data-hit>luz do Paraíso</mark> &amp; "
+            "<b><mark class='__hit' data-hit>luzes</mark></b> do</p>") in marked
+    assert "<script>var luz = 1;</script><mark class='__hit' data-hit>luz</mark>" in marked
+    # frase partida por tags: um acerto, vários <mark>
+    assert ("<mark class='__hit' data-hit>Trindade</mark> <i><mark class='__hit'>do</mark></i> "
+            "<mark class='__hit'>Paraíso</mark>, a luz do dia") in marked
+    assert dr.mark_hits(html, {}) == (html, 0)
+
+
+def test_mark_hits_agrees_with_search_index(tmp_path):
+    from busca.engine import SearchEngine
+    html = ('<h2 id="p001_001_000">A Trindade do Paraíso</h2>'
+            '<p id="p001_001_001">O Pai &amp; a <b>Trindade</b> <i>do Paraíso</i>; do alto, '
+            '<script>x = 1;</script>Trindade do Paraíso.</p>')
+    (tmp_path / 'Doc001.html').write_text(html, encoding='utf-8')
+    engine = SearchEngine(tmp_path)
+    hits = engine.hit_spans('"trindade do paraíso" OR pai')
+    marked, count = dr.mark_hits(html, hits)
+    assert count == 4
+    assert re.findall(r'<mark[^>]*>([^<]*)</mark>', marked) == [
+        'Trindade do Paraíso', 'Pai', 'Trindade', 'do Paraíso', 'Trindade do Paraíso']
+    text = engine.text('p001_001_001')
+    assert [text[s:e] for s, e in engine.hit_offsets('p001_001_001', hits['p001_001_001'])] == [
+        'Pai', 'Trindade do Paraíso', 'Trindade do Paraíso']
+
+
+def test_resolve_with_highlight_adds_navigation(tmp_path, monkeypatch):
+    monkeypatch.setattr(dr, 'CONTENT_ROOT', tmp_path)
+    monkeypatch.setattr(dr, '_anchor_index', None)
+    (tmp_path / 'Doc010.html').write_text(_paper(sections=2, paragraphs=2), encoding='utf-8')
+    hits = {f'p010_{s:03d}_{p:03d}': [(i, i) for i in range(0, 40, 10)] for s in (1, 2) for p in (1, 2)}
+    body = dr.resolve_doc_link('doc://Doc010.html#p010_001_002', highlight=hits)
+    assert body.count("<mark class='__hit' data-hit>") == 4 * 4 and 'window.amadonHits' in body
+    assert '"p010_001_002"' in body  # primeiro destaque no parágrafo da âncora
+    assert 'amadonHits' not in dr.resolve_doc_link('doc://Doc010.html#p010_001_002', highlight={})
+    assert 'const per=[16]' in body  # documento inteiro: um total
+
+
+def test_windowed_hit_counts_per_section(tmp_path, monkeypatch):
+    monkeypatch.setattr(dr, 'CONTENT_ROOT', tmp_path)
+    monkeypatch.setattr(dr, '_anchor_index', None)
+    (tmp_path / 'Doc010.html').write_text(_paper(), encoding='utf-8')
+    # acertos em seções fora da janela inicial (4..6) contam desde o início
+    hits = {'p010_001_001': [(0, 0), (3, 3)], 'p010_005_007': [(1, 1)], 'p010_008_012': [(2, 4)]}
+    body = dr.resolve_doc_link('doc://Doc010.html#p010_005_007', windowed=True, highlight=hits)
+    counts = json.loads(re.search(r'const per=(\[.*?\])', body).group(1))
+    assert counts == [0, 2, 0, 0, 0, 1, 0, 0, 1]
+    assert 'window.amadonSections' in body and 'windowed=true' in body
@@ -0,0 +1,69 @@
+import hashlib
+import os
+
+import hash_ledger
+from hash_ledger import HashLedger
+
+
+def _md5(data: bytes) -> str:
+    return hashlib.md5(data).hexdigest()
+
+
+def _count_hashes(monkeypatch):
+    calls = []
+    real = hash_ledger.compute_md5
+    monkeypatch.setattr(hash_ledger, 'compute_md5', lambda p, *a: calls.append(p) or real(p, *a))
+    return calls
+
+
+def test_unchanged_file_is_not_rehashed(tmp_path, monkeypatch):
+    calls = _count_hashes(monkeypatch)
+    path = tmp_path / 'TR034.gz'
+    path.write_bytes(b'abc' * 1000)
+    ledger = HashLedger.load(tmp_path)
+    assert ledger.verify(path, _md5(b'abc' * 1000).upper())
+    ledger.save()
+    reloaded = HashLedger.load(tmp_path)
+    assert reloaded.verify(path, _md5(b'abc' * 1000))
+    assert len(calls) == 1 and reloaded.hits == 1
+
+
+def test_changed_fingerprint_forces_rehash(tmp_path, monkeypatch):
+    calls = _count_hashes(monkeypatch)
+    path = tmp_path / 'TR000.gz'
+    path.write_bytes(b'original')
+    ledger = HashLedger(tmp_path)
+    ledger.md5(path)
+    path.write_bytes(b'alterado')
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert ledger.md5(path) == _md5(b'alterado')
+    assert len(calls) == 2
+
+
+def test_md5_many_deep_and_missing(tmp_path, monkeypatch):
+    calls = _count_hashes(monkeypatch)
+    files = []
+    for n in range(4):
+        p = tmp_path / f'TR{n:03d}.gz'
+        p.write_bytes(bytes([n]) * 5000)
+        files.append(p)
+    ledger = HashLedger(tmp_path)
+    first = ledger.md5_many(files + [tmp_path / 'ausente.gz'])
+    assert first[files[2]] == _md5(bytes([2]) * 5000) and first[tmp_path / 'ausente.gz'] is None
+    assert len(calls) == 4
+    ledger.md5_many(files)
+    assert len(calls) == 4
+    deep = ledger.md5_many(files, deep=True, jobs=3)
+    assert len(calls) == 8 and deep == {p: first[p] for p in files}
+
+
+def test_record_and_forget(tmp_path, monkeypatch):
+    calls = _count_hashes(monkeypatch)
+    path = tmp_path / 'TR002.gz'
+    path.write_bytes(b'baixado')
+    ledger = HashLedger(tmp_path)
+    ledger.record(path, _md5(b'baixado'))
+    assert ledger.verify(path, _md5(b'baixado')) and not calls
+    ledger.forget(path)
+    assert ledger.cached(path) is None
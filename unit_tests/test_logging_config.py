@@ -0,0 +1,45 @@
+import logging
+import queue
+
+import pytest
+
+from logging_config import AmadonLoggingConfig, BoundedQueueHandler
+
+
+@pytest.fixture()
+def in_tmp(tmp_path, monkeypatch):
+    """Executa o teste com diretório corrente isolado (logs/ criado ali)."""
+    monkeypatch.chdir(tmp_path)
+    yield tmp_path
+    AmadonLoggingConfig.shutdown()
+
+
+def _record(level: int, msg: str) -> logging.LogRecord:
+    return logging.LogRecord('Amadon.test', level, __file__, 0, msg, None, None)
+
+
+def test_queue_pipeline_flushes_on_shutdown(in_tmp):
+    logger = AmadonLoggingConfig.setup_advanced_logging('AmadonTestQueue')
+    for i in range(200):
+        logger.debug(f"mensagem debug {i}")
+    logger.error("falha simulada")
+    AmadonLoggingConfig.shutdown()
+    main_log = (in_tmp / 'logs' / 'amadon.log').read_text(encoding='utf-8')
+    assert 'mensagem debug 199' in main_log
+    errors_log = (in_tmp / 'logs' / 'amadon_errors.log').read_text(encoding='utf-8')
+    assert 'falha simulada' in errors_log
+    assert 'mensagem debug' not in errors_log
+
+
+def test_drop_policy_discards_when_full():
+    q: queue.Queue = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(q, policy='drop', block_timeout=0.01)
+    for i in range(5):
+        handler.handle(_record(logging.INFO, f"info {i}"))
+    assert q.qsize() == 2
+    assert handler.dropped == 3
+
+
+def test_invalid_policy_rejected():
+    with pytest.raises(ValueError):
+        BoundedQueueHandler(queue.Queue(), policy='ignore')
@@ -0,0 +1,58 @@
+from busca.engine import SearchEngine, get_engine
+from busca.parallel import ParallelSearch, Translation, align, slot_translations
+from busca.query_cache import query_cache
+from translation_catalog import TranslationCatalog
+
+
+def _setup(docs_folder):
+    query_cache.clear()
+    docs_folder([('p001_001_001', 'The Thought Adjuster indwells the mind.'),
+                 ('p001_001_002', 'The light of Paradise.')], 'doc_sources/TR000')
+    docs_folder([('p001_001_001', 'El Ajustador del Pensamiento mora en la mente.')], 'doc_sources/TR002')
+    return SearchEngine(docs_folder([('p001_001_001', 'O Ajustador do Pensamento habita a mente.'),
+                                     ('p001_001_002', 'A luz do Paraíso.')], 'docs'))
+
+
+def test_slot_translations_skip_empty_and_missing(tmp_path, docs_folder):
+    _setup(docs_folder)
+    catalog = TranslationCatalog(TranslationCatalog.parse([
+        {'LanguageID': 0, 'Description': 'English 2009', 'TextButton': 'EN', 'CultureID': 1033},
+        {'LanguageID': 2, 'Description': 'Español', 'CultureID': 3082},
+    ]))
+    translations = slot_translations([0, -1, 2, 0, 7], tmp_path / 'doc_sources', catalog)
+    assert [t.label for t in translations] == ['EN', 'Español']
+    assert translations[0].engine.analyzer.language == 'en'
+    assert [t.label for t in slot_translations([2], tmp_path / 'doc_sources')] == ['TR002']
+    # TR###.gz de arquivo único extraído como TR###.txt
+    single = tmp_path / 'doc_sources' / 'TR003'
+    single.mkdir()
+    (single / 'TR003.txt').write_text('<p id="p001_001_001">Texto único.</p>', encoding='utf-8')
+    [tr003] = slot_translations([3], tmp_path / 'doc_sources')
+    assert tr003.engine.texts(['p001_001_001']) == ['Texto único.']
+
+
+def test_results_joined_by_paragraph_id(tmp_path, docs_folder):
+    engine = _setup(docs_folder)
+    en = Translation('EN', get_engine(tmp_path / 'doc_sources' / 'TR000'))
+    es = Translation('ES', get_engine(tmp_path / 'doc_sources' / 'TR002'))
+    search = ParallelSearch(engine, [en, es, Translation('PT', engine)])
+    assert search.others == [en, es]  # a própria tradução da consulta não é paralelo
+    hits = search.search('"Ajustador do Pensamento"')
+    assert [(pid, aligned) for pid, _, aligned in hits] == [('p001_001_001', [
+        ('EN', 'The Thought Adjuster indwells the mind.'),
+        ('ES', 'El Ajustador del Pensamiento mora en la mente.'),
+    ])]
+    # parágrafo ausente em uma tradução: só os paralelos existentes
+    assert align([en, es], ['p001_001_002', 'p999_001_001']) == [[('EN', 'The light of Paradise.')], []]
+
+
+def test_one_store_pass_per_translation_and_batch(tmp_path, monkeypatch, docs_folder):
+    engine = _setup(docs_folder)
+    en_engine = get_engine(tmp_path / 'doc_sources' / 'TR000')
+    calls = []
+    original = en_engine.texts
+    monkeypatch.setattr(en_engine, 'texts', lambda pids: calls.append(list(pids)) or original(pids))
+    search = ParallelSearch(engine, [Translation('EN', en_engine)])
+    batches = list(search.search_batches('luz OR ajustador', limit=10, first=1, batch=5))
+    assert [len(batch) for batch in batches] == [1, 1]
+    assert calls == [[pid for pid, _, _ in batch] for batch in batches]
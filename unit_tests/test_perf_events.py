@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from logging_config import AmadonLoggingConfig
+from perf_events import PerfEvents, percentile, summarize
+
+
+@pytest.fixture()
+def perf_file(tmp_path):
+    """Redireciona eventos para arquivo temporário e restaura o estado ao final."""
+    path = tmp_path / 'perf.jsonl'
+    PerfEvents.configure(path=path, enabled=True)
+    yield path
+    AmadonLoggingConfig._detach('AmadonPerf')
+    PerfEvents._logger = None
+    PerfEvents._enabled = None
+
+
+def test_emit_and_span_write_json_lines(perf_file):
+    PerfEvents.emit('doc.resolve', ms=2.5, file='Doc001.html')
+    with PerfEvents.span('doc.tree.build') as ev:
+        ev['nodes'] = 3
+    AmadonLoggingConfig._detach('AmadonPerf')
+    lines = [json.loads(x) for x in perf_file.read_text(encoding='utf-8').splitlines()]
+    assert [x['event'] for x in lines] == ['doc.resolve', 'doc.tree.build']
+    assert lines[0]['file'] == 'Doc001.html'
+    assert lines[1]['nodes'] == 3 and lines[1]['ms'] >= 0
+
+
+def test_span_records_error_and_reraises(perf_file):
+    with pytest.raises(KeyError):
+        with PerfEvents.span('doc.resolve'):
+            raise KeyError('x')
+    AmadonLoggingConfig._detach('AmadonPerf')
+    line = json.loads(perf_file.read_text(encoding='utf-8').splitlines()[0])
+    assert line['error'] == 'KeyError'
+
+
+def test_summarize_percentiles(tmp_path):
+    path = tmp_path / 'perf.jsonl'
+    rows = [{'event': 'translation.download', 'ms': float(v), 'bytes': 1024 * v} for v in range(1, 101)]
+    path.write_text('\n'.join(json.dumps(r) for r in rows) + '\nlixo não json\n', encoding='utf-8')
+    summary = summarize(path)
+    row = summary['translation.download']
+    assert row['count'] == 100
+    assert row['p50'] == pytest.approx(50.5)
+    assert row['max'] == 100.0
+    assert row['kib_s_p50'] == pytest.approx(1000.0)
+
+
+def test_percentile_edges():
+    assert percentile([4.0], 99) == 4.0
+    assert percentile([1.0, 3.0], 50) == 2.0
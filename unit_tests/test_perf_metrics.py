@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from perf_metrics import Histogram, PerfMetrics, timed, timer
+
+
+@pytest.fixture()
+def metrics():
+    """Liga as métricas durante o teste e restaura o estado original."""
+    previous = PerfMetrics.enabled()
+    PerfMetrics.reset()
+    PerfMetrics.enable(True)
+    yield PerfMetrics
+    PerfMetrics.enable(previous)
+    PerfMetrics.reset()
+
+
+def test_timed_and_timer_record(metrics):
+    @timed('teste.soma')
+    def soma(a, b):
+        return a + b
+
+    assert soma(2, 3) == 5
+    with timer('teste.bloco'):
+        pass
+    metrics.count('teste.contador', 2)
+    snap = metrics.snapshot()
+    assert snap['timers']['teste.soma']['count'] == 1
+    assert snap['timers']['teste.bloco']['count'] == 1
+    assert snap['counters'] == {'teste.contador': 2}
+
+
+def test_disabled_is_noop():
+    previous = PerfMetrics.enabled()
+    PerfMetrics.reset()
+    PerfMetrics.enable(False)
+    try:
+        @timed('teste.desligado')
+        def f():
+            return 1
+        f()
+        with timer('teste.desligado'):
+            pass
+        assert PerfMetrics.snapshot() == {'timers': {}, 'counters': {}}
+    finally:
+        PerfMetrics.enable(previous)
+
+
+def test_histogram_percentiles_within_bounds():
+    hist = Histogram()
+    for v in range(1, 101):
+        hist.add(float(v))
+    assert hist.count == 100
+    assert 25 <= hist.percentile(50) <= 100
+    assert hist.percentile(99) <= hist.max == 100.0
+    assert hist.as_dict()['mean'] == pytest.approx(50.5)
+
+
+def test_export_json_and_csv(metrics, tmp_path):
+    metrics.record('doc.resolve', 3.0)
+    out_json = metrics.export(tmp_path / 'm.json')
+    assert json.loads(out_json.read_text(encoding='utf-8'))['timers']['doc.resolve']['count'] == 1
+    out_csv = metrics.export(tmp_path / 'm.csv')
+    assert 'doc.resolve' in out_csv.read_text(encoding='utf-8')
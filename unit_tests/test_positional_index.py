@@ -0,0 +1,76 @@
+import pytest
+
+from busca.analyzer import get_analyzer
+from busca.positional_index import PositionalIndex, decode_varints, encode_varint
+from busca.query import And, Near, Not, Phrase, QuerySyntaxError, Term, parse_query
+
+PARAGRAPHS = [
+    ('p001_001_001', 'O Ajustador do Pensamento habita a mente humana.'),
+    ('p001_001_002', 'A Trindade do Paraíso e o Ajustador do Pensamento.'),
+    ('p001_001_003', 'The Thought-Adjuster indwells the mind; the Paradise Trinity.'),
+    ('p001_001_004', 'Luz e vida, luz eterna, luz do Paraíso.'),
+    ('p001_001_005', 'A vida eterna no Paraíso.'),
+]
+
+
+@pytest.fixture(scope='module')
+def index():
+    return PositionalIndex.build(PARAGRAPHS)
+
+
+def _ids(results):
+    return [pid for pid, _score in results]
+
+
+def test_varint_roundtrip():
+    values = [0, 1, 127, 128, 300, 2 ** 21, 2 ** 35]
+    buf = bytearray()
+    for v in values:
+        encode_varint(v, buf)
+    assert decode_varints(bytes(buf)) == values
+    assert len(buf) < 8 * len(values)
+
+
+def test_postings_positions(index):
+    assert index.postings('ajustador') == {0: [1], 1: [6]}
+    assert index.postings('luz') == {3: [0, 3, 5]}
+    assert index.doc_freq('paraiso') == 3  # termos dobrados (sem acento)
+
+
+def test_phrase_near_and_boolean(index):
+    assert _ids(index.search('"ajustador do pensamento"')) == ['p001_001_002', 'p001_001_001']
+    assert _ids(index.search('"trindade do paraíso"')) == ['p001_001_002']
+    assert _ids(index.search('Thought-Adjuster')) == ['p001_001_003']
+    assert _ids(index.search('ajustador NEAR/5 mente')) == ['p001_001_001']
+    assert _ids(index.search('ajustador NEAR/4 mente')) == []
+    assert set(_ids(index.search('paraíso -luz'))) == {'p001_001_002', 'p001_001_005'}
+    assert set(_ids(index.search('(mente OR mind) AND NOT trinity'))) == {'p001_001_001'}
+    assert set(_ids(index.search('vida OU mente'))) == {'p001_001_001', 'p001_001_004', 'p001_001_005'}
+
+
+def test_bm25_ranking_and_limit(index):
+    results = index.search('luz OR vida')
+    assert results[0][0] == 'p001_001_004'  # maior tf
+    assert results[0][1] > results[1][1]
+    assert len(index.search('paraíso', limit=2)) == 2
+
+
+def test_save_and_load(tmp_path, index):
+    path = tmp_path / 'idx.bin'
+    index.save(path)
+    loaded = PositionalIndex.load(path)
+    assert loaded.ids == index.ids and list(loaded.lengths) == list(index.lengths)
+    assert loaded.search('"trindade do paraíso"') == index.search('"trindade do paraíso"')
+
+
+def test_parser():
+    tokenize = get_analyzer()
+    tree = parse_query('fé E "Filho Criador" NEAR/3 luz NÃO medo', tokenize)
+    assert isinstance(tree, And)
+    assert isinstance(tree.children[1], Near) and isinstance(tree.children[1].left, Phrase)
+    assert isinstance(tree.children[2], Not) and tree.children[2].child.text == 'medo'
+    assert isinstance(parse_query('luz e vida', tokenize).children[1], Term)  # 'e' minúsculo é palavra
+    assert parse_query('   ', tokenize) is None
+    for bad in ['(luz OR vida', 'luz AND', 'NOT', 'luz NEAR/3 (a OR b)', ')']:
+        with pytest.raises(QuerySyntaxError):
+            parse_query(bad, tokenize)
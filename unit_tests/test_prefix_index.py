@@ -0,0 +1,54 @@
+import pytest
+
+from busca.analyzer import get_analyzer
+from busca.engine import SearchEngine
+from busca.prefix_index import PREFIX_NAME, PrefixIndex
+
+TERMS = [('a', 90), ('ajuda', 3), ('ajustador', 40), ('ajustadores', 12), ('alma', 25), ('paraiso', 7), ('paralelo', 7)]
+PT = get_analyzer('pt')
+TEXTS = ['O Ajustador conduz a alma ao Paraíso.', 'paraíso, Paraíso e paraiso', 'os ajustadores, a ajuda']
+
+
+def test_suggest_order_and_display():
+    index = PrefixIndex.build(TERMS, TEXTS, analyzer=PT)
+    assert len(index) == len(TERMS) - 1  # 'a' é stopword
+    assert index.suggest('aj') == [('ajustador', 40), ('ajustadores', 12), ('ajuda', 3)]
+    assert index.suggest('AJ', limit=2) == [('ajustador', 40), ('ajustadores', 12)]
+    assert index.suggest('Pará') == [('paraíso', 7), ('paralelo', 7)]  # forma mais frequente; empate alfabético
+    assert index.suggest('a') == [] and index.suggest('zz') == [] and index.suggest('aj', limit=0) == []
+    lo, hi = index.range('ajustador')
+    assert hi - lo == 2
+
+
+def test_nbytes_counts_searched_data():
+    index = PrefixIndex.build(TERMS, TEXTS, analyzer=PT)
+    n = len(index)
+    # blobs fatiados na busca e offsets lidos direto dos arrays: nada fora de `nbytes`
+    assert not isinstance(index.terms._offsets, list)
+    assert index.arrays['terms'].base is index.terms._blob
+    assert index.nbytes == len(index.terms._blob) + len(index.display._blob) + 4 * (n + 1) * 2 + 4 * n
+
+
+def test_save_load(tmp_path):
+    index = PrefixIndex.build(TERMS, TEXTS, meta={'fingerprint': {'x': 1}}, analyzer=PT)
+    path = tmp_path / PREFIX_NAME
+    index.save(path)
+    loaded = PrefixIndex.load(path)
+    assert loaded.meta == {'fingerprint': {'x': 1}} and loaded.nbytes == index.nbytes
+    assert loaded.suggest('par') == index.suggest('par')
+    path.write_bytes(b'corrompido')
+    with pytest.raises(Exception):
+        PrefixIndex.load(path)
+
+
+def test_engine_builds_with_index(docs_folder, forbid_build):
+    folder = docs_folder([(f'p001_001_{i:03d}', t) for i, t in enumerate(TEXTS)])
+    engine = SearchEngine(folder)
+    assert engine.suggest('aj') == []  # índice ainda não carregado
+    engine.ensure_index()
+    suggestions = engine.suggest('aj')
+    assert [term for term, _ in suggestions][:1] == ['ajustador'] and (folder / PREFIX_NAME).exists()
+    forbid_build(PrefixIndex)
+    other = SearchEngine(folder)
+    other.ensure_index()
+    assert other.suggest('aj') == suggestions
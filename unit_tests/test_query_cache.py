@@ -0,0 +1,40 @@
+from busca.engine import SearchEngine
+from busca.query_cache import QueryCache, query_cache
+
+
+def test_lru_eviction_and_limits():
+    cache = QueryCache(max_entries=2)
+    cache.put('a', 10, list(range(10)))
+    cache.put('b', 10, list(range(3)))  # resultado incompleto: serve qualquer limite
+    assert cache.get('a', 5) == [0, 1, 2, 3, 4]
+    assert cache.get('a', 20) is None  # calculado com limite menor
+    assert cache.get('b', 300) == [0, 1, 2]
+    cache.put('c', 10, [])
+    assert cache.get('a', 5) is None and len(cache) == 2  # 'a' era o menos recente
+    assert cache.hits == 2 and cache.misses == 2
+
+
+def _engine(docs_folder):
+    query_cache.clear()
+    return SearchEngine(docs_folder([(f'p001_001_{i:03d}', f'luz {"luz " * i}vida') for i in range(1, 31)]))
+
+
+def test_batches_ranked_and_cached(docs_folder):
+    engine = _engine(docs_folder)
+    batches = list(engine.search_batches('luz', limit=25, first=5, batch=8))
+    assert [len(b) for b in batches] == [5, 8, 8, 4]
+    flat = [hit for b in batches for hit in b]
+    assert flat == engine.index.search('luz', limit=25)
+    assert len(query_cache) == 1
+    # consulta equivalente (acentos, caixa, espaços) sai do cache
+    hits_before = query_cache.hits
+    assert engine.search('  LUZ ', limit=10) == flat[:10]
+    assert query_cache.hits == hits_before + 1
+
+
+def test_cancelled_query_is_not_cached(docs_folder):
+    engine = _engine(docs_folder)
+    batches = engine.search_batches('vida', limit=30, first=5)
+    assert len(next(batches)) == 5
+    batches.close()  # consumidor cancelou após o primeiro lote
+    assert len(query_cache) == 0
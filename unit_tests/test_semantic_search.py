@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from busca.analyzer import get_analyzer
+from busca.engine import SearchEngine
+from busca.query import is_plain_query
+from busca.semantic import DOCS_NAME, SemanticIndex, _Csr, tfidf_matrix
+
+PARAGRAPHS = [
+    ('p1', 'O Ajustador do Pensamento habita a mente humana'),
+    ('p2', 'O Ajustador guia a mente e o pensamento do homem'),
+    ('p3', 'A luz e a vida eterna no Paraíso'),
+    ('p4', 'Luz eterna do Paraíso e vida sem fim'),
+    ('p5', 'Os anjos servem nos mundos habitados'),
+    ('p6', 'Mundos habitados recebem os anjos ministradores'),
+]
+
+
+def _dense(matrix: _Csr) -> np.ndarray:
+    dense = np.zeros(matrix.shape)
+    for row in range(matrix.shape[0]):
+        for k in range(matrix.indptr[row], matrix.indptr[row + 1]):
+            dense[row, matrix.indices[k]] = matrix.data[k]
+    return dense
+
+
+def test_tfidf_and_sparse_products():
+    matrix, vocab, idf = tfidf_matrix([['a', 'b', 'a'], [], ['b', 'c'], ['c'], [], ['a', 'd']], min_df=1)
+    dense = _dense(matrix)
+    assert vocab == ['a', 'b', 'c', 'd'] and len(idf) == 4
+    assert np.allclose(np.linalg.norm(dense, axis=1), [1, 0, 1, 1, 0, 1])
+    x, y = np.random.default_rng(1).random((4, 3)), np.random.default_rng(2).random((6, 2))
+    assert np.allclose(matrix.dot(x), dense @ x, atol=1e-6)
+    assert np.allclose(matrix.transpose().dot(y), dense.T @ y, atol=1e-6)
+
+
+def test_semantic_ranking_save_and_load(tmp_path):
+    index = SemanticIndex.build(PARAGRAPHS, dim=3, min_df=1, analyzer=get_analyzer(1046))
+    top = [pid for pid, _ in index.search('mente do ajustador', limit=2)]
+    assert set(top) == {'p1', 'p2'}
+    assert [pid for pid, _ in index.search('anjos', limit=2)] and index.search('xyzzy') == []
+    index.save(tmp_path)
+    loaded = SemanticIndex.load(tmp_path)
+    assert isinstance(loaded.docs, np.memmap) and loaded.dim == index.dim
+    assert loaded.search_many(['luz vida', 'anjos'], limit=2) == index.search_many(['luz vida', 'anjos'], limit=2)
+    (tmp_path / DOCS_NAME).write_bytes(b'corrompido')
+    with pytest.raises(Exception):
+        SemanticIndex.load(tmp_path)
+
+
+def test_engine_semantic_and_plain_queries(docs_folder):
+    engine = SearchEngine(docs_folder([(f'p001_001_00{pid[1]}', text) for pid, text in PARAGRAPHS]))
+    assert not engine.semantic_ready
+    assert {pid for pid, _ in engine.semantic_search('anjos mundos', limit=3)} == {'p001_001_005', 'p001_001_006'}
+    assert engine.semantic_ready
+    assert is_plain_query('luz vida') and not is_plain_query('"luz vida"') and not is_plain_query('luz OR vida')
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from show_translations import ShowTranslation
+from show_translations import ExtractionCancelled, ShowTranslation
 
 
 def _write_gzip(path: Path, content: bytes):
@@ -62,6 +62,26 @@ def test_extract_archive_tar(isolated):
     assert (out_dir / 'b' / 'b.txt').read_text() == 'Bdata'
 
 
+def test_extract_archive_tar_streaming_progress(isolated):
+    st, doc_sources = isolated
+    path = doc_sources / 'TR011.gz'
+    _write_tar_gz(path, {'a.txt': b'A' * 5000, 'c/c.txt': b'C', '../fora.txt': b'X'})
+    calls = []
+    out_dir = st.extract_archive(11, progress=lambda name, done, total: calls.append((name, done, total)))
+    assert [c[0] for c in calls] == ['a.txt', 'c/c.txt']
+    assert all(0 < done <= total == path.stat().st_size for _, done, total in calls)
+    assert (out_dir / 'a.txt').stat().st_size == 5000
+    # membro com caminho para fora da pasta destino é ignorado
+    assert not (doc_sources / 'fora.txt').exists()
+
+
+def test_extract_archive_corrupt_raises(isolated):
+    st, doc_sources = isolated
+    (doc_sources / 'TR012.gz').write_bytes(b'isto nao e gzip')
+    with pytest.raises(RuntimeError):
+        st.extract_archive(12)
+
+
 def test_verify_user_translations_choice(isolated):
     st, doc_sources = isolated
     # número 2 não existe inicialmente
@@ -76,3 +96,110 @@ def test_verify_user_translations_choice(isolated):
     # segunda chamada deve ser ok
     res2 = st.verify_user_translations_choice([2])
     assert res2[2] == 'ok'
+
+
+def test_verify_parallel_extracts_and_times(isolated):
+    st, doc_sources = isolated
+    for n in (3, 4, 5):
+        _write_tar_gz(doc_sources / f'TR{n:03d}.gz', {f'doc{n}.txt': b'x' * 1000})
+    st.extract_archive(4)
+    results, timings = st.verify_user_translations_parallel([3, 4, 5, 6], max_workers=2)
+    assert results == {3: 'extracted', 4: 'ok', 5: 'extracted', 6: 'missing-archive'}
+    assert set(timings) == {3, 5} and all(ms > 0 for ms in timings.values())
+    assert (doc_sources / 'TR005' / 'doc5.txt').exists()
+
+
+def test_extract_archive_cancel_removes_partial_folder(isolated):
+    st, doc_sources = isolated
+    _write_tar_gz(doc_sources / 'TR007.gz', {'a.txt': b'A', 'b.txt': b'B'})
+    with pytest.raises(ExtractionCancelled):
+        st.extract_archive(7, should_cancel=lambda: True)
+    assert not (doc_sources / 'TR007').exists()
+    results, timings = st.verify_user_translations_parallel([7], cancel=lambda: True)
+    assert results == {7: 'cancelled'} and timings == {}
+
+
+def test_extract_archive_cancel_single_gzip_between_chunks(isolated, monkeypatch):
+    st, doc_sources = isolated
+    monkeypatch.setattr('show_translations.show_translation.COPY_BUFFER_SIZE', 1024)
+    _write_gzip(doc_sources / 'TR008.gz', b'texto ' * 2000)
+    calls = []
+    with pytest.raises(ExtractionCancelled):
+        st.extract_archive(8, should_cancel=lambda: calls.append(1) or len(calls) > 3)
+    assert len(calls) == 4 and not (doc_sources / 'TR008').exists()
+    (doc_sources / 'TR008').mkdir()
+    calls.clear()
+    with pytest.raises(ExtractionCancelled):
+        st.extract_archive(8, should_cancel=lambda: calls.append(1) or len(calls) > 3)
+    assert (doc_sources / 'TR008').exists() and not (doc_sources / 'TR008' / 'TR008.txt').exists()
+
+
+def test_manifest_skips_unchanged_and_updates_changed_members(isolated):
+    st, doc_sources = isolated
+    path = doc_sources / 'TR020.gz'
+    _write_tar_gz(path, {'a.txt': b'A1', 'b.txt': b'B1', 'c.txt': b'C1'})
+    out_dir = st.extract_archive(20)
+    manifest = st.read_manifest(20)
+    assert manifest['layout'] == 'tar' and set(manifest['members']) == {'a.txt', 'b.txt', 'c.txt'}
+    assert st.verify_user_translations_choice([20]) == {20: 'ok'}
+
+    # .gz inalterado: nada é lido nem regravado
+    (out_dir / 'a.txt').write_bytes(b'X1')
+    calls = []
+    st.extract_archive(20, progress=lambda *a: calls.append(a))
+    assert calls == [] and (out_dir / 'a.txt').read_bytes() == b'X1'
+
+    # .gz novo: só o membro alterado é regravado, o removido é apagado
+    _write_tar_gz(path, {'a.txt': b'A1', 'b.txt': b'B22'})
+    assert st.verify_user_translations_choice([20], auto_extract=False) == {20: 'stale'}
+    before = (out_dir / 'a.txt').stat().st_mtime_ns
+    assert st.verify_user_translations_choice([20]) == {20: 'updated'}
+    assert (out_dir / 'b.txt').read_bytes() == b'B22'
+    assert (out_dir / 'a.txt').stat().st_mtime_ns == before
+    assert not (out_dir / 'c.txt').exists()
+    assert st.extraction_status(20) == 'ok'
+
+
+def test_same_length_edit_detected_by_content_hash(isolated, monkeypatch):
+    st, doc_sources = isolated
+    path = doc_sources / 'TR022.gz'
+    # membros com mtime normalizado (0) e mesmo tamanho nas duas versões
+    _write_tar_gz(path, {'a.txt': b'A1', 'b.txt': b'B1'})
+    out_dir = st.extract_archive(22)
+    assert st.read_manifest(22)['members']['b.txt']['sha1']
+    _write_tar_gz(path, {'a.txt': b'A1', 'b.txt': b'B2'})
+    before = (out_dir / 'a.txt').stat().st_mtime_ns
+    md5_reads = []
+    fingerprint = ShowTranslation.archive_fingerprint
+    monkeypatch.setattr(ShowTranslation, 'archive_fingerprint',
+                        staticmethod(lambda p, with_md5=True: md5_reads.append(with_md5) or fingerprint(p, with_md5)))
+    assert st.verify_user_translations_choice([22]) == {22: 'updated'}
+    assert md5_reads.count(True) == 1  # status e extração compartilham o MD5 do .gz
+    assert (out_dir / 'b.txt').read_bytes() == b'B2'
+    assert (out_dir / 'a.txt').stat().st_mtime_ns == before
+
+
+def test_legacy_folder_same_size_compared_by_content(isolated):
+    st, doc_sources = isolated
+    _write_tar_gz(doc_sources / 'TR023.gz', {'a.txt': b'novo', 'b.txt': b'igual'})
+    legacy = doc_sources / 'TR023'
+    legacy.mkdir()
+    (legacy / 'a.txt').write_bytes(b'velh')
+    (legacy / 'b.txt').write_bytes(b'igual')
+    before = (legacy / 'b.txt').stat().st_mtime_ns
+    assert st.verify_user_translations_choice([23]) == {23: 'updated'}
+    assert (legacy / 'a.txt').read_bytes() == b'novo'
+    assert (legacy / 'b.txt').stat().st_mtime_ns == before
+
+
+def test_legacy_folder_without_manifest_is_refreshed(isolated):
+    st, doc_sources = isolated
+    path = doc_sources / 'TR021.gz'
+    _write_gzip(path, b'novo conteudo')
+    legacy = doc_sources / 'TR021'
+    legacy.mkdir()
+    (legacy / 'TR021.txt').write_bytes(b'antigo')
+    assert st.extraction_status(21) == 'stale'
+    assert st.verify_user_translations_choice([21]) == {21: 'updated'}
+    assert (legacy / 'TR021.txt').read_bytes() == b'novo conteudo'
+    assert st.extraction_status(21) == 'ok'
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from busca.engine import SearchEngine
+from busca.paragraphs import paragraph_id
+from busca.similar import BANDS, META_NAME, NUM_PERM, SIGNATURES_NAME, SimilarIndex, minhash, shingles
+
+BASE = 'o ajustador do pensamento habita a mente do homem mortal e conduz a alma ao paraíso'
+PARAGRAPHS = [
+    ('p001_001_001', BASE),
+    ('p001_001_002', BASE + ' por toda a eternidade'),             # quase idêntico
+    ('p002_001_001', 'as estrelas do universo local giram em torno de salvington'),
+    ('p002_001_002', 'o ajustador do pensamento habita a mente e conduz a alma'),
+    ('p002_001_003', '...'),                                        # sem termos
+]
+
+
+def test_shingles_and_signatures():
+    codes, counts = shingles([['a', 'b', 'c'], ['a'], [], ['a', 'b']])
+    assert counts.tolist() == [2, 1, 0, 1]
+    assert codes[0] == codes[3] and len(set(codes.tolist())) == 3  # (a,b) repetido; 'a' isolado é outro código
+    signatures = minhash(codes, counts)
+    assert signatures.shape == (4, NUM_PERM) and signatures.dtype == np.uint32
+    assert (signatures[2] == np.iinfo(np.uint32).max).all()
+    assert (signatures[0] <= signatures[3]).all()  # {ab, bc} ⊇ {ab}
+
+
+def test_similar_ranking_and_persistence(tmp_path):
+    index = SimilarIndex.build(PARAGRAPHS)
+    results = index.similar('p001_001_001')
+    assert results[0][0] == 'p001_001_002' and results[0][1] > 0.7
+    assert [score for _, score in results] == sorted((score for _, score in results), reverse=True)
+    assert 'p002_001_001' not in dict(results)
+    assert index.similar('p002_001_003') == [] and index.similar('p999_001_001') == []
+    index.save(tmp_path)
+    loaded = SimilarIndex.load(tmp_path)
+    assert isinstance(loaded.signatures, np.memmap)
+    assert loaded.keys.shape == (BANDS * 4,)  # um vetor ordenado para todas as bandas; p002_001_003 fica fora
+    assert loaded.similar('p001_001_001') == results
+    (tmp_path / SIGNATURES_NAME).write_bytes(b'corrompido')
+    with pytest.raises(Exception):
+        SimilarIndex.load(tmp_path)
+
+
+def test_engine_precomputes_once(docs_folder, forbid_build):
+    folder = docs_folder(PARAGRAPHS)
+    engine = SearchEngine(folder)
+    assert not engine.similar_ready
+    hits = engine.similar('p001_001_001')
+    assert engine.similar_ready and hits[0][0] == 'p001_001_002'
+    assert (folder / META_NAME).exists()
+    forbid_build(SimilarIndex)
+    assert SearchEngine(folder).similar('p001_001_001') == hits
+
+
+def test_paragraph_id():
+    assert paragraph_id('p001_002_003') == 'p001_002_003'
+    assert paragraph_id(' 196:3.12 ') == 'p196_003_012'
+    assert paragraph_id('luz 1:2.3') is None
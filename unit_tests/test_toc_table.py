@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from benchmarks.toc_table import load_toc_table, parse_toc_table
+
+SAMPLE = """
+<div class="treeview">
+   <ul>
+      <li id="toc_000_000_div"><span class="caret"><a class="liIndex" href="javascript:loadDoc('content/Doc000.html','p000_000_000')">Introdução</a></span>
+         <ul class="nested">
+            <li id="toc_000_001_div"><a class="liIndex" href="javascript:loadDoc('content/Doc000.html','p000_001_000')">I. Deidade &amp; Divindade</a></span>
+            <li id="toc_000_002_div"><a class="liIndex" href="javascript:loadDoc('content/Doc000.html','p000_002_000')">II. Deus</a></span>
+         </ul>
+      </li>
+      <li id="part1_div"><span class="caret">Parte I</span>
+         <ul class="nested">
+         <li id="toc_001_000_div"><span class="caret"><a class="liIndex" href="javascript:loadDoc('content/Doc001.html','p001_000_000')">1 - O Pai Universal</a></span>
+         </ul>
+      </li>
+   </ul>
+</div>
+"""
+
+
+def test_parse_nested_structure():
+    nodes = parse_toc_table(SAMPLE)
+    assert [n['titulo'] for n in nodes] == ['Introdução', 'Parte I']
+    intro = nodes[0]
+    assert intro['link'] == 'doc://Doc000.html#p000_000_000'
+    assert [c['titulo'] for c in intro['filhos']] == ['I. Deidade & Divindade', 'II. Deus']
+    assert nodes[1]['link'] is None
+    assert nodes[1]['filhos'][0]['link'] == 'doc://Doc001.html#p001_000_000'
+
+
+def test_load_missing_file_returns_empty(tmp_path):
+    assert load_toc_table(Path(tmp_path) / 'nao_existe.html') == {"nodes": []}
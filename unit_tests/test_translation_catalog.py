@@ -0,0 +1,70 @@
+import hashlib
+import json
+import os
+from types import SimpleNamespace
+
+from translation_catalog import TranslationCatalog, migrate_translation_slots, translation_file_status
+
+ITEMS = [
+    {"LanguageID": 34, "Description": "Portuguese 2007", "TIN": "PTBR", "Hash": "ABC", "Version": 3},
+    {"LanguageID": 0, "Description": "English 2009", "TIN": "ENG"},
+    {"LanguageID": 2, "Description": "Portuguese Alternative", "TIN": "PTAL"},
+    {"Title": "sem descrição"},
+]
+
+
+def _write(path, items):
+    path.write_text(json.dumps({"AvailableTranslations": items}), encoding='utf-8')
+
+
+def test_indexes_and_sorting(tmp_path):
+    path = tmp_path / 'AvailableTranslations.json'
+    _write(path, ITEMS)
+    catalog = TranslationCatalog.load([path])
+    assert len(catalog) == 3
+    assert catalog.get(34).hash == 'abc' and catalog.get(34).archive_name == 'TR034.gz'
+    assert catalog.find_description('english 2009').language_id == 0
+    assert catalog.find_tin('ptal').language_id == 2
+    assert [i.language_id for i in catalog.sorted_by_description()] == [0, 34, 2]
+    assert 0 in catalog and 99 not in catalog
+
+
+def test_load_is_cached_until_file_changes(tmp_path):
+    path = tmp_path / 'AvailableTranslations.json'
+    _write(path, ITEMS)
+    first = TranslationCatalog.load([path])
+    assert TranslationCatalog.load([path]) is first
+    _write(path, ITEMS[:1])
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    second = TranslationCatalog.load([path])
+    assert second is not first and len(second) == 1
+
+
+def test_fallback_path_and_missing(tmp_path):
+    fallback = tmp_path / 'fallback.json'
+    fallback.write_text(json.dumps(ITEMS), encoding='utf-8')  # lista direta
+    catalog = TranslationCatalog.load([tmp_path / 'ausente.json', fallback])
+    assert catalog.source == fallback and len(catalog) == 3
+    assert len(TranslationCatalog.load([tmp_path / 'ausente.json'])) == 0
+
+
+def test_migrate_slots_from_positions():
+    catalog = TranslationCatalog(TranslationCatalog.parse(ITEMS))
+    settings = SimpleNamespace(translation_slot1=1, translation_slot2=0, translation_slot3=7)
+    assert migrate_translation_slots(settings, catalog)
+    assert (settings.translation_slot1, settings.translation_slot2, settings.translation_slot3) == (0, 34, -1)
+    assert not migrate_translation_slots(settings, catalog)
+
+
+def test_translation_file_status(tmp_path):
+    data = b'conteudo do arquivo'
+    (tmp_path / 'TR034.gz').write_bytes(data)
+    items = [dict(ITEMS[0], Hash=hashlib.md5(data).hexdigest().upper()), ITEMS[1]]
+    catalog = TranslationCatalog(TranslationCatalog.parse(items))
+    ok = translation_file_status(catalog.get(34), tmp_path, extraction=lambda n: 'pending')
+    assert ok.present and ok.size == len(data) and ok.hash_ok is True and ok.extraction == 'pending'
+    missing = translation_file_status(catalog.get(0), tmp_path)
+    assert not missing.present and missing.hash_ok is None
+    (tmp_path / 'TR034.gz').write_bytes(b'alterado')
+    assert translation_file_status(catalog.get(34), tmp_path).hash_ok is False
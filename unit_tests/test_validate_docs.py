@@ -0,0 +1,62 @@
+import json
+import os
+from pathlib import Path
+
+import validate_docs
+from anchor_index import INDEX_NAME
+
+
+def _corpus(tmp_path: Path) -> tuple[Path, Path]:
+    docs = tmp_path / 'docs'
+    docs.mkdir()
+    (docs / 'Doc001.html').write_text('<h1 id="p001_000_000">T</h1><p id="p001_001_001">x</p>', encoding='utf-8')
+    (docs / 'Doc002.md').write_text(
+        '<h1 id="p002_000_000">T</h1>\n\n```\n<p id="p002_001_001">só exemplo</p>\n```\n', encoding='utf-8')
+    tree = tmp_path / 'tree.json'
+    tree.write_text(json.dumps({'nodes': [
+        {'titulo': 'A', 'link': 'doc://Doc001.html#p001_001_001', 'filhos': [
+            {'titulo': 'B', 'link': 'doc://Doc002.html#p002_000_000'},
+            {'titulo': 'C', 'link': 'doc://Doc002.html#p002_001_001'},
+            {'titulo': 'D', 'link': 'doc://Doc003.html'},
+        ]},
+    ]}), encoding='utf-8')
+    return docs, tree
+
+
+def test_validate_markdown_converted_and_missing_file(tmp_path):
+    docs, tree = _corpus(tmp_path)
+    total, ok, issues = validate_docs.validate(tree, docs, jobs=1)
+    assert (total, ok) == (4, 2)
+    by_link = {i.link: i.level for i in issues}
+    # id dentro de bloco de código não é âncora real após conversão
+    assert by_link == {'doc://Doc002.html#p002_001_001': 'WARN', 'doc://Doc003.html': 'ERROR'}
+
+
+def test_cache_rescans_only_changed_files(tmp_path):
+    docs, tree = _corpus(tmp_path)
+    stats: dict = {}
+    validate_docs.validate(tree, docs, jobs=1, stats=stats)
+    assert stats == {'files': 2, 'cached': 0, 'scanned': 2, 'removed': 0}
+    assert (docs / INDEX_NAME).exists()
+
+    validate_docs.validate(tree, docs, jobs=1, stats=stats)
+    assert stats['scanned'] == 0
+
+    # mtime alterado com mesmo conteúdo: hash confere e não relê
+    st = (docs / 'Doc001.html').stat()
+    os.utime(docs / 'Doc001.html', ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    validate_docs.validate(tree, docs, jobs=1, stats=stats)
+    assert stats['scanned'] == 0
+
+    (docs / 'Doc001.html').write_text('<h1 id="p001_000_000">T</h1>', encoding='utf-8')
+    total, ok, issues = validate_docs.validate(tree, docs, jobs=1, stats=stats)
+    assert stats == {'files': 2, 'cached': 1, 'scanned': 1, 'removed': 0}
+    assert any(i.link == 'doc://Doc001.html#p001_001_001' for i in issues)
+
+
+def test_duplicate_ids_and_foreign_anchor_reported(tmp_path):
+    docs, tree = _corpus(tmp_path)
+    (docs / 'Doc003.html').write_text('<p id="p001_001_001">dup</p>', encoding='utf-8')
+    _, _, issues = validate_docs.validate(tree, docs, jobs=1)
+    dup = [i for i in issues if i.link == 'p001_001_001']
+    assert len(dup) == 1 and 'Doc001.html' in dup[0].message and 'Doc003.html' in dup[0].message
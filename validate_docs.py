@@ -2,30 +2,43 @@
 
 Uso:
     python validate_docs.py
+    python validate_docs.py --docs /tmp/corpus/docs --tree /tmp/corpus/data/documentos_tree.json
+    python validate_docs.py --docs tr/TR000 --docs tr/TR034 --jobs 8
 
 Verifica:
 1. Se todos os links em assets/data/documentos_tree.json possuem arquivo existente.
-2. Se a âncora (fragmento #...) existe no HTML final (HTML direto ou Markdown convertido parcialmente).
-3. Relatório consolidado com contagens e detalhes de falhas.
+2. Se a âncora (fragmento #...) existe no HTML final (HTML direto ou Markdown
+   convertido com markdown2, como em `document_resolver.load_document_html`).
+3. Se cada id de âncora é único na pasta de documentos.
+4. Relatório consolidado com contagens e detalhes de falhas (saída 1 se houver erros).
+
+Desempenho:
+- As âncoras vêm do índice global (`anchor_index`, arquivo `.anchor_index.json`
+  em cada pasta de documentos), atualizado de forma incremental: só arquivos
+  cujo conteúdo mudou são reprocessados.
+- Arquivos a reprocessar são distribuídos em um pool de processos
+  (`--jobs`, default = número de CPUs). Poucos arquivos são processados na
+  própria thread, onde criar processos custaria mais que o trabalho.
 
 Limitações:
-- Para Markdown, procura literalmente pelo padrão id="..." após conversão manual leve: aqui apenas leitura do texto bruto (se id inserido via <hX id="...">). Caso id não esteja explicitamente no markdown (ex: título puro), não será encontrado.
+- Sem markdown2 instalado, o Markdown é lido como texto bruto (apenas ids
+  explícitos, ex.: <hX id="...">).
 
 Extensões futuras:
-- Usar markdown2 para converter e então buscar a âncora no HTML convertido.
-- Validar unicidade de IDs.
 - Gerar sugestão de próximas âncoras disponíveis.
 """
+import argparse
 import json
 import re
+import sys
 from pathlib import Path
 
+from anchor_index import AnchorIndex
+
 ROOT = Path(__file__).parent
 DATA_JSON = ROOT / "assets" / "data" / "documentos_tree.json"
 DOCS_DIR = ROOT / "assets" / "docs"
-
 LINK_RE = re.compile(r"^doc://(?P<file>Doc\d+\.html)(?:#(?P<anchor>p\d{3}_\d{3}_\d{3}))?$")
-ID_RE = re.compile(r'id=["\'](?P<id>p\d{3}_\d{3}_\d{3})(?:_[0-9A-Za-z]+)?["\']')
 
 class Issue:
     def __init__(self, level: str, message: str, link: str):
@@ -42,20 +55,21 @@ def iter_links(node):
         yield from iter_links(filho)
 
 
-def load_tree():
-    with DATA_JSON.open("r", encoding="utf-8") as f:
+def load_tree(data_json: Path = DATA_JSON):
+    with data_json.open("r", encoding="utf-8") as f:
         data = json.load(f)
     for n in data.get("nodes", []):
         yield from iter_links(n)
 
 
-def validate():
+def validate(data_json: Path = DATA_JSON, docs_dir: Path = DOCS_DIR, jobs: int | None = None,
+             use_cache: bool = True, stats: dict | None = None):
     issues: list[Issue] = []
     total = 0
     ok = 0
-    anchors_found_cache: dict[Path, set[str]] = {}
-
-    for titulo, link in load_tree():
+    # Resolve primeiro todos os links para saber quais arquivos analisar
+    links: list[tuple[str, Path, str | None]] = []
+    for titulo, link in load_tree(data_json):
         if not link:
             issues.append(Issue("ERROR", "Link vazio", f"{titulo}"))
             continue
@@ -68,8 +82,8 @@ def validate():
         anchor = m.group("anchor")
         # Arquivo pode ser .html ou .md fisicamente
         base_name = file_html[:-5]  # remove .html
-        physical_html = DOCS_DIR / f"{base_name}.html"
-        physical_md = DOCS_DIR / f"{base_name}.md"
+        physical_html = docs_dir / f"{base_name}.html"
+        physical_md = docs_dir / f"{base_name}.md"
         phys_path: Path | None = None
         if physical_html.exists():
             phys_path = physical_html
@@ -78,44 +92,67 @@ def validate():
         if phys_path is None:
             issues.append(Issue("ERROR", "Arquivo não encontrado", link))
             continue
-        # Carrega IDs só uma vez por arquivo
-        if phys_path not in anchors_found_cache:
-            try:
-                text = phys_path.read_text(encoding="utf-8", errors="ignore")
-            except Exception as e:  # pragma: no cover
-                issues.append(Issue("ERROR", f"Falha leitura: {e}", link))
-                continue
-            anchors_found_cache[phys_path] = set(ID_RE.findall(text))
+        links.append((link, phys_path, anchor))
+
+    files = sorted({p for _, p, _ in links})
+    index = AnchorIndex.load(docs_dir) if use_cache else AnchorIndex(docs_dir)
+    scan_stats = index.update(jobs=jobs)  # pasta inteira: unicidade vale para todo o acervo
+    if use_cache:
+        index.save()
+    if stats is not None:
+        stats.update(scan_stats)
+    anchors_by_file = {p: index.file_anchors(p.name) for p in files}
+    for link, phys_path, anchor in links:
         if anchor:
-            if anchor in anchors_found_cache[phys_path]:
+            if anchor in anchors_by_file[phys_path]:
                 ok += 1
             else:
-                issues.append(Issue("WARN", "Âncora não encontrada no arquivo", link))
+                owner = index.lookup(anchor)
+                hint = f" (existe em {owner[0]})" if owner else ""
+                issues.append(Issue("WARN", f"Âncora não encontrada no arquivo{hint}", link))
         else:
             ok += 1
+    # Unicidade: o mesmo id em mais de um lugar torna o destino ambíguo
+    for anchor, entries in sorted(index.duplicates.items()):
+        places = ", ".join(f"{name}@{offset}" for name, offset, _ in entries)
+        issues.append(Issue("WARN", f"ID duplicado em {places}", anchor))
     return total, ok, issues
 
 
 def main():
-    total, ok, issues = validate()
-    errors = [i for i in issues if i.level == "ERROR"]
-    warns = [i for i in issues if i.level == "WARN"]
-    print("Resumo Validação:")
-    print(f"  Total links: {total}")
-    print(f"  OK: {ok}")
-    print(f"  Errors: {len(errors)}  Warnings: {len(warns)}")
-    if errors:
-        print("\nErros:")
-        for e in errors:
-            print(" -", e)
-    if warns:
-        print("\nAvisos:")
-        for w in warns:
-            print(" -", w)
-    if not errors:
-        print("\nStatus geral: PASS (sem erros críticos)")
-    else:
-        print("\nStatus geral: FAIL (há erros)")
+    parser = argparse.ArgumentParser(description="Valida links e âncoras de documentos_tree.json.")
+    parser.add_argument("--tree", type=Path, default=DATA_JSON, help="Arquivo documentos_tree.json.")
+    parser.add_argument("--docs", type=Path, action="append", default=None,
+                        help="Pasta de documentos (pode repetir, ex.: uma por tradução).")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Processos paralelos (default: CPUs).")
+    parser.add_argument("--no-cache", action="store_true", help="Ignora e não grava o índice de âncoras.")
+    args = parser.parse_args()
+
+    failed = False
+    for docs_dir in args.docs or [DOCS_DIR]:
+        stats: dict = {}
+        total, ok, issues = validate(args.tree, docs_dir, args.jobs, not args.no_cache, stats)
+        errors = [i for i in issues if i.level == "ERROR"]
+        warns = [i for i in issues if i.level == "WARN"]
+        print(f"Resumo Validação ({docs_dir}):")
+        print(f"  Total links: {total}")
+        print(f"  OK: {ok}")
+        print(f"  Errors: {len(errors)}  Warnings: {len(warns)}")
+        print(f"  Arquivos: {stats.get('files', 0)} (cache: {stats.get('cached', 0)}, relidos: {stats.get('scanned', 0)})")
+        if errors:
+            print("\nErros:")
+            for e in errors:
+                print(" -", e)
+        if warns:
+            print("\nAvisos:")
+            for w in warns:
+                print(" -", w)
+        if not errors:
+            print("\nStatus geral: PASS (sem erros críticos)\n")
+        else:
+            print("\nStatus geral: FAIL (há erros)\n")
+            failed = True
+    return 1 if failed else 0
 
 if __name__ == "__main__":  # pragma: no cover
-    main()
+    sys.exit(main())